@@ -0,0 +1,15 @@
+# Sidebar sections in display order: (page script, title). Each page is its own
+# script and imports and computes only what it shows.
+SECTIONS = [
+    ("app_pages/overview.py", "Dashboard Overview"),
+    ("app_pages/population.py", "Population Comparison"),
+    ("app_pages/gdp.py", "GDP Analysis"),
+    ("app_pages/inflation_unemployment.py", "Inflation & Unemployment"),
+    ("app_pages/trade_investment.py", "Trade & Investment"),
+    ("app_pages/trump_effect.py", "Trump Effect"),
+    ("app_pages/government_finances.py", "Government Finances"),
+    ("app_pages/correlation_analysis.py", "Correlation Analysis"),
+    ("app_pages/macroeconomic_events.py", "Macroeconomic Events"),
+    ("app_pages/imf_analysis.py", "IMF Analysis"),
+    ("app_pages/references.py", "References"),
+]
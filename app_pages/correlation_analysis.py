@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from charts import create_correlation_heatmap, create_rolling_correlation_heatmap
+from correlations import CONFIDENCE, RESAMPLES, SIGNIFICANCE_LEVEL
+from data import calculate_correlations, calculate_significance, correlation_engine, figure_cache, load_panel
+
+panel = load_panel()
+
+# Correlation heatmap; in significance mode cells whose permutation p-value
+# is not below SIGNIFICANCE_LEVEL are greyed out and the intervals are listed
+# underneath. `key` tells apart views that may show the same country.
+def show_matrix(country, method, significance, cluster, key):
+    fig = create_correlation_heatmap(correlation_engine(panel), country, method, cluster, significance,
+                                     cache=figure_cache())
+    st.plotly_chart(fig, use_container_width=True, key=f'correlation-heatmap-{key}')
+
+    if significance:
+        corr = calculate_correlations(panel, country, method)
+        stats = calculate_significance(panel, country)
+        pairs = np.triu_indices(len(corr), k=1)
+        details = pd.DataFrame({
+            'Indicator': corr.index[pairs[0]],
+            'With': corr.columns[pairs[1]],
+            'r': corr.to_numpy()[pairs],
+            f'{CONFIDENCE:.0%} CI low': stats['low'].to_numpy()[pairs],
+            f'{CONFIDENCE:.0%} CI high': stats['high'].to_numpy()[pairs],
+            'p-value': stats['p'].to_numpy()[pairs],
+        }).sort_values('p-value')
+        with st.expander(f"{country}: intervals and p-values", key=f'correlation-details-{key}'):
+            st.dataframe(details.round(3), hide_index=True, use_container_width=True)
+
+# The section's widgets only rerun this fragment, not the page or the app around it
+@st.fragment
+def correlation_analysis():
+    st.markdown('## Correlation Analysis', unsafe_allow_html=True)
+    st.markdown("Analyze correlations between key macroeconomic indicators.")
+    method = st.radio("Correlation method", ["Pearson", "Spearman"], horizontal=True).lower()
+    significance = st.toggle(
+        "Significance mode",
+        help=f"Grey out cells whose permutation p-value is {SIGNIFICANCE_LEVEL} or more, and list {CONFIDENCE:.0%} "
+             f"bootstrap intervals ({RESAMPLES:,} resamples of the years). Uses Pearson correlations.")
+    if significance and method != 'pearson':
+        st.caption("Significance is computed for Pearson correlations; switch the method to Pearson to use it.")
+        significance = False
+    cluster = st.toggle("Cluster related indicators", help="Order indicators by hierarchical clustering on |r|")
+    # Correlation Heatmap for Denmark
+    st.markdown('### Denmark Correlation Matrix', unsafe_allow_html=True)
+    show_matrix('Denmark', method, significance, cluster, 'denmark')
+
+    # Denmark economic interpretation in styled markdown box
+    st.markdown("""
+    <div style="padding: 15px; border-radius: 5px; background-color: #f0f7ff; border-left: 5px solid #3366ff;">
+        <h4 style="color: #1a53ff; margin-top: 0;">Macroeconomic Insights - Denmark</h4>
+        <p><strong>GDP Growth & Trade Relations:</strong></p>
+        <ul>
+            <li>Denmark shows distinct correlations between GDP growth and trade components (exports/imports)</li>
+            <li>Observe how trade openness influences economic growth cycles</li>
+        </ul>
+        <p><strong>Fiscal Policy & Growth Dynamics:</strong></p>
+        <ul>
+            <li>Budget balance correlation with GDP reflects fiscal policy transmission effectiveness</li>
+            <li>Consider whether government spending appears countercyclical or reinforces existing cycles</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Correlation Heatmap for India
+    st.markdown('### India Correlation Matrix', unsafe_allow_html=True)
+    show_matrix('India', method, significance, cluster, 'india')
+
+    # India economic interpretation in styled markdown box
+    st.markdown("""
+    <div style="padding: 15px; border-radius: 5px; background-color: #f0f7ff; border-left: 5px solid #3366ff;">
+        <h4 style="color: #1a53ff; margin-top: 0;">Macroeconomic Insights - India</h4>
+        <p><strong>GDP Growth & Trade Relations:</strong></p>
+        <ul>
+            <li>Examine how export/import correlations with GDP showcase India's global trade integration</li>
+            <li>Note the implications of trade patterns on domestic economic performance</li>
+        </ul>
+        <p><strong>Fiscal Policy & Growth Dynamics:</strong></p>
+        <ul>
+            <li>Budget balance correlation reveals how government fiscal positions influence growth trajectory</li>
+            <li>Evaluate the relationship between public spending and economic development stages</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Any other country in the panel, read from the same precomputed matrices
+    st.markdown('### Country Explorer', unsafe_allow_html=True)
+    country = st.selectbox("Country", correlation_engine(panel).countries)
+    show_matrix(country, method, significance, cluster, 'explorer')
+
+    # Rolling-window mode: how relationships shift across regimes such as 2020-2022
+    st.markdown('### Rolling-Window Correlations', unsafe_allow_html=True)
+    st.markdown("Pearson correlations over a moving window of years. Drag the slider under the heatmap to move the window.")
+    window = st.slider("Window length (years)", min_value=3, max_value=len(panel.years), value=min(5, len(panel.years)))
+    fig = create_rolling_correlation_heatmap(correlation_engine(panel), country, window, cache=figure_cache())
+    st.plotly_chart(fig, use_container_width=True)
+
+
+correlation_analysis()
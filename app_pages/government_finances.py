@@ -0,0 +1,33 @@
+import streamlit as st
+
+from charts import create_comparative_line_chart
+from data import figure_cache, load_panel
+
+panel = load_panel()
+
+st.markdown('<div class="sub-header">Government Finances</div>', unsafe_allow_html=True)
+st.markdown("Examine government budget balances and debt levels for Denmark and India.")
+
+# Budget Balance Chart
+st.markdown('<div class="section-header">Budget Balance</div>', unsafe_allow_html=True)
+fig = create_comparative_line_chart(
+    panel,
+    'General government net lending/borrowing',
+    'Percent of GDP',
+    'Budget Balance Comparison (2014-2024)',
+    'Percent of GDP (%)',
+    cache=figure_cache()
+)
+st.plotly_chart(fig, use_container_width=True)
+
+# Government Debt Chart
+st.markdown('<div class="section-header">Government Debt</div>', unsafe_allow_html=True)
+fig = create_comparative_line_chart(
+    panel,
+    'General government gross debt',
+    'Percent of GDP',
+    'Government Debt Comparison (2014-2024)',
+    'Percent of GDP (%)',
+    cache=figure_cache()
+)
+st.plotly_chart(fig, use_container_width=True)
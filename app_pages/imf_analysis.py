@@ -0,0 +1,127 @@
+import pandas as pd
+import streamlit as st
+
+from charts import create_comparative_line_chart, create_revision_chart, create_vintage_lines_chart
+from data import WEO_VINTAGES_DIR, figure_cache, get_forecasts, load_panel, vintage_store
+
+st.markdown('<div class="sub-header">Comparative IMF Analysis: India vs Denmark</div>', unsafe_allow_html=True)
+
+st.markdown("""
+<div class="insight-box">
+    <h4>1. Economic Growth</h4>
+    <p><em>India:</em> 7.2% GDP growth in 2022-23; projected 6.3%. Driven by domestic demand and service exports.</p>
+    <p><em>Denmark:</em> 2.5% GDP growth in 2023; projected 1.9% in 2024. Driven by pharmaceutical exports.</p>
+</div>
+""", unsafe_allow_html=True)
+
+st.markdown("""
+<div class="insight-box">
+    <h4>2. Fiscal Policy & Public Debt</h4>
+    <p><em>India:</em> Elevated public debt. IMF urges medium-term fiscal consolidation and improved revenue mobilization.</p>
+    <p><em>Denmark:</em> Fiscal surplus (3.3% of GDP); low debt (29.7% of GDP). Small fiscal easing advised for health, climate, and defense spending.</p>
+</div>
+""", unsafe_allow_html=True)
+
+st.markdown("""
+<div class="insight-box">
+    <h4>3. Inflation & Monetary Policy</h4>
+    <p><em>India:</em> Inflation management is key; RBI maintains a neutral, data-driven policy stance.</p>
+    <p><em>Denmark:</em> Inflation near 2%; expected to stay stable. Wages may cause temporary uptick.</p>
+</div>
+""", unsafe_allow_html=True)
+
+st.markdown("""
+<div class="insight-box">
+    <h4>4. Financial Sector Stability</h4>
+    <p><em>India:</em> Stable banking sector; strong credit growth. IMF warns of rising unsecured personal loans.</p>
+    <p><em>Denmark:</em> Financial system sound, but risks in commercial real estate and high interest rates.</p>
+</div>
+""", unsafe_allow_html=True)
+
+st.markdown("""
+<div class="insight-box">
+    <h4>5. Structural Reforms</h4>
+    <p><em>India:</em> Focus on labor reforms, female participation, education, and agriculture to boost inclusive growth.</p>
+    <p><em>Denmark:</em> Needs reforms in innovation, digitalization, green transition, and aging workforce issues.</p>
+</div>
+""", unsafe_allow_html=True)
+
+st.markdown("""
+<div class="insight-box">
+    <h4>6. External Sector & Trade</h4>
+    <p><em>India:</em> Encouraged to reduce trade restrictions and improve FDI policies.</p>
+    <p><em>Denmark:</em> Strong in pharma and shipping. Advised to support multilateral trade systems.</p>
+</div>
+""", unsafe_allow_html=True)
+
+st.markdown("""
+<div class="insight-box">
+    <h4>7. Long-term Challenges</h4>
+    <p><em>India:</em> High debt, employment generation, and structural inefficiencies.</p>
+    <p><em>Denmark:</em> Aging population, slow productivity, and real estate risks.</p>
+</div>
+""", unsafe_allow_html=True)
+
+
+# Projections from simple models fitted to the panel, next to the IMF's own
+@st.fragment
+def model_projections():
+    st.markdown('### Model Projections')
+    st.markdown("Five-year projections from models fitted to each series' latest run of observations, "
+                "with 95% bands. They are statistical extrapolations, not IMF forecasts.")
+    panel = load_panel()
+    indicators = [('GDP Growth', 'Gross domestic product, constant prices', 'Percent change'),
+                  ('Inflation', 'Inflation, average consumer prices', 'Percent change'),
+                  ('Unemployment', 'Unemployment rate', 'Percent of total labor force'),
+                  ('Budget Balance', 'General government net lending/borrowing', 'Percent of GDP'),
+                  ('Population', 'Population', 'Persons')]
+    label, indicator, units = st.selectbox("Indicator", indicators, format_func=lambda option: option[0],
+                                           key='projection_indicator')
+    models = {'ar': 'AR(2)', 'smoothing': 'Exponential smoothing'}
+    method = st.radio("Model", list(models), horizontal=True, format_func=models.get)
+
+    forecasts = get_forecasts(panel, indicator, units, method=method)
+    fig = create_comparative_line_chart(panel, indicator, units, title=f'{label}: {models[method]} projection',
+                                        forecasts=forecasts, cache=figure_cache())
+    st.plotly_chart(fig, use_container_width=True)
+
+    rows = {country: {'Year': int(years[0]), 'Projection': mean[0], 'Lower': lower[0], 'Upper': upper[0]}
+            for country, (years, mean, lower, upper) in forecasts.items()}
+    if rows:
+        st.dataframe(pd.DataFrame.from_dict(rows, orient='index'), use_container_width=True)
+
+
+model_projections()
+
+
+# How the IMF's estimates moved between WEO releases
+@st.fragment
+def forecast_revisions():
+    st.markdown('### Forecast Revisions Across WEO Vintages')
+    store = vintage_store(load_panel())
+    if len(store.names) < 2:
+        st.info("Only one WEO vintage is loaded. Set WEO_VINTAGES_DIR to a folder of WEO exports from successive "
+                "releases (e.g. WEOApr2024all.xls, WEOOct2024all.xls) to compare their estimates."
+                if not WEO_VINTAGES_DIR else f"Only one WEO export was found in {WEO_VINTAGES_DIR}.")
+
+    indicators = list(dict.fromkeys(store.indicators('India') + store.indicators('Denmark')))
+    growth = ('Gross domestic product, constant prices', 'Percent change')
+    indicator, units = st.selectbox("Indicator", indicators, key='revision_indicator', index=indicators.index(growth) if growth in indicators else 0,
+                                    format_func=lambda pair: f'{pair[0]} ({pair[1]})')
+    years = store.years.tolist()
+    year = st.select_slider("Estimate for year", options=years, value=2024 if 2024 in years else years[-1])
+
+    fig = create_revision_chart(store, indicator, units, year, cache=figure_cache())
+    st.plotly_chart(fig, use_container_width=True)
+
+    estimates = {country: store.revisions(country, indicator, units, year) for country in ('India', 'Denmark')}
+    st.dataframe(pd.DataFrame(estimates).assign(**{
+        f'{country} revision': series.diff() for country, series in estimates.items()
+    }), use_container_width=True)
+
+    country = st.radio("Full series by vintage", ['India', 'Denmark'], horizontal=True)
+    fig = create_vintage_lines_chart(store, country, indicator, units, cache=figure_cache())
+    st.plotly_chart(fig, use_container_width=True)
+
+
+forecast_revisions()
@@ -0,0 +1,78 @@
+import streamlit as st
+
+from charts import create_comparative_line_chart
+from data import figure_cache, load_panel
+
+panel = load_panel()
+
+st.markdown('<div class="sub-header">Inflation & Unemployment</div>', unsafe_allow_html=True)
+st.markdown("Explore inflation and unemployment trends for Denmark and India.")
+
+# Inflation Chart
+st.markdown('<div class="section-header">Inflation Trends</div>', unsafe_allow_html=True)
+fig = create_comparative_line_chart(
+    panel,
+    'Inflation, average consumer prices',
+    'Percent change',
+    'Inflation Rate Comparison (2014-2024)',
+    'Annual Percent Change (%)',
+    cache=figure_cache()
+)
+st.plotly_chart(fig, use_container_width=True)
+
+# Inflation insights using direct markdown instead of function
+st.markdown("""
+<div class="insight-box">
+    <h4>Inflation Insights</h4>
+    <p>Denmark experienced a dramatic inflation spike in 2022 (8.53%), nearly 4x higher than India's historical average.
+    India has maintained more consistent inflation (4-6% range) compared to Denmark's volatile pattern.
+    Both countries showed inflationary pressures during the post-pandemic recovery period (2021-2022).
+    Denmark's inflation has been declining since 2022, returning to more historical norms by 2024.</p>
+</div>
+""", unsafe_allow_html=True)
+
+# GDP Deflator Chart
+st.markdown('<div class="section-header">GDP Deflator Trends</div>', unsafe_allow_html=True)
+fig = create_comparative_line_chart(
+    panel,
+    'Gross domestic product, deflator',
+    'Index',
+    'GDP Deflator Comparison (2014-2024)',
+    'Index Value',
+    cache=figure_cache()
+)
+st.plotly_chart(fig, use_container_width=True)
+
+# GDP Deflator insights using direct markdown
+st.markdown("""
+<div class="insight-box">
+    <h4>GDP Deflator Insights</h4>
+    <p>India's GDP deflator has shown a steady upward trend, increasing by approximately 47% from 2014 to 2024.
+    Denmark's GDP deflator remained relatively stable until 2020, then spiked in 2022 before moderating.
+    The 2022 spike in Denmark's deflator (112.12) aligns with its high inflation period.
+    The difference in base levels reflects different economic structures and price evolution patterns between the two economies.</p>
+</div>
+""", unsafe_allow_html=True)
+
+# Unemployment Chart
+st.markdown('<div class="section-header">Unemployment Trends</div>', unsafe_allow_html=True)
+fig = create_comparative_line_chart(
+    panel,
+    'Unemployment rate',
+    'Percent of total labor force',
+    'Unemployment Rate Comparison (2014-2024)',
+    'Percent of Labor Force (%)',
+    cache=figure_cache()
+)
+st.plotly_chart(fig, use_container_width=True)
+
+# Unemployment insights using direct markdown
+st.markdown("""
+<div class="insight-box">
+    <h4>Unemployment Insights</h4>
+    <p>Denmark maintains lower unemployment rates than India, reflecting differences in labor market structures.
+    Both countries experienced temporary unemployment increases during the pandemic period (2020-2021).
+    India's unemployment shows greater volatility, suggesting more sensitivity to economic cycles.
+    Denmark's strong social safety net may contribute to its more stable unemployment figures.</p>
+</div>
+""", unsafe_allow_html=True)
@@ -0,0 +1,67 @@
+import streamlit as st
+
+from economic_events import economic_events
+
+st.markdown('<div class="sub-header">Macroeconomic Events</div>', unsafe_allow_html=True)
+st.markdown("### Economic Timeline: 2014-2024")
+
+# Add custom CSS for timeline styling
+st.markdown("""
+<style>
+.timeline-container {
+    margin: 20px 0;
+    position: relative;
+    width: 100%;
+}
+.timeline-card {
+    padding: 15px;
+    border-radius: 8px;
+    margin-bottom: 15px;
+    position: relative;
+    box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+}
+.timeline-year {
+    font-weight: bold;
+    font-size: 18px;
+    margin-bottom: 10px;
+    color: #1E3A8A;
+}
+.event-global {
+    background-color: #EFF6FF;
+    border-left: 4px solid #3B82F6;
+}
+.event-india {
+    background-color: #FFEDD5;
+    border-left: 4px solid #F97316;
+}
+.event-denmark {
+    background-color: #F0FDF4;
+    border-left: 4px solid #10B981;
+}
+.event-title {
+    font-weight: bold;
+    color: #4B5563;
+}
+</style>
+""", unsafe_allow_html=True)
+
+
+
+# Create color map for regions
+color_map = {"Global": "#3B82F6", "India": "#F97316", "Denmark": "#10B981"}
+
+
+
+# Add a time slider for filtering events by year range
+
+filtered_events = economic_events
+for year in sorted(filtered_events.keys()):
+    with st.expander(f"**{year}**", expanded=True):
+        for region, event in filtered_events[year].items():
+            region_class = f"event-{region.lower()}"
+            st.markdown(f"""
+            <div class="timeline-card {region_class}">
+                <div class="event-title">{region}</div>
+                {event}
+            </div>
+            """, unsafe_allow_html=True)
@@ -0,0 +1,91 @@
+import streamlit as st
+
+from charts import create_comparative_line_chart
+from data import figure_cache, latest_snapshot, load_panel
+
+panel = load_panel()
+
+st.markdown('<div class="sub-header">Macroeconomic Dashboard Overview</div>', unsafe_allow_html=True)
+
+# Snapshot cards: (label, subject, units, format), read from the latest-value table
+SNAPSHOT_METRICS = [
+    ("GDP Growth", 'Gross domestic product, constant prices', 'Percent change', "{:.1f}%"),
+    ("Inflation", 'Inflation, average consumer prices', 'Percent change', "{:.1f}%"),
+    ("Unemployment Rate", 'Unemployment rate', 'Percent of total labor force', "{:.1f}%"),
+    ("Budget Balance", 'General government net lending/borrowing', 'Percent of GDP', "{:+.1f}% of GDP"),
+]
+
+SNAPSHOT_INSIGHTS = {
+    'Denmark': 'Denmark has maintained stable economic growth with relatively low inflation and unemployment, along with a budget surplus. As a developed economy, growth rates are moderate but sustainable.',
+    'India': 'India maintains robust growth as an emerging economy with moderately high inflation. Despite fiscal deficits, Indias economic momentum remains strong, driven by domestic consumption and services sector growth.',
+}
+
+snapshot = latest_snapshot(panel)
+
+for col, country in zip(st.columns(2), SNAPSHOT_INSIGHTS):
+    with col:
+        st.markdown(f'<div class="section-header">{country} Snapshot (2024)</div>', unsafe_allow_html=True)
+
+        # Create metrics
+        for label, subject, units, fmt in SNAPSHOT_METRICS:
+            st.metric(label, fmt.format(snapshot.loc[(country, subject, units), 'Value']))
+
+        # Add key insight
+        st.markdown(f'<div class="insight-box">{SNAPSHOT_INSIGHTS[country]}</div>', unsafe_allow_html=True)
+
+# Key comparative charts
+st.markdown('<div class="section-header">Key Comparative Indicators (2014-2024)</div>', unsafe_allow_html=True)
+
+tab1, tab2, tab3, tab4 = st.tabs(["GDP Growth", "Inflation", "Unemployment", "Budget Balance"])
+
+with tab1:
+    fig = create_comparative_line_chart(
+        panel, 
+        'Gross domestic product, constant prices', 
+        'Percent change',
+        'GDP Growth Rate Comparison (2014-2024)',
+        'Annual Percent Change (%)',
+        cache=figure_cache()
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown('<div class="insight-box">India consistently shows higher GDP growth rates compared to Denmark, reflecting the difference between a rapidly developing economy and a mature developed economy. Note the significant impact of COVID-19 in 2020 on both economies, with a stronger recovery bounce in India during 2021.</div>', unsafe_allow_html=True)
+
+with tab2:
+    fig = create_comparative_line_chart(
+        panel, 
+        'Inflation, average consumer prices', 
+        'Percent change',
+        'Inflation Rate Comparison (2014-2024)',
+        'Annual Percent Change (%)',
+        cache=figure_cache()
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown('<div class="insight-box">India historically maintains higher inflation rates than Denmark. While Denmark experienced significant inflation spikes in 2022 due to energy crises and supply chain disruptions, Indias inflation has been more consistent but structurally higher, reflecting different monetary policy priorities and economic structures.</div>', unsafe_allow_html=True)
+
+with tab3:
+    fig = create_comparative_line_chart(
+        panel, 
+        'Unemployment rate', 
+        'Percent of total labor force',
+        'Unemployment Rate Comparison (2014-2024)',
+        'Percent of Labor Force (%)',
+        cache=figure_cache()
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown('<div class="insight-box">Denmark shows a generally declining unemployment trend over the decade with a temporary COVID-related spike. Indias unemployment rose significantly during the pandemic and has taken longer to recover, reflecting differences in labor market flexibility and social safety net structures.</div>', unsafe_allow_html=True)
+
+with tab4:
+    fig = create_comparative_line_chart(
+        panel, 
+        'General government net lending/borrowing', 
+        'Percent of GDP',
+        'Budget Balance Comparison (2014-2024)',
+        'Percent of GDP (%)',
+        cache=figure_cache()
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown('<div class="insight-box">Denmark has maintained budget surpluses for much of the period, temporarily disrupted by COVID-19 spending needs. In contrast, India consistently runs significant budget deficits, reflecting different fiscal policy approaches and developmental needs.</div>', unsafe_allow_html=True)
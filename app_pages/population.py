@@ -0,0 +1,183 @@
+import streamlit as st
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from data import figure_cache, indicator_table, load_panel
+from figure_cache import cached_chart
+
+st.markdown('<div class="sub-header">Population Comparison: Denmark vs India</div>', unsafe_allow_html=True)
+st.markdown("This section provides a comparative analysis of population trends and demographics for Denmark and India.")
+
+# Population in millions, read from the panel
+population = indicator_table(load_panel(), 'Population', 'Persons')
+years = population['Year'].tolist()
+denmark_population = population['Denmark'].tolist()
+india_population = population['India'].tolist()
+
+# Create the population trend chart
+fig = go.Figure()
+
+# Add Denmark population trace
+fig.add_trace(go.Scatter(
+    x=years,
+    y=denmark_population,
+    mode='lines+markers',
+    name='Denmark',
+    line=dict(color='#3B82F6', width=3),
+    marker=dict(size=8)
+))
+
+# Create a secondary y-axis for India's population (since it's much larger)
+fig.add_trace(go.Scatter(
+    x=years,
+    y=india_population,
+    mode='lines+markers',
+    name='India',
+    line=dict(color='#EF4444', width=3),
+    marker=dict(size=8),
+    yaxis="y2"
+))
+
+# Update layout with two y-axes
+fig.update_layout(
+    title="Population Trends: Denmark vs India (2014-2024)",
+    xaxis_title="Year",
+    yaxis_title="Denmark Population (millions)",
+    yaxis2=dict(
+        title="India Population (millions)",
+        overlaying="y",
+        side="right",
+        showgrid=False
+    ),
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=1.02,
+        xanchor="right",
+        x=1
+    ),
+    template="plotly_white",
+    height=500
+)
+
+st.plotly_chart(fig, use_container_width=True)
+
+# Add a bar chart comparing population density
+st.markdown('<div class="section-header">Population Density Comparison</div>', unsafe_allow_html=True)
+
+# Sample data for population density (people per sq km)
+countries = ['Denmark', 'India']
+density = [137, 464]  # People per sq km (2024 estimates)
+
+density_fig = go.Figure(go.Bar(
+    x=countries,
+    y=density,
+    text=density,
+    textposition='auto',
+    marker_color=['#3B82F6', '#EF4444']
+))
+
+density_fig.update_layout(
+    title="Population Density (People per sq km, 2024)",
+    xaxis_title="Country",
+    yaxis_title="Density (people per sq km)",
+    template="plotly_white",
+    height=400
+)
+
+st.plotly_chart(density_fig, use_container_width=True)
+
+# Add population pyramids (simplified version)
+st.markdown('<div class="section-header">Age Distribution Comparison</div>', unsafe_allow_html=True)
+
+col1, col2 = st.columns(2)
+
+with col1:
+    # Sample data for Denmark age distribution (2024 estimate, in percentages)
+    dk_age_groups = ['0-14', '15-24', '25-54', '55-64', '65+']
+    dk_age_distribution = [16.5, 12.3, 38.4, 12.8, 20.0]
+
+    dk_age_fig = go.Figure()
+    dk_age_fig.add_trace(go.Bar(
+        y=dk_age_groups,
+        x=dk_age_distribution,
+        orientation='h',
+        marker_color='#3B82F6',
+        name='Denmark'
+    ))
+
+    dk_age_fig.update_layout(
+        title="Denmark: Age Distribution (%)",
+        xaxis_title="Percentage of Population",
+        template="plotly_white",
+        height=300
+    )
+
+    st.plotly_chart(dk_age_fig, use_container_width=True)
+
+with col2:
+    # Sample data for India age distribution (2024 estimate, in percentages)
+    in_age_groups = ['0-14', '15-24', '25-54', '55-64', '65+']
+    in_age_distribution = [26.0, 17.2, 41.1, 8.2, 7.5]
+
+    in_age_fig = go.Figure()
+    in_age_fig.add_trace(go.Bar(
+        y=in_age_groups,
+        x=in_age_distribution,
+        orientation='h',
+        marker_color='#EF4444',
+        name='India'
+    ))
+
+    in_age_fig.update_layout(
+        title="India: Age Distribution (%)",
+        xaxis_title="Percentage of Population",
+        template="plotly_white",
+        height=300
+    )
+
+    st.plotly_chart(in_age_fig, use_container_width=True)
+
+# Add insights
+st.markdown('<div class="insight-box">Denmark has a much smaller but older population compared to India. While India\'s population continues to grow at a moderate pace, Denmark\'s population growth is minimal. India\'s significantly higher population density presents different challenges in urban planning, infrastructure development, and resource allocation compared to Denmark.</div>', unsafe_allow_html=True)
+
+# Add a visualization comparing urban vs rural population
+st.markdown('<div class="section-header">Urban vs Rural Population</div>', unsafe_allow_html=True)
+
+# Sample data for urban vs rural (2024 estimate, in percentages)
+labels = ['Urban', 'Rural']
+dk_urban_rural = [88, 12]  # Denmark
+in_urban_rural = [35, 65]  # India
+
+# Served from the shared figure cache while the shares are unchanged
+@cached_chart('urban_rural_pies')
+def urban_rural_pies(labels, denmark_shares, india_shares):
+    # Use subplots for comparison
+    urban_fig = make_subplots(rows=1, cols=2, specs=[[{'type':'domain'}, {'type':'domain'}]],
+                                subplot_titles=['Denmark', 'India'])
+
+    urban_fig.add_trace(go.Pie(
+        labels=labels,
+        values=denmark_shares,
+        name='Denmark',
+        marker_colors=['#3B82F6', '#93C5FD']
+    ), 1, 1)
+
+    urban_fig.add_trace(go.Pie(
+        labels=labels,
+        values=india_shares,
+        name='India',
+        marker_colors=['#EF4444', '#FCA5A5']
+    ), 1, 2)
+
+    urban_fig.update_layout(
+        title_text="Urban vs Rural Population Distribution (%)",
+        height=400
+    )
+    return urban_fig
+
+
+urban_fig = urban_rural_pies(labels, dk_urban_rural, in_urban_rural, cache=figure_cache())
+st.plotly_chart(urban_fig, use_container_width=True)
+
+st.markdown('<div class="insight-box">The urbanization patterns reveal stark differences between Denmark and India. Denmark is heavily urbanized with 88% of its population living in urban areas, reflecting its status as a developed economy. In contrast, India remains predominantly rural with only about 35% urban population, though this ratio has been steadily increasing due to ongoing urbanization trends.</div>', unsafe_allow_html=True)
@@ -0,0 +1,15 @@
+import streamlit as st
+
+st.markdown('<div class="sub-header">References</div>', unsafe_allow_html=True)
+
+st.markdown("""
+<ul>
+    <li><a href="https://www.census.gov/foreign-trade/balance/c5330.html" target="_blank">US Trade Data</a></li>
+    <li><a href="https://www.imf.org/en/Publications/CR/Issues/2023/12/18/India-2023-Article-IV-Consultation-Press-Release-Staff-Report-and-Statement-by-the-542605" target="_blank">IMF India 2023 Article IV Consultation</a></li>
+    <li><a href="https://www.imf.org/en/Publications/CR/Issues/2024/09/12/Denmark-2024-Article-IV-Consultation-Press-Release-Staff-Report-and-Statement-by-the-554777" target="_blank">IMF Denmark 2024 Article IV Consultation</a></li>
+    <li><a href="https://www.investopedia.com/significant-financial-events-8700894" target="_blank">Significant Financial Events – Investopedia</a></li>
+    <li><a href="https://www.imf.org/en/Publications/WEO/weo-database/2024/October" target="_blank">IMF WEO Database – October 2024</a></li>
+    <li><a href="https://www.business-standard.com/topic/statsguru" target="_blank">Trump Effect Data – Business Standard (Statsguru), Department of Commerce</a></li>
+    <li><a href="https://www.forbesindia.com/article/explainers/unemployment-rate-in-india/87441/1" target="_blank">India Unemployment Data – Forbes India</a></li>
+</ul>
+""", unsafe_allow_html=True)
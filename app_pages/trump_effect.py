@@ -0,0 +1,434 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from data import figure_cache, get_export_categories, indicator_table, load_panel, load_trade, tariff_simulator
+from figure_cache import cached_chart
+from tables import paged_table
+
+st.markdown('<div class="sub-header">Trump Trade Policies & Global Impact</div>', unsafe_allow_html=True)
+
+# Trump quote with stylized display
+st.markdown("""
+<div class="trump-quote">
+    <img src="https://upload.wikimedia.org/wikipedia/commons/5/56/Donald_Trump_official_portrait.jpg" style="width:75px; border-radius:50%; float:left; margin-right:15px;">
+    <div class="quote-text" style="font-size: 35px; font-weight: bold; line-height: 1.6;">
+        <p><i>"They (global leaders) are dying to make a deal. I said, we are not going to have deficits with your country. We're going to have surpluses or, at worst, going to be breaking even."</i></p>
+    </div>
+    <p class="quote-attribution" style="font-size: 18px;  text-align: right;">- President Donald Trump</p>
+    <div style="clear:both;"></div>
+</div>
+""", unsafe_allow_html=True)
+
+st.markdown("### Impact Analysis: Denmark vs. India")
+
+# Tabs for different analysis views
+tab1, tab2, tab3, tab4 = st.tabs(["Trade Balance", "Tariff Vulnerability", "Export Categories", "Economic Resilience"])
+with tab1:
+    st.markdown("#### US Trade Balance Comparison")
+
+    # U.S. goods trade balance (exports - imports, US$ billions), derived from the
+    # U.S. Census Bureau trade series in the panel
+    trade_data = indicator_table(load_panel(), 'U.S. goods trade balance', 'U.S. dollars')
+    trade_data = trade_data.rename(columns={'Denmark': 'Denmark_Balance', 'India': 'India_Balance'})
+
+    # Create the plot, served from the shared figure cache while the data is unchanged
+    @cached_chart('us_trade_balance')
+    def trade_balance_chart(years, india_balance, denmark_balance):
+        fig = go.Figure()
+        # Span of the trade data, whatever years the trade files cover
+        if len(years):
+            first, last = int(years.min()), int(years.max())
+            span = f' ({first}-{last})' if first < last else f' ({first})'
+        else:
+            first = last = 2025
+            span = ''
+
+        # Add India's trade balance
+        fig.add_trace(go.Scatter(
+            x=years,
+            y=india_balance,
+            mode='lines+markers',
+            name='India Trade Balance',
+            line=dict(color='#ff7043', width=3),
+            marker=dict(size=10)
+        ))
+
+        # Add Denmark's trade balance
+        fig.add_trace(go.Scatter(
+            x=years,
+            y=denmark_balance,
+            mode='lines+markers',
+            name='Denmark Trade Balance',
+            line=dict(color='#5c6bc0', width=3),
+            marker=dict(size=10)
+        ))
+
+        # Add a reference line at y=0
+        fig.add_shape(
+            type="line",
+            x0=first,
+            y0=0,
+            x1=last,
+            y1=0,
+            line=dict(color="gray", width=1, dash="dash"),
+        )
+
+        # Add a vertical line for Trump's second term
+        fig.add_shape(
+            type="line",
+            x0=2025,
+            y0=-10,
+            x1=2025,
+            y1=10,
+            line=dict(color="red", width=2, dash="dot"),
+        )
+
+        # Customize layout
+        fig.update_layout(
+            title=f'US Trade Balance with India vs Denmark{span}',
+            xaxis_title='Year',
+            yaxis_title='Trade Balance (US$ Billions)',
+            hovermode='x unified',
+            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5),
+            annotations=[
+                dict(
+                    x=2025,
+                    y=10,
+                    xref="x",
+                    yref="y",
+                    text="Trump's Second Term",
+                    showarrow=True,
+                    arrowhead=2,
+                    ax=0,
+                    ay=-40
+                )
+            ]
+        )
+        return fig
+
+    fig = trade_balance_chart(trade_data['Year'].to_numpy(), trade_data['India_Balance'].to_numpy(),
+                              trade_data['Denmark_Balance'].to_numpy(), cache=figure_cache())
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Key metrics: the latest year each country reports, and the change from the year before
+    def balance_metric(country, column, **kwargs):
+        balances = trade_data[['Year', column]].dropna()
+        if balances.empty:
+            st.metric(label=f"{country}'s Trade Balance", value="n/a")
+            return
+        delta = None
+        if len(balances) >= 2:
+            delta = f"{balances[column].iloc[-1] - balances[column].iloc[-2]:.1f}B"
+        st.metric(
+            label=f"{country}'s Trade Balance ({balances['Year'].iloc[-1]})",
+            value=f"${balances[column].iloc[-1]:.1f}B",
+            delta=delta,
+            **kwargs
+        )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        balance_metric('India', 'India_Balance')
+
+    with col2:
+        balance_metric('Denmark', 'Denmark_Balance', delta_color="inverse")
+
+
+with tab2:
+    st.markdown("#### Tariff Vulnerability by Sector")
+
+    # Create mock data for tariff vulnerability
+    sectors = ['Pharmaceuticals', 'Machinery & Equipment', 'Textiles', 'Automotive Components', 'Renewable Energy']
+    india_values = [1.5, 6.2, 8.3, 7.9, 4.5]
+    denmark_values = [5.8, 8.3, 2.1, 5.5, 9.2]
+
+    # Create a dataframe
+    tariff_data = pd.DataFrame({
+        'Sector': sectors,
+        'India': india_values,
+        'Denmark': denmark_values
+    })
+
+    # Create a radar chart, served from the shared figure cache while the data is unchanged
+    @cached_chart('tariff_vulnerability_radar')
+    def vulnerability_radar(sectors, india_values, denmark_values):
+        fig = go.Figure()
+
+        # Add India's data
+        fig.add_trace(go.Scatterpolar(
+            r=india_values + [india_values[0]],
+            theta=sectors + [sectors[0]],
+            fill='toself',
+            name='India',
+            line_color='#ff7043',
+            fillcolor='rgba(255, 112, 67, 0.3)'
+        ))
+
+        # Add Denmark's data
+        fig.add_trace(go.Scatterpolar(
+            r=denmark_values + [denmark_values[0]],
+            theta=sectors + [sectors[0]],
+            fill='toself',
+            name='Denmark',
+            line_color='#5c6bc0',
+            fillcolor='rgba(92, 107, 192, 0.3)'
+        ))
+
+        # Update the layout
+        fig.update_layout(
+            polar=dict(
+                radialaxis=dict(
+                    visible=True,
+                    range=[0, 10]
+                )
+            ),
+            title='Tariff Vulnerability by Sector (Scale: 1-10)',
+            showlegend=True
+        )
+        return fig
+
+    fig = vulnerability_radar(sectors, india_values, denmark_values, cache=figure_cache())
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Add an impact analysis table
+    st.markdown("##### Impact Severity Assessment")
+
+    # Colour-coded by severity bucket; searchable, sortable and paged so the
+    # table stays responsive at product-level detail
+    paged_table(tariff_data, 'tariff_table', 'Sector', ['India', 'Denmark'])
+
+    st.markdown("""
+    <div class="info-box">
+        <strong>Impact Scale:</strong>
+        <span style="color: #1b5e20">▣ Low (1-3)</span> | 
+        <span style="color: #f57f17">▣ Medium (4-6)</span> | 
+        <span style="color: #b71c1c">▣ High (7-10)</span>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # What-if tariffs, estimated from each country's exports to the US by sector
+    st.markdown("##### Tariff Scenario Simulator")
+    st.markdown("Set a US tariff rate for each sector to estimate how each country's exports to the US, and the US "
+                "trade balance with it, would change. Sliders start at the currently applied rates.")
+
+    # Not served from the figure cache: slider values rarely repeat, so every
+    # figure would be a one-off entry evicting the reusable ones
+    def tariff_scenario_chart(sectors, countries, change):
+        colors = {'India': '#ff7043', 'Denmark': '#5c6bc0'}
+        fig = go.Figure()
+        for country, values in zip(countries, change):
+            fig.add_trace(go.Bar(
+                y=sectors,
+                x=values,
+                name=country,
+                orientation='h',
+                marker=dict(color=colors.get(country))
+            ))
+        fig.update_layout(
+            title='Estimated Change in Exports to the US by Sector',
+            xaxis_title='Change (US$ Billions)',
+            yaxis_title='',
+            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5),
+            barmode='group'
+        )
+        return fig
+
+    # Moving a slider reruns only this fragment: one array expression over
+    # countries x sectors and the chart
+    @st.fragment
+    def tariff_scenario():
+        simulator = tariff_simulator(load_trade())
+        columns = st.columns(len(simulator.sectors))
+        rates = [column.slider(f"{sector} (%)", 0.0, 100.0, float(baseline), step=0.5, key=f'tariff_rate_{i}')
+                 for i, (column, sector, baseline) in enumerate(zip(columns, simulator.sectors, simulator.baseline))]
+        change = simulator.simulate(rates)
+
+        columns = st.columns(2 * len(simulator.countries))
+        for i, (country, result) in enumerate(simulator.summary(change).items()):
+            columns[2 * i].metric(f"{country}: exports to US", f"{result['exports']:+.2f} bn",
+                                  f"{result['percent']:+.1f}%")
+            columns[2 * i + 1].metric(f"US trade balance with {country}", f"{result['us_balance']:+.2f} bn")
+
+        fig = tariff_scenario_chart(simulator.sectors, simulator.countries, change)
+        st.plotly_chart(fig, use_container_width=True, key='tariff-scenario')
+
+    tariff_scenario()
+
+with tab3:
+    st.markdown("#### Export Category Breakdown")
+
+    # Shares of each country's exports to the US by HS chapter, from the trade aggregate
+    india_df = get_export_categories('India')
+    denmark_df = get_export_categories('Denmark')
+
+    # Create two columns
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("##### India's Top Export Categories to US")
+        fig = px.bar(
+            india_df,
+            y='Category',
+            x='Percentage',
+            orientation='h',
+            color='Percentage',
+            color_continuous_scale='Oranges',
+            title="% of India's exports to US"
+        )
+        fig.update_layout(
+            height=400,
+            xaxis_title='Percentage (%)',
+            yaxis_title='',
+            coloraxis_showscale=False
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        st.markdown("##### Denmark's Top Export Categories to US")
+        fig = px.bar(
+            denmark_df,
+            y='Category',
+            x='Percentage',
+            orientation='h',
+            color='Percentage',
+            color_continuous_scale='Blues',
+            title="% of Denmark's exports to US"
+        )
+        fig.update_layout(
+            height=400,
+            xaxis_title='Percentage (%)',
+            yaxis_title='',
+            coloraxis_showscale=False
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    # Add explanation text
+    def leaders(df, k):
+        return ' and '.join(f"{category.lower()} ({share:.1f}%)"
+                            for category, share in zip(df['Category'][:k], df['Percentage'][:k]))
+
+    st.markdown(f"""
+    <div class="analysis-box">
+        <h4>Key Insights:</h4>
+        <ul>
+            <li>Denmark's exports are concentrated in fewer categories: its top five make up {denmark_df['Percentage'].sum():.1f}% of exports, led by {leaders(denmark_df, 1)}</li>
+            <li>India shows more diversification, with {india_df['Percentage'].sum():.1f}% in its top five and {leaders(india_df, 2)} leading</li>
+            <li>Denmark's concentration in specific sectors makes it more vulnerable to targeted tariffs</li>
+            <li>India's broader export base provides more resilience to sector-specific tariffs</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+with tab4:
+    st.markdown("#### Economic Resilience Comparison")
+
+    # Create mock data for economic resilience
+    resilience_data = pd.DataFrame({
+        'Factor': ['GDP Size', 'Export Diversification', 'Domestic Market Size', 'Industrial Policy Flexibility', 'Currency Flexibility'],
+        'India': [8, 7, 9, 7, 6],
+        'Denmark': [2, 6, 2, 4, 3]
+    })
+
+    # Create a horizontal bar chart
+    fig = go.Figure()
+
+    # Add India's data
+    fig.add_trace(go.Bar(
+        y=resilience_data['Factor'],
+        x=resilience_data['India'],
+        name='India',
+        orientation='h',
+        marker=dict(color='#ff7043')
+    ))
+
+    # Add Denmark's data
+    fig.add_trace(go.Bar(
+        y=resilience_data['Factor'],
+        x=resilience_data['Denmark'],
+        name='Denmark',
+        orientation='h',
+        marker=dict(color='#5c6bc0')
+    ))
+
+    # Update the layout
+    fig.update_layout(
+        title='Economic Resilience Factors (Scale: 1-10)',
+        xaxis_title='Score',
+        yaxis_title='',
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5),
+        barmode='group'
+    )
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Add overall resilience score
+    col1, col2 = st.columns(2)
+
+    with col1:
+        india_score = resilience_data['India'].mean()
+        st.markdown(f"""
+        <div class="score-box" style="background-color: rgba(255, 112, 67, 0.1); border-left: 4px solid #ff7043; padding: 15px;">
+            <h3 style="margin:0; color: #ff7043;">India</h3>
+            <div style="font-size: 40px; font-weight: bold;">{india_score:.1f}/10</div>
+            <p>High resilience to trade shocks</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        denmark_score = resilience_data['Denmark'].mean()
+        st.markdown(f"""
+        <div class="score-box" style="background-color: rgba(92, 107, 192, 0.1); border-left: 4px solid #5c6bc0; padding: 15px;">
+            <h3 style="margin:0; color: #5c6bc0;">Denmark</h3>
+            <div style="font-size: 40px; font-weight: bold;">{denmark_score:.1f}/10</div>
+            <p>Lower resilience to trade shocks</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Add analysis text
+    st.markdown("""
+    <div class="analysis-box">
+        <h4>Analysis:</h4>
+        <p>India's larger economy, diverse industrial base, and massive domestic market provide significant buffering against external trade shocks. In contrast, Denmark's smaller, open economy with specialized export sectors makes it more vulnerable to targeted trade policies.</p>
+        <p>The resilience gap is most pronounced in domestic market size (India: 9 vs Denmark: 2) and GDP size (India: 8 vs Denmark: 2), highlighting the fundamental structural differences between these economies in absorbing trade disruptions.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+# Add extra CSS for styling
+st.markdown("""
+<style>
+.trump-quote {
+    background-color: #f8f9fa;
+    border-left: 4px solid #f1c40f;
+    padding: 15px;
+    border-radius: 5px;
+    margin-bottom: 25px;
+}
+.quote-text {
+    font-style: italic;
+    font-size: 16px;
+}
+.quote-attribution {
+    text-align: right;
+    margin-top: 10px;
+    font-weight: bold;
+}
+.info-box {
+    background-color: #e3f2fd;
+    padding: 10px;
+    border-radius: 5px;
+    margin-top: 10px;
+}
+.analysis-box {
+    background-color: #f5f5f5;
+    padding: 15px;
+    border-radius: 5px;
+    margin-top: 20px;
+}
+.score-box {
+    border-radius: 5px;
+    margin-top: 10px;
+}
+</style>
+""", unsafe_allow_html=True)
@@ -0,0 +1,90 @@
+# Cold-start import cost of the dashboard on top of Streamlit itself.
+#
+#     python -m benchmarks.bench_imports [--runs 5] [--top 15] [--max-ms 40]
+#
+# Imports the modules every rerun of dash_v2.py loads in fresh interpreters, once
+# with `-X importtime` for a breakdown (self time per package, and the --top
+# modules by cumulative time) and --runs times for wall clock,
+# against a baseline of streamlit, numpy and pandas (every section needs the
+# latter two, so they are not the app's to save). Exits non-zero if the import
+# time the app adds (summed self time of the modules it brings in, which is far
+# steadier than wall clock) exceeds --max-ms or if any of HEAVY_MODULES is imported eagerly; those belong
+# behind lazy_import or inside the page that uses them.
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = 'import streamlit, numpy, pandas'
+APP_IMPORTS = BASELINE + '; import app_pages, data, charts, ui'
+HEAVY_MODULES = ['plotly.express', 'plotly.subplots', 'matplotlib', 'seaborn', 'statsmodels']
+
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def _run(code, *flags):
+    return subprocess.run([sys.executable, *flags, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+# Best-of-runs wall clock of a fresh interpreter running `code`, in ms
+def wall_ms(code, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _run(code)
+        times.append((time.perf_counter() - start) * 1e3)
+    return min(times)
+
+
+# module -> (self ms, cumulative ms) from one `-X importtime` run
+def import_times(code):
+    times = {}
+    for line in _run(code, '-X', 'importtime').stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            times[match.group(4)] = (int(match.group(1)) / 1e3, int(match.group(2)) / 1e3)
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark dashboard import time')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--max-ms', type=float, default=40.0)
+    args = parser.parse_args(argv)
+
+    baseline = import_times(BASELINE)
+    app = import_times(APP_IMPORTS)
+    added = {name: times for name, times in app.items() if name not in baseline}
+
+    # Self time of the modules the app adds, rolled up by top-level package
+    packages = {}
+    for name, (self_ms, _) in added.items():
+        package = name.split('.')[0]
+        packages[package] = packages.get(package, 0.0) + self_ms
+    print(f'modules imported beyond the baseline: {len(added)}')
+    print(f"{'package':<24} {'self ms':>8}")
+    for package, ms in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f'{package:<24} {ms:>8.1f}')
+
+    # Every module the app adds with what importing it cost, its own imports included
+    print(f"{'module':<40} {'cumulative ms':>13} {'self ms':>8}")
+    for name, (self_ms, cumulative_ms) in sorted(added.items(), key=lambda item: -item[1][1])[:args.top]:
+        print(f'{name:<40} {cumulative_ms:>13.1f} {self_ms:>8.1f}')
+
+    eager = [name for name in HEAVY_MODULES if name in app]
+    for name in eager:
+        print(f'eagerly imported: {name} ({app[name][1]:.1f} ms cumulative)')
+
+    base_ms, app_ms = wall_ms(BASELINE, args.runs), wall_ms(APP_IMPORTS, args.runs)
+    print(f'wall clock: baseline {base_ms:.0f} ms, with the app {app_ms:.0f} ms')
+    extra = sum(self_ms for self_ms, _ in added.values())
+    print(f'import time added by the app: {extra:.1f} ms (limit {args.max_ms:.0f})')
+    return 0 if extra <= args.max_ms and not eager else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,61 @@
+# Series lookup cost as the panel grows from the sample size to the full WEO universe.
+#
+#     python -m benchmarks.bench_lookup [--max-ratio 3]
+#
+# Times IndicatorPanel.series (array views) and IndicatorPanel.series_frame (what
+# get_indicator_data returns) against the old boolean-mask scan over the long-format frame, and exits non-zero if indexed
+# lookups at full WEO size cost more than --max-ratio times the smallest panel's.
+import argparse
+import sys
+import timeit
+
+import numpy as np
+
+from benchmarks.synthetic import WEO_COUNTRIES, WEO_SUBJECTS, WEO_YEARS, synthetic_panel
+
+SIZES = [(2, 12, 11), (10, 20, 20), (50, 30, 30), (100, 45, 40), (WEO_COUNTRIES, WEO_SUBJECTS, WEO_YEARS)]
+
+
+# Old get_indicator_data: three boolean masks over the whole frame, then a sort
+def scan_lookup(df, country, indicator, units):
+    filtered_df = df[(df['Country'] == country) &
+                     (df['Subject Descriptor'] == indicator) &
+                     (df['Units'] == units)]
+    return filtered_df.sort_values(by='Year')
+
+
+# Best-of-repeats time per call, in microseconds
+def per_call(func, keys, repeat):
+    timer = timeit.Timer(lambda: [func(*key) for key in keys])
+    return min(timer.repeat(repeat=repeat, number=1)) / len(keys) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark indexed series lookups')
+    parser.add_argument('--lookups', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--max-ratio', type=float, default=3.0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    print(f"{'countries':>9} {'subjects':>8} {'years':>5} {'rows':>9} {'series us':>9} {'frame us':>8} {'scan us':>9}")
+    results = []
+    for n_countries, n_subjects, n_years in SIZES:
+        panel = synthetic_panel(n_countries, n_subjects, n_years)
+        df = panel.to_frame()
+        labels = list(zip(panel.labels('Country'), panel.labels('Subject Descriptor'), panel.labels('Units')))
+        keys = [labels[i] for i in rng.integers(len(labels), size=args.lookups)]
+
+        views = per_call(panel.series, keys, args.repeat)
+        indexed = per_call(panel.series_frame, keys, args.repeat)
+        scan = per_call(lambda *key: scan_lookup(df, *key), keys[:20], 3)
+        results.append(indexed)
+        print(f'{n_countries:>9} {n_subjects:>8} {n_years:>5} {len(df):>9} {views:>9.2f} {indexed:>8.1f} {scan:>9.1f}')
+
+    ratio = results[-1] / results[0]
+    print(f'indexed lookup cost ratio, full WEO vs smallest: {ratio:.2f} (limit {args.max_ratio})')
+    return 0 if ratio <= args.max_ratio else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
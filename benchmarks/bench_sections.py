@@ -0,0 +1,87 @@
+# Rerun latency per dashboard section, rendered headlessly through Streamlit's AppTest.
+#
+#     python -m benchmarks.bench_sections [--runs 5] [--legacy REV]
+#
+# Each page of the section registry is opened with AppTest.switch_page, then rerun
+# --runs times as a widget interaction would. With --legacy REV the single-script
+# dashboard from git revision REV (sections picked with its "Go to" radio) is timed
+# the same way, for a before/after comparison.
+import argparse
+import os
+import statistics
+import subprocess
+import time
+
+from streamlit import logger as streamlit_logger
+from streamlit.testing.v1 import AppTest
+
+from app_pages import SECTIONS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, 'dash_v2.py')
+TIMEOUT = 120
+
+
+def _timed_run(at):
+    start = time.perf_counter()
+    at.run(timeout=TIMEOUT)
+    return time.perf_counter() - start
+
+
+# Seconds for the first render of a section, the median of its reruns and
+# whether the section raised
+def _time_section(at, select, runs):
+    select(at)
+    first = _timed_run(at)
+    rerun = statistics.median(_timed_run(at) for _ in range(runs))
+    return first, rerun, bool(at.exception)
+
+
+def bench_registry(runs):
+    at = AppTest.from_file(APP, default_timeout=TIMEOUT)
+    _timed_run(at)
+    results = {}
+    for path, title in SECTIONS:
+        results[title] = _time_section(at, lambda at: at.switch_page(path), runs)
+    return results
+
+
+def bench_legacy(rev, runs):
+    source = subprocess.run(['git', 'show', f'{rev}:dash_v2.py'], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    # Written next to the app so its imports resolve the same way
+    script = os.path.join(ROOT, f'_legacy_{os.getpid()}.py')
+    with open(script, 'w') as f:
+        f.write(source)
+    try:
+        at = AppTest.from_file(script, default_timeout=TIMEOUT)
+        _timed_run(at)
+        results = {}
+        for title in at.sidebar.radio[0].options:
+            results[title] = _time_section(at, lambda at: at.sidebar.radio[0].set_value(title), runs)
+        return results
+    finally:
+        os.remove(script)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark per-section rerun latency')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--legacy', metavar='REV', help='also time the single-script dashboard at this git revision')
+    args = parser.parse_args(argv)
+    streamlit_logger.set_log_level('error')
+
+    after = bench_registry(args.runs)
+    before = bench_legacy(args.legacy, args.runs) if args.legacy else {}
+
+    header = f"{'section':<26} {'first ms':>8} {'rerun ms':>8}"
+    print(header + (f" {'legacy first':>12} {'legacy rerun':>12}" if before else ''))
+    for title, (first, rerun, failed) in after.items():
+        line = f'{title:<26} {first * 1e3:>8.0f} {rerun * 1e3:>8.0f}'
+        if title in before:
+            line += f' {before[title][0] * 1e3:>12.0f} {before[title][1] * 1e3:>12.0f}'
+        print(line + ('  (raised)' if failed or before.get(title, (0, 0, False))[2] else ''))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,284 @@
+# Benchmark suite: data load, lookups, snapshots, release merges, vintages,
+# forecasts, correlations and figures on synthetic panels from 2 to 190
+# countries and 11 to 60 years, product-level trade ingest, a page of a
+# 5,000-row styled table, a tariff scenario, plus a headless render of every
+# dashboard section. Results are saved as JSON so two runs can be compared.
+#
+#     python -m benchmarks.suite run [--out PATH] [--repeat 5] [--max-countries N] [--skip-sections]
+#     python -m benchmarks.suite compare BASE.json NEW.json [--threshold 0.25]
+#
+# `run` writes benchmarks/results/<git revision>.json by default. `compare`
+# prints new/base ratios for every benchmark present in both files and exits
+# non-zero if any is slower than base by more than --threshold (0.25 = 25%).
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from datetime import datetime, timezone
+
+import numpy as np
+
+from benchmarks.synthetic import WEO_COUNTRIES, synthetic_panel, write_trade_csv, write_weo_export
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+
+# (countries, subjects, years) of the synthetic panels
+SIZES = [(2, 12, 11), (10, 20, 20), (50, 30, 30), (100, 45, 45), (190, 45, 60)]
+LOOKUPS = 200
+RELEASE_SERIES = 100
+VINTAGES = 20
+TABLE_ROWS = 5000
+TRADE_ROWS = 200_000
+
+
+# Best-of-repeat seconds per call of func()
+def best_of(func, repeat, number=1):
+    return min(timeit.Timer(func).repeat(repeat=repeat, number=number)) / number
+
+
+def bench_size(n_countries, n_subjects, n_years, repeat, tmp_dir):
+    from charts import create_comparative_line_chart
+    from correlations import CorrelationEngine, correlation_significance
+    from data import get_indicator_data
+    from forecasting import Forecaster
+    from panel import IndicatorPanel
+    from panel_cache import read_panel, write_panel
+    from vintages import VintageStore
+    from weo_ingest import load_weo_panel
+
+    panel = synthetic_panel(n_countries, n_subjects, n_years)
+    export_path = os.path.join(tmp_dir, f'weo-{n_countries}.xls')
+    cache_path = os.path.join(tmp_dir, f'panel-{n_countries}.arrow')
+    write_weo_export(panel, export_path)
+    write_panel(panel, cache_path)
+
+    rng = np.random.default_rng(0)
+    labels = list(zip(panel.labels('Country'), panel.labels('Subject Descriptor'), panel.labels('Units')))
+    keys = [labels[i] for i in rng.integers(len(labels), size=LOOKUPS)]
+    countries = list(panel.categories['Country'])
+    subject, units = keys[0][1:]
+
+    def fresh_engine():
+        return CorrelationEngine(panel)
+
+    # A release revising the last two years of RELEASE_SERIES series, applied
+    # alternately with two sets of values so every call changes them
+    release_keys = [labels[i] + ('Units',) for i in rng.choice(len(labels), min(RELEASE_SERIES, len(labels)), replace=False)]
+    release_years = panel.years[-2:]
+    releases = itertools.cycle(rng.normal(size=(2, len(release_keys), 2)))
+    revised = synthetic_panel(n_countries, n_subjects, n_years)
+    revised.upsert(release_keys, release_years, next(releases))
+
+    # VINTAGES releases, each revising the last two years of a fifth of the series
+    vintage_values = [panel.values]
+    for _ in range(VINTAGES - 1):
+        values = vintage_values[-1].copy()
+        values[rng.choice(panel.n_series, panel.n_series // 5, replace=False), -2:] += 0.1
+        vintage_values.append(values)
+    vintage_panels = [IndicatorPanel(panel.categories, panel.codes, panel.years, values) for values in vintage_values]
+
+    def fill_store():
+        store = VintageStore()
+        for i, vintage in enumerate(vintage_panels):
+            store.add(str(i), vintage)
+        return store
+
+    store = fill_store()
+    engine = fresh_engine()
+    results = {
+        'load/ingest': best_of(lambda: load_weo_panel(export_path), max(1, repeat // 2)),
+        'load/cache_reopen': best_of(lambda: read_panel(cache_path), repeat),
+        'lookup/get_indicator_data': best_of(lambda: [get_indicator_data(panel, *key) for key in keys], repeat) / LOOKUPS,
+        'lookup/series': best_of(lambda: [panel.series(*key) for key in keys], repeat) / LOOKUPS,
+        'snapshot/latest': best_of(panel.latest, repeat),
+        'release/upsert': best_of(lambda: revised.upsert(release_keys, release_years, next(releases)), repeat),
+        'release/rebuild': best_of(lambda: panel.extend([], np.empty((0, n_years))), repeat),
+        'vintages/add': best_of(fill_store, max(1, repeat // 2)) / VINTAGES,
+        'vintages/history': best_of(lambda: [store.history(*key) for key in keys], repeat) / LOOKUPS,
+        'vintages/oldest': best_of(lambda: store.values('0'), repeat),
+        'forecast/ar': best_of(lambda: Forecaster().forecast(panel, method='ar'), max(1, repeat // 2)),
+        'forecast/smoothing': best_of(lambda: Forecaster().forecast(panel, method='smoothing'), max(1, repeat // 2)),
+        'correlations/pearson': best_of(lambda: fresh_engine().matrices('pearson'), repeat),
+        'correlations/spearman': best_of(lambda: fresh_engine().matrices('spearman'), max(1, repeat // 2)),
+        'correlations/rolling5': best_of(lambda: fresh_engine().rolling(min(5, n_years)), repeat),
+        'correlations/significance': best_of(lambda: correlation_significance(engine.cube[0]), max(1, repeat // 2)),
+        'correlations/matrix': best_of(lambda: [engine.matrix(country) for country in countries], repeat) / len(countries),
+        'figure/comparative_line': best_of(lambda: create_comparative_line_chart(panel, subject, units, countries=countries), repeat),
+    }
+    return {f'{name}/{n_countries}x{n_subjects}x{n_years}': seconds for name, seconds in results.items()}
+
+
+# One page of a TABLE_ROWS-row scored table, searched, filtered, sorted and
+# styled as the paged tables in the dashboard do it
+def bench_table(repeat):
+    import pandas as pd
+
+    from tables import query_table, style_buckets
+
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({'Product': [f'{code:06d}' for code in rng.choice(10 ** 6, TABLE_ROWS, replace=False)],
+                          'India': rng.uniform(1, 10, TABLE_ROWS).round(1),
+                          'Denmark': rng.uniform(1, 10, TABLE_ROWS).round(1)})
+
+    def page():
+        rows, _ = query_table(frame, '1', 'Product', ['India', 'Denmark'], 4, 'India', False, 3)
+        return style_buckets(rows, ['India', 'Denmark']).to_html()
+
+    return {f'table/page/{TABLE_ROWS}': best_of(page, repeat)}
+
+
+# Aggregating a TRADE_ROWS-row Comtrade-style file, and reopening the aggregate
+# from the cache as later starts do
+def bench_trade(repeat, tmp_dir):
+    from panel_cache import cached_frame
+    from trade_ingest import load_trade_aggregate
+
+    path = os.path.join(tmp_dir, 'trade.csv')
+    write_trade_csv(path, TRADE_ROWS)
+    partners = ['Denmark', 'India']
+
+    def load():
+        return load_trade_aggregate([path], partners)
+
+    cached_frame([path], load, partners, cache_dir=tmp_dir, name='trade')
+    return {
+        f'trade/ingest/{TRADE_ROWS}': best_of(load, max(1, repeat // 2)),
+        f'trade/cache_reopen/{TRADE_ROWS}': best_of(
+            lambda: cached_frame([path], load, partners, cache_dir=tmp_dir, name='trade'), repeat),
+    }
+
+
+# One tariff scenario over every WEO country and HS chapter, as a slider move
+# recomputes it
+def bench_tariffs(repeat):
+    from tariffs import TariffSimulator
+
+    rng = np.random.default_rng(0)
+    n_sectors = 97
+    simulator = TariffSimulator(range(WEO_COUNTRIES), rng.lognormal(size=(WEO_COUNTRIES, n_sectors)),
+                                baseline=rng.uniform(0, 10, n_sectors), elasticities=rng.uniform(1, 5, n_sectors),
+                                sectors=range(n_sectors))
+    rates = rng.uniform(0, 50, n_sectors)
+    return {f'tariff/simulate/{WEO_COUNTRIES}x{n_sectors}':
+            best_of(lambda: simulator.summary(simulator.simulate(rates)), repeat, number=100)}
+
+
+def bench_sections(repeat):
+    from streamlit import logger as streamlit_logger
+
+    from benchmarks.bench_sections import bench_registry
+
+    streamlit_logger.set_log_level('error')
+    results, failed = {}, []
+    for title, (first, rerun, raised) in bench_registry(repeat).items():
+        if raised:
+            failed.append(title)
+            continue
+        results[f'section/{title}/first'] = first
+        results[f'section/{title}/rerun'] = rerun
+    return results, failed
+
+
+def _git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def run(args):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in SIZES:
+            if size[0] > args.max_countries:
+                continue
+            start = time.perf_counter()
+            results.update(bench_size(*size, args.repeat, tmp_dir))
+            print(f'{"x".join(map(str, size))}: {time.perf_counter() - start:.1f} s', file=sys.stderr)
+        results.update(bench_trade(args.repeat, tmp_dir))
+    results.update(bench_table(args.repeat))
+    results.update(bench_tariffs(args.repeat))
+    failed = []
+    if not args.skip_sections:
+        section_results, failed = bench_sections(args.repeat)
+        results.update(section_results)
+
+    revision = _git_revision()
+    report = {
+        'meta': {
+            'revision': revision,
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'failed_sections': failed,
+        },
+        'results': results,
+    }
+    out = args.out or os.path.join(RESULTS_DIR, f'{revision}.json')
+    os.makedirs(os.path.dirname(out) or '.', exist_ok=True)
+    with open(out, 'w') as f:
+        json.dump(report, f, indent=1, sort_keys=True)
+
+    for name, seconds in sorted(results.items()):
+        print(f'{name:<60} {seconds * 1e3:>10.3f} ms')
+    for title in failed:
+        print(f'section {title} raised; not timed')
+    print(f'wrote {out}')
+    return 0
+
+
+def compare(args):
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+
+    print(f"{base['meta']['revision']} -> {new['meta']['revision']}, regression threshold {args.threshold:.0%}")
+    print(f"{'benchmark':<60} {'base ms':>10} {'new ms':>10} {'ratio':>7}")
+    regressions = []
+    for name in sorted(set(base['results']) & set(new['results'])):
+        before, after = base['results'][name], new['results'][name]
+        ratio = after / before if before else float('inf')
+        regressed = ratio > 1 + args.threshold
+        if regressed:
+            regressions.append(name)
+        print(f'{name:<60} {before * 1e3:>10.3f} {after * 1e3:>10.3f} {ratio:>7.2f}' + ('  REGRESSION' if regressed else ''))
+    for name in sorted(set(base['results']) ^ set(new['results'])):
+        print(f'{name:<60} only in {"base" if name in base["results"] else "new"}')
+
+    print(f'{len(regressions)} regression(s)')
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run or compare the dashboard benchmark suite')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run the suite and save the results as JSON')
+    run_parser.add_argument('--out', help='results file (default benchmarks/results/<revision>.json)')
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--max-countries', type=int, default=SIZES[-1][0])
+    run_parser.add_argument('--skip-sections', action='store_true', help='skip the AppTest section renders')
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser('compare', help='flag regressions between two result files')
+    compare_parser.add_argument('base')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=0.25)
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+import numpy as np
+
+from panel import IndicatorPanel
+from weo_sample import SUBJECTS
+
+# Full IMF WEO universe the dashboard is expected to load
+WEO_COUNTRIES, WEO_SUBJECTS, WEO_YEARS = 190, 45, 50
+
+
+# Random-walk panel with the dashboard's own countries and subjects first, padded
+# with generated ones up to the requested size. Years end in 2024.
+def synthetic_panel(n_countries, n_subjects, n_years, seed=0):
+    countries = ['Denmark', 'India'] + [f'Country {i:03d}' for i in range(max(n_countries - 2, 0))]
+    subjects = SUBJECTS + [(f'Subject {i:02d}', 'Percent change', 'Units')
+                           for i in range(max(n_subjects - len(SUBJECTS), 0))]
+    countries, subjects = countries[:n_countries], subjects[:n_subjects]
+
+    keys = [(country,) + subject for country in countries for subject in subjects]
+    rng = np.random.default_rng(seed)
+    values = 2.0 + rng.normal(size=(len(keys), n_years)).cumsum(axis=1)
+    return IndicatorPanel.from_block(keys, range(2025 - n_years, 2025), values)
+
+
+# Write a panel in the IMF WEO tab-delimited export layout (UTF-16 with a BOM,
+# thousands separators, '--' for missing values, a trailing source note), for
+# timing the ingest path on files of a known size
+def write_weo_export(panel, path, encoding='utf-16'):
+    header = (['WEO Country Code', 'ISO', 'WEO Subject Code', 'Country', 'Subject Descriptor', 'Subject Notes',
+               'Units', 'Scale', 'Country/Series-specific Notes'] + [str(year) for year in panel.years]
+              + ['Estimates Start After'])
+    labels = zip(*(panel.labels(dim) for dim in ('Country', 'Subject Descriptor', 'Units', 'Scale')))
+    with open(path, 'w', encoding=encoding) as f:
+        f.write('\t'.join(header) + '\n')
+        for row, (country, subject, units, scale) in enumerate(labels):
+            values = ['--' if np.isnan(value) else f'{value:,.3f}' for value in panel.values[row].tolist()]
+            f.write('\t'.join([str(row), '', '', country, subject, '', units, scale, ''] + values
+                              + [str(panel.years[-1] - 1)]) + '\n')
+        f.write('International Monetary Fund, World Economic Outlook Database\n')
+
+
+# Write a UN Comtrade-style bilateral trade CSV of about `n_rows` rows of U.S.
+# trade by year, partner, flow and HS-6 product (plus rows other reporters and
+# chapter subtotals the loader must skip), written in blocks so files of any
+# size can be generated
+def write_trade_csv(path, n_rows, n_partners=50, n_products=5000, years=range(2015, 2025), seed=0, block=200_000):
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    partners = np.array(['Denmark', 'India'] + [f'Country {i:03d}' for i in range(n_partners - 2)])
+    products = np.array([f'{code:06d}' for code in np.sort(rng.choice(np.arange(10_000, 980_000), n_products, replace=False))]
+                        + ['TOTAL', '30', '3004'])
+    years = np.asarray(list(years))
+    header = True
+    for start in range(0, n_rows, block):
+        size = min(block, n_rows - start)
+        pd.DataFrame({
+            'refYear': rng.choice(years, size),
+            'reporterDesc': np.where(rng.random(size) < 0.95, 'USA', 'Canada'),
+            'flowDesc': rng.choice(['Export', 'Import', 'Re-export'], size, p=[0.45, 0.5, 0.05]),
+            'partnerDesc': rng.choice(partners, size),
+            'cmdCode': rng.choice(products, size),
+            'primaryValue': rng.lognormal(12, 2, size).round(0),
+        }).to_csv(path, mode='w' if header else 'a', header=header, index=False)
+        header = False
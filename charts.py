@@ -0,0 +1,252 @@
+import numpy as np
+
+from correlations import SIGNIFICANCE_LEVEL, cluster_order
+from figure_cache import cached_chart
+from lazy import lazy_import
+
+go = lazy_import('plotly.graph_objects')
+plotly_colors = lazy_import('plotly.colors')
+
+# Trace colours for the focus countries; any other country cycles through the Plotly palette
+COUNTRY_COLORS = {'Denmark': '#3B82F6', 'India': '#EF4444'}
+
+# Charts with more traces or plotted points than this are drawn with WebGL (Scattergl)
+WEBGL_TRACE_THRESHOLD = 20
+WEBGL_POINT_THRESHOLD = 2000
+
+# Helper function to create comparative line charts for any list of countries.
+# year_range is an inclusive (first, last) pair; pass cache= to serve it from a FigureCache.
+# forecasts maps a country to (years, mean, lower, upper) from forecasting.Forecaster,
+# drawn as a dashed extension with a shaded band (left out of crowded charts).
+@cached_chart('comparative_line')
+def create_comparative_line_chart(panel, indicator, units=None, title=None, ylabel=None,
+                                  countries=('Denmark', 'India'), year_range=None,
+                                  template='plotly_white', height=450,
+                                  webgl_traces=WEBGL_TRACE_THRESHOLD, webgl_points=WEBGL_POINT_THRESHOLD,
+                                  forecasts=None):
+    countries, years, values = panel.pivot(indicator, units, countries)
+    if year_range is not None:
+        in_range = (years >= year_range[0]) & (years <= year_range[1])
+        years, values = years[in_range], values[:, in_range]
+    
+    # Peer-group charts switch to WebGL and drop markers to keep the browser responsive
+    n_points = int(np.count_nonzero(~np.isnan(values)))
+    webgl = len(countries) > webgl_traces or n_points > webgl_points
+    crowded = len(countries) > webgl_traces
+    palette = plotly_colors.qualitative.Plotly
+    
+    # All traces are built in one pass over the pivoted block
+    x = years.tolist()
+    traces = [
+        dict(
+            type='scattergl' if webgl else 'scatter',
+            x=x,
+            y=row,
+            mode='lines' if crowded else 'lines+markers',
+            name=country,
+            line=dict(color=COUNTRY_COLORS.get(country, palette[i % len(palette)]), width=1.5 if crowded else 3),
+            marker=dict(size=8)
+        )
+        for i, (country, row) in enumerate(zip(countries, values.tolist()))
+    ]
+    
+    # Forecasts continue from each country's last plotted observation
+    for i, (country, row) in enumerate(zip(countries, values)):
+        forecast = (forecasts or {}).get(country)
+        observed = np.flatnonzero(~np.isnan(row))
+        if forecast is None or not len(observed):
+            continue
+        future, mean, lower, upper = (np.asarray(part).tolist() for part in forecast)
+        color = COUNTRY_COLORS.get(country, palette[i % len(palette)])
+        if not crowded:
+            red, green, blue = plotly_colors.hex_to_rgb(color)
+            traces.append(dict(
+                type='scatter',
+                x=future + future[::-1],
+                y=upper + lower[::-1],
+                fill='toself',
+                fillcolor=f'rgba({red}, {green}, {blue}, 0.15)',
+                line=dict(width=0),
+                hoverinfo='skip',
+                showlegend=False,
+                name=f'{country} 95% band'
+            ))
+        traces.append(dict(
+            type='scattergl' if webgl else 'scatter',
+            x=[x[observed[-1]]] + future,
+            y=[float(row[observed[-1]])] + mean,
+            mode='lines',
+            name=f'{country} forecast',
+            line=dict(color=color, width=2, dash='dash')
+        ))
+    
+    legend = dict(orientation="v") if crowded else dict(
+        orientation="h",
+        yanchor="bottom",
+        y=1.02,
+        xanchor="right",
+        x=1
+    )
+    fig = go.Figure(
+        data=traces,
+        layout=dict(
+            title=title,
+            xaxis_title='Year',
+            yaxis_title=ylabel if ylabel else units,
+            legend=legend,
+            template=template,
+            height=height
+        )
+    )
+    
+    return fig
+
+# Helper function to create a time-slider heatmap of rolling-window correlations.
+# Every window is sent as an animation frame, so moving the slider redraws in the browser.
+@cached_chart('rolling_correlation_heatmap')
+def create_rolling_correlation_heatmap(engine, country, window):
+    end_years, matrices = engine.rolling(window)
+    i, available, labels = engine.available(country)
+    windows = matrices[:, i][:, available][:, :, available].round(3)
+    
+    def heatmap(matrix):
+        return go.Heatmap(z=matrix, x=labels, y=labels, zmin=-1, zmax=1, colorscale='RdBu',
+                          hovertemplate='%{y} / %{x}: %{z}<extra></extra>')
+    
+    frames = [go.Frame(data=[heatmap(matrix)], name=str(year)) for year, matrix in zip(end_years, windows)]
+    steps = [
+        dict(
+            method='animate',
+            label=str(year),
+            args=[[str(year)], dict(mode='immediate', frame=dict(duration=0, redraw=True), transition=dict(duration=0))]
+        )
+        for year in end_years
+    ]
+    
+    fig = go.Figure(data=[heatmap(windows[-1])] if len(windows) else [], frames=frames)
+    fig.update_layout(
+        title=f'{country}: {window}-Year Rolling Correlations',
+        sliders=[dict(active=len(steps) - 1, currentvalue=dict(prefix='Window ending '), steps=steps)],
+        yaxis=dict(autorange='reversed'),
+        template="plotly_white",
+        height=600
+    )
+    
+    return fig
+
+# Helper function to track how one year's estimate of an indicator moved across
+# WEO vintages, one line per country
+@cached_chart('vintage_revisions')
+def create_revision_chart(store, indicator, units, year, countries=('Denmark', 'India'), height=450):
+    palette = plotly_colors.qualitative.Plotly
+    traces = []
+    for i, country in enumerate(countries):
+        estimates = store.revisions(country, indicator, units, year)
+        traces.append(dict(
+            type='scatter',
+            x=list(estimates.index),
+            y=estimates.tolist(),
+            mode='lines+markers',
+            name=country,
+            line=dict(color=COUNTRY_COLORS.get(country, palette[i % len(palette)]), width=3),
+            marker=dict(size=9),
+            hovertemplate=f'{country}, %{{x}} release: %{{y:.2f}}<extra></extra>'
+        ))
+    
+    fig = go.Figure(
+        data=traces,
+        layout=dict(
+            title=f'{indicator}: {year} estimate by WEO vintage',
+            xaxis=dict(title='WEO vintage', type='category'),
+            yaxis_title=units,
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            template="plotly_white",
+            height=height
+        )
+    )
+    
+    return fig
+
+# Helper function to overlay every vintage of one country's series; older
+# vintages are drawn fainter and the newest in full colour
+@cached_chart('vintage_lines')
+def create_vintage_lines_chart(store, country, indicator, units, height=450):
+    history = store.history(country, indicator, units)
+    color = COUNTRY_COLORS.get(country, plotly_colors.qualitative.Plotly[0])
+    n = len(history)
+    traces = []
+    for position, (vintage, row) in enumerate(history.iterrows()):
+        observed = row.notna().to_numpy()
+        traces.append(dict(
+            type='scatter',
+            x=history.columns[observed].tolist(),
+            y=row[observed].tolist(),
+            mode='lines+markers' if position == n - 1 else 'lines',
+            name=vintage,
+            line=dict(color=color, width=3 if position == n - 1 else 1.5),
+            opacity=1.0 if position == n - 1 else 0.3 + 0.5 * position / max(n - 1, 1)
+        ))
+    
+    fig = go.Figure(
+        data=traces,
+        layout=dict(
+            title=f'{country}: {indicator} by WEO vintage',
+            xaxis_title='Year',
+            yaxis_title=units,
+            hovermode='x unified',
+            template="plotly_white",
+            height=height
+        )
+    )
+    
+    return fig
+
+# Helper function to draw one country's correlation matrix as a heatmap. The
+# matrix is sent once as a numeric array and coloured in the browser; cluster
+# reorders indicators by hierarchical clustering, and significance greys out
+# cells whose permutation p-value is not below SIGNIFICANCE_LEVEL and adds
+# the bootstrap interval and p-value to the hover.
+@cached_chart('correlation_heatmap')
+def create_correlation_heatmap(engine, country, method='pearson', cluster=False, significance=False,
+                               height=None, cell_text_limit=15):
+    corr = engine.matrix(country, method)
+    order = cluster_order(corr.to_numpy()) if cluster else list(range(len(corr)))
+    labels = corr.index[order].tolist()
+    # float32 halves the base64 payload and is far finer than a colour scale needs
+    z = corr.to_numpy()[np.ix_(order, order)].astype(np.float32)
+    
+    hover = '%{y} / %{x}<br>r = %{z:.2f}'
+    heatmap = dict(
+        type='heatmap', z=z, x=labels, y=labels, zmin=-1, zmax=1, colorscale='RdBu',
+        colorbar=dict(title='r'), hovertemplate=hover + '<extra></extra>', xgap=1, ygap=1
+    )
+    # Cell labels only while they stay legible
+    if len(labels) <= cell_text_limit:
+        heatmap.update(texttemplate='%{z:.2f}', textfont=dict(size=11))
+    traces = [heatmap]
+    
+    if significance:
+        stats = engine.significance(country)
+        low, high, p = (stats[name].to_numpy()[np.ix_(order, order)] for name in ('low', 'high', 'p'))
+        heatmap['customdata'] = np.stack([low, high, p], axis=-1).astype(np.float32)
+        heatmap['hovertemplate'] = hover + '<br>95% CI [%{customdata[0]:.2f}, %{customdata[1]:.2f}]<br>p = %{customdata[2]:.3f}<extra></extra>'
+        # Grey layer over the cells that are not significant
+        traces.append(dict(
+            type='heatmap', z=np.where(p >= SIGNIFICANCE_LEVEL, 1, np.nan).astype(np.float32), x=labels, y=labels,
+            colorscale=[[0, '#E5E7EB'], [1, '#E5E7EB']], showscale=False, hoverinfo='skip', xgap=1, ygap=1,
+            opacity=0.85
+        ))
+    
+    size = height or min(max(400, 28 * len(labels) + 160), 1400)
+    fig = go.Figure(
+        data=traces,
+        layout=dict(
+            title=f'{country}: {method.capitalize()} correlations' + (' (clustered)' if cluster else ''),
+            xaxis=dict(tickangle=-45, showgrid=False),
+            yaxis=dict(autorange='reversed', showgrid=False),
+            template="plotly_white",
+            height=size
+        )
+    )
+    
+    return fig
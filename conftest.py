@@ -0,0 +1 @@
+# Lets the tests under tests/ import the app's top-level modules with a plain `pytest`
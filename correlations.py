@@ -0,0 +1,345 @@
+import numpy as np
+import pandas as pd
+
+from panel import record_reads
+
+# Indicators compared in the Correlation Analysis section: (label, subject, units)
+CORRELATION_INDICATORS = [
+    ('GDP Growth', 'Gross domestic product, constant prices', 'Percent change'),
+    ('Inflation', 'Inflation, average consumer prices', 'Percent change'),
+    ('Unemployment', 'Unemployment rate', 'Percent of total labor force'),
+    ('Exports', 'Volume of exports of goods and services', 'Percent change'),
+    ('Imports', 'Volume of imports of goods and services', 'Percent change'),
+    ('Budget Balance', 'General government net lending/borrowing', 'Percent of GDP'),
+    ('Investment', 'Total investment', 'Percent of GDP'),
+    ('Savings', 'Gross national savings', 'Percent of GDP'),
+    ('Population', 'Population', 'Persons'),
+]
+
+# Countries ranked per batch in Spearman, bounding its (batch, k, k, years) temporaries
+SPEARMAN_BATCH = 16
+
+# Significance mode: resamples for bootstrap intervals and permutation p-values,
+# the interval's coverage and the p-value below which a cell counts as significant
+RESAMPLES = 10_000
+CONFIDENCE = 0.95
+SIGNIFICANCE_LEVEL = 0.05
+
+
+# Variances at or below this fraction of the squared values summed into them
+# count as zero: cancellation in the sums leaves a constant series with a
+# variance of rounding noise rather than exactly zero
+VARIANCE_TOLERANCE = 1e-10
+
+
+# Pearson r from pairwise sums over (..., k, k) cells; NaN where fewer than two
+# shared observations or no variance. `scale_x` and `scale_y` are the squared
+# values the sums have seen (sxx and syy when they were summed once).
+def _pearson_from_sums(n, sx, sy, sxx, syy, sxy, scale_x=None, scale_y=None):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = sxy - sx * sy / n
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+        r = cov / np.sqrt(var_x * var_y)
+    scale_x = sxx if scale_x is None else scale_x
+    scale_y = syy if scale_y is None else scale_y
+    r[(n < 2) | ~(var_x > VARIANCE_TOLERANCE * scale_x) | ~(var_y > VARIANCE_TOLERANCE * scale_y)] = np.nan
+    return np.clip(r, -1, 1)
+
+
+# Pairwise-complete Pearson matrices for a (countries, years, k) cube at once.
+# Every cell only uses the years where both of its indicators are observed.
+def pearson(cube):
+    observed = ~np.isnan(cube)
+    weights = observed.astype(np.float64)
+    # Correlation is shift invariant; centring first keeps the sums well conditioned
+    filled = np.where(observed, cube, 0.0)
+    mean = filled.sum(axis=1, keepdims=True) / np.maximum(weights.sum(axis=1, keepdims=True), 1)
+    centred = np.where(observed, filled - mean, 0.0)
+
+    n = np.einsum('cyi,cyj->cij', weights, weights)
+    sx = np.einsum('cyi,cyj->cij', centred, weights)
+    sxx = np.einsum('cyi,cyj->cij', centred * centred, weights)
+    sxy = np.einsum('cyi,cyj->cij', centred, centred)
+    return _pearson_from_sums(n, sx, sx.transpose(0, 2, 1), sxx, sxx.transpose(0, 2, 1), sxy)
+
+
+# Pairwise-complete Pearson r between every indicator i of cube `a` and every
+# indicator j of cube `b` (both (..., years, k)), over the years where a's
+# indicator i and b's indicator j are both observed
+def cross_pearson(a, b):
+    def centred(cube):
+        observed = ~np.isnan(cube)
+        filled = np.where(observed, cube, 0.0)
+        mean = filled.sum(axis=-2, keepdims=True) / np.maximum(observed.sum(axis=-2, keepdims=True), 1)
+        return observed.astype(np.float64), np.where(observed, filled - mean, 0.0)
+
+    wa, ca = centred(a)
+    wb, cb = centred(b)
+    n = np.einsum('...yi,...yj->...ij', wa, wb)
+    sx = np.einsum('...yi,...yj->...ij', ca, wb)
+    sy = np.einsum('...yi,...yj->...ij', wa, cb)
+    sxx = np.einsum('...yi,...yj->...ij', ca * ca, wb)
+    syy = np.einsum('...yi,...yj->...ij', wa, cb * cb)
+    sxy = np.einsum('...yi,...yj->...ij', ca, cb)
+    return _pearson_from_sums(n, sx, sy, sxx, syy, sxy)
+
+
+# Bootstrap confidence intervals and permutation p-values for every cell of
+# one country's Pearson matrix, from a (years, k) block, in one batch each:
+#  - each bootstrap resample draws years with replacement through one index
+#    array shared by all indicators, so all k x k cells are recomputed from
+#    the same resampled years;
+#  - each permutation shuffles the years of the column indicators against the
+#    untouched rows, giving the null distribution of every cell at once.
+# Returns (low, high, p), each (k, k). p averages the two directions a pair can
+# be permuted in, so it is symmetric; the diagonal has p = 0.
+def correlation_significance(block, resamples=RESAMPLES, confidence=CONFIDENCE, seed=0):
+    rng = np.random.default_rng(seed)
+    n_years = block.shape[0]
+    observed = cross_pearson(block, block)
+
+    samples = cross_pearson(*(block[rng.integers(n_years, size=(resamples, n_years))],) * 2)
+    tail = (1 - confidence) / 2 * 100
+    with np.errstate(invalid='ignore'):
+        low, high = np.nanpercentile(samples, [tail, 100 - tail], axis=0)
+
+    permutations = rng.permuted(np.broadcast_to(np.arange(n_years), (resamples, n_years)), axis=1)
+    null = cross_pearson(np.broadcast_to(block, (resamples,) + block.shape), block[permutations])
+    with np.errstate(invalid='ignore'):
+        exceed = (np.abs(null) >= np.abs(observed) - 1e-12).sum(axis=0)
+    p = (exceed + 1) / (resamples + 1)
+    p = (p + p.T) / 2
+    p[np.isnan(observed)] = np.nan
+    np.fill_diagonal(p, 0.0)
+    return low, high, p
+
+
+# Leaf order of an average-linkage hierarchical clustering of a correlation
+# matrix with distance 1 - |r| (missing cells count as uncorrelated), so
+# strongly related indicators end up next to each other
+def cluster_order(matrix):
+    matrix = np.asarray(matrix, dtype=np.float64)
+    distance = 1 - np.abs(np.nan_to_num(matrix, nan=0.0))
+    clusters = {i: [i] for i in range(len(matrix))}
+    while len(clusters) > 1:
+        ids = list(clusters)
+        # Average distance between every pair of current clusters
+        members = np.zeros((len(ids), len(matrix)))
+        for position, cluster in enumerate(ids):
+            members[position, clusters[cluster]] = 1 / len(clusters[cluster])
+        linkage = members @ distance @ members.T
+        np.fill_diagonal(linkage, np.inf)
+        a, b = np.unravel_index(np.argmin(linkage), linkage.shape)
+        merged = clusters.pop(ids[a]) + clusters.pop(ids[b])
+        clusters[ids[a]] = merged
+    return next(iter(clusters.values())) if clusters else []
+
+
+# Average ranks of indicator i over the years shared with indicator j, for every
+# (i, j) pair: shape (countries, k, k, years), NaN outside the shared years
+def _pairwise_ranks(cube):
+    values = cube.transpose(0, 2, 1)                                  # (c, k, y)
+    observed = ~np.isnan(values)
+    both = observed[:, :, None, :] & observed[:, None, :, :]          # (c, i, j, y)
+
+    # For each (c, i, t): which years k hold a smaller / equal value of indicator i
+    less = (values[:, :, None, :] < values[:, :, :, None]).astype(np.float64)   # (c, i, t, k)
+    equal = (values[:, :, None, :] == values[:, :, :, None]).astype(np.float64)
+    # Count them over the years shared with j: (c, i, t, k) @ (c, i, k, j) -> (c, i, t, j)
+    shared = both.transpose(0, 1, 3, 2).astype(np.float64)            # (c, i, k, j)
+    n_less = np.matmul(less, shared).transpose(0, 1, 3, 2)           # (c, i, j, t)
+    n_equal = np.matmul(equal, shared).transpose(0, 1, 3, 2)
+    ranks = n_less + (n_equal + 1) / 2
+    return np.where(both, ranks, np.nan), both
+
+
+# Pairwise-complete Spearman matrices: Pearson on average ranks, where the ranks
+# of each cell are taken over that cell's shared years (as pandas does)
+def spearman(cube, batch=SPEARMAN_BATCH):
+    result = np.empty((cube.shape[0], cube.shape[2], cube.shape[2]))
+    for start in range(0, cube.shape[0], batch):
+        ranks, both = _pairwise_ranks(cube[start:start + batch])
+        x = np.where(both, ranks, 0.0)
+        y = x.transpose(0, 2, 1, 3)
+        n = both.sum(axis=-1, dtype=np.float64)
+        sx, sy = x.sum(axis=-1), y.sum(axis=-1)
+        result[start:start + batch] = _pearson_from_sums(
+            n, sx, sy, (x * x).sum(axis=-1), (y * y).sum(axis=-1), (x * y).sum(axis=-1))
+    return result
+
+
+METHODS = {'pearson': pearson, 'spearman': spearman}
+
+
+# Running pairwise sums behind Pearson matrices for every country at once.
+# Adding or removing one year of observations is a rank-one update of the
+# (countries, k, k) sums, so sliding a window or appending a new year costs
+# O(k^2) per country instead of a pass over the whole window.
+class RollingCorrelation:
+    def __init__(self, n_countries, k):
+        shape = (n_countries, k, k)
+        self.n = np.zeros(shape)    # years where both i and j are observed
+        self.sx = np.zeros(shape)   # sum of x_i over those years
+        self.sxx = np.zeros(shape)  # sum of x_i^2 over those years
+        self.sxy = np.zeros(shape)  # sum of x_i * x_j
+        self.seen = np.zeros(shape)  # sum of x_i^2 over every year ever added: the scale of rounding errors
+
+    def _update(self, year_values, sign):
+        observed = ~np.isnan(year_values)
+        x = np.where(observed, year_values, 0.0)
+        weights = observed.astype(np.float64)
+        self.n += sign * weights[:, :, None] * weights[:, None, :]
+        self.sx += sign * x[:, :, None] * weights[:, None, :]
+        squares = (x * x)[:, :, None] * weights[:, None, :]
+        self.sxx += sign * squares
+        self.sxy += sign * x[:, :, None] * x[:, None, :]
+        if sign > 0:
+            self.seen += squares
+
+    # year_values: (countries, k) observations of one year, NaN where missing
+    def add(self, year_values):
+        self._update(year_values, 1)
+
+    def remove(self, year_values):
+        self._update(year_values, -1)
+
+    # Take the sums of some countries from another RollingCorrelation over them
+    def replace_rows(self, rows, other):
+        for name in ('n', 'sx', 'sxx', 'sxy', 'seen'):
+            getattr(self, name)[rows] = getattr(other, name)
+
+    def matrices(self):
+        return _pearson_from_sums(self.n, self.sx, self.sx.transpose(0, 2, 1),
+                                  self.sxx, self.sxx.transpose(0, 2, 1), self.sxy,
+                                  self.seen, self.seen.transpose(0, 2, 1))
+
+
+# Feed years `start` onwards of a centred (countries, years, k) cube through
+# running sums that hold the window ending the year before `start`, and
+# return the matrices of every window that ends in those years
+def _slide(rolling, centred, window, start):
+    windows = []
+    for t in range(start, centred.shape[1]):
+        rolling.add(centred[:, t])
+        if t >= window:
+            rolling.remove(centred[:, t - window])
+        if t >= window - 1:
+            windows.append(rolling.matrices())
+    return windows
+
+
+# rolling_pearson plus the running sums after the last window and the
+# per-series offsets they are centred on, so later years can be slid in
+def _rolling_state(cube, window):
+    # Centre each series once so the running sums stay well conditioned
+    observed = ~np.isnan(cube)
+    offset = np.where(observed, cube, 0.0).sum(axis=1, keepdims=True) / np.maximum(observed.sum(axis=1, keepdims=True), 1)
+    rolling = RollingCorrelation(cube.shape[0], cube.shape[2])
+    windows = _slide(rolling, cube - offset, window, 0)
+    return np.stack(windows) if windows else np.empty((0,) + rolling.n.shape), rolling, offset
+
+
+# Pearson matrices over every `window`-year window of a (countries, years, k)
+# cube, slid one year at a time: shape (n_windows, countries, k, k), where
+# window w covers years w .. w + window - 1
+def rolling_pearson(cube, window):
+    return _rolling_state(cube, window)[0]
+
+
+# Correlation matrices for every country from one pivot of the panel into a
+# (country, year, indicator) cube. Each method is computed for all countries
+# on first use and kept, so any country's matrix is then a slice.
+class CorrelationEngine:
+    def __init__(self, panel, indicators=CORRELATION_INDICATORS):
+        self.labels = [label for label, _, _ in indicators]
+        self.indicators = [(subject, units) for _, subject, units in indicators]
+        self._spec = tuple(indicators)
+        self.token = (panel.token, panel.revision, self._spec)
+        self.countries, self.years, self.cube = panel.cube(self.indicators)
+        self._panel_token = panel.token
+        self._country_index = {country: i for i, country in enumerate(self.countries)}
+        self._matrices = {}
+        self._rolling = {}          # window -> (matrices, running sums of the last window, centring offsets)
+        self._significance = {}     # (country, resamples) -> (low, high, p)
+
+    # Bring the engine up to date after panel.upsert() changed the (country,
+    # subject, units) `keys`: the countries whose indicators changed are
+    # recomputed, and years the release appended extend the cube, with the
+    # rolling windows ending in them slid in from the running sums. Returns
+    # False when that is not possible in place (years were inserted before the
+    # last one, reordered or removed, or the countries changed), in which case
+    # the engine has to be rebuilt.
+    def update(self, panel, keys):
+        indicators = set(self.indicators)
+        countries = list(dict.fromkeys(country for country, subject, units in keys if (subject, units) in indicators))
+        n_years = len(self.years)
+        appended = len(panel.years) > n_years and np.array_equal(panel.years[:n_years], self.years)
+        if not appended and not np.array_equal(panel.years, self.years):
+            return False
+        if any(country not in self._country_index for country in countries):
+            return False
+        if not countries and not appended:
+            return True
+
+        if appended:
+            # Other countries have no observations in the new years
+            cube = np.full((len(self.countries), len(panel.years), len(self.indicators)), np.nan)
+            cube[:, :n_years] = self.cube
+            self.cube, self.years = cube, panel.years.copy()
+            self.token = (panel.token, panel.revision, self._spec)
+            self._significance.clear()
+        rows = [self._country_index[country] for country in countries]
+        if rows:
+            _, _, self.cube[rows] = panel.cube(self.indicators, countries)
+
+        for method, matrices in self._matrices.items():
+            if rows:
+                matrices[rows] = METHODS[method](self.cube[rows])
+        for window, (matrices, rolling, offset) in self._rolling.items():
+            if appended:
+                windows = _slide(rolling, self.cube - offset, window, n_years)
+                if windows:
+                    matrices = np.concatenate([matrices, np.stack(windows)])
+            if rows:
+                # Revised countries may have changed in any year: recompute their windows
+                matrices[:, rows], fresh, offset[rows] = _rolling_state(self.cube[rows], window)
+                rolling.replace_rows(rows, fresh)
+            self._rolling[window] = (matrices, rolling, offset)
+        for entry in [entry for entry in self._significance if entry[0] in countries]:
+            del self._significance[entry]
+        return True
+
+    def matrices(self, method='pearson'):
+        if method not in self._matrices:
+            self._matrices[method] = METHODS[method](self.cube)
+        return self._matrices[method]
+
+    # Window end years and (n_windows, countries, k, k) rolling Pearson matrices
+    def rolling(self, window):
+        if window not in self._rolling:
+            self._rolling[window] = _rolling_state(self.cube, window)
+        return self.years[window - 1:], self._rolling[window][0]
+
+    # Position of a country in the cube, a mask of the indicators it has any
+    # data for and their labels
+    def available(self, country):
+        i = self._country_index[country]
+        record_reads(self._panel_token, [(country,) + indicator for indicator in self.indicators])
+        mask = ~np.isnan(self.cube[i]).all(axis=0)
+        return i, mask, [label for label, keep in zip(self.labels, mask) if keep]
+
+    # Labelled matrix for one country, dropping indicators it has no data for
+    def matrix(self, country, method='pearson'):
+        i, mask, labels = self.available(country)
+        values = self.matrices(method)[i][np.ix_(mask, mask)]
+        return pd.DataFrame(values, index=labels, columns=labels)
+
+    # Bootstrap interval bounds and permutation p-values of one country's
+    # Pearson matrix, as frames labelled like matrix(); computed on first use
+    def significance(self, country, resamples=RESAMPLES):
+        i, mask, labels = self.available(country)
+        if (country, resamples) not in self._significance:
+            self._significance[(country, resamples)] = correlation_significance(self.cube[i], resamples)
+        return {name: pd.DataFrame(values[np.ix_(mask, mask)], index=labels, columns=labels)
+                for name, values in zip(['low', 'high', 'p'], self._significance[(country, resamples)])}
@@ -0,0 +1,231 @@
+import itertools
+import os
+import re
+
+import pandas as pd
+
+import instrumentation
+from correlations import CorrelationEngine
+from derived import PER_CAPITA_GROWTH, DerivedEngine
+from figure_cache import FigureCache
+from instrumentation import cache_resource, timed
+from panel import IndicatorPanel
+from weo_sample import SUBJECTS, add_us_trade_series, build_sample_panel, build_sample_trade
+
+# Set WEO_EXPORT_PATH to a local IMF WEO tab-delimited export to load it instead of the sample values
+WEO_EXPORT_PATH = os.environ.get('WEO_EXPORT_PATH')
+
+# Set WEO_VINTAGES_DIR to a folder of WEO exports from successive releases
+# (e.g. WEOApr2024all.xls, WEOOct2024all.xls) to compare their estimates
+WEO_VINTAGES_DIR = os.environ.get('WEO_VINTAGES_DIR')
+
+# Set TRADE_DATA_PATH to a U.S. bilateral trade CSV at HS-6 level (a U.S. Census
+# Bureau or UN Comtrade download), or a folder of them, to compute the Trump
+# Effect trade figures from it instead of the sample values
+TRADE_DATA_PATH = os.environ.get('TRADE_DATA_PATH')
+TRADE_PARTNERS = ['Denmark', 'India']
+
+# Source of the tokens load_trade gives each trade aggregate
+_trade_tokens = itertools.count()
+
+# Resources built from a panel or trade aggregate are cached per object, keyed
+# by its token rather than by hashing its contents
+BY_TOKEN = {IndicatorPanel: lambda panel: panel.token, pd.DataFrame: lambda frame: frame.attrs['token']}
+
+# GDP Analysis columns, named '<Country>_<suffix>': suffix -> (subject, units)
+GDP_TABLE_COLUMNS = {
+    'GDP_growth': ('Gross domestic product, constant prices', 'Percent change'),
+    'GDP_current_prices_bn': ('Gross domestic product, current prices', 'National currency'),
+    'GDP_current_USD_bn': ('Gross domestic product, current prices', 'U.S. dollars'),
+    'GDP_per_capita_constant': ('Gross domestic product per capita, constant prices', 'National currency'),
+    'per_capita_growth': PER_CAPITA_GROWTH[:2],
+}
+
+# Derived-indicator engine kept across panel loads, so a reload only
+# recomputes the formulas whose inputs changed
+@cache_resource
+def derived_engine():
+    return DerivedEngine()
+
+# Function to load data, with the derived series added once per load
+@cache_resource
+def load_panel():
+    if WEO_EXPORT_PATH:
+        # Imported here so the sample-data path skips the ingest and Arrow IPC modules
+        from panel_cache import cached_panel
+        from weo_ingest import load_weo_panel
+
+        # Served from the memory-mapped disk cache unless the export or loader changed
+        panel = cached_panel([WEO_EXPORT_PATH], lambda: load_weo_panel(WEO_EXPORT_PATH, subjects=SUBJECTS), SUBJECTS)
+    else:
+        panel = build_sample_panel()
+    if TRADE_DATA_PATH:
+        from trade_ingest import us_trade_series
+
+        years, series = us_trade_series(load_trade())
+        panel = add_us_trade_series(panel, series, years)
+    else:
+        panel = add_us_trade_series(panel)
+    return derived_engine().apply(panel)
+
+# U.S. trade with TRADE_PARTNERS by year, partner, flow and HS-6 product,
+# aggregated from the files at TRADE_DATA_PATH once and then served from the
+# on-disk cache until they change, or the sample composition otherwise
+@cache_resource
+def load_trade():
+    if not TRADE_DATA_PATH:
+        trade = build_sample_trade()
+    else:
+        from panel_cache import cached_frame
+        from trade_ingest import load_trade_aggregate, trade_files
+
+        paths = trade_files(TRADE_DATA_PATH)
+        trade = cached_frame(paths, lambda: load_trade_aggregate(paths, TRADE_PARTNERS), TRADE_PARTNERS, name='trade')
+    trade.attrs['token'] = next(_trade_tokens)
+    return trade
+
+# Every WEO vintage, oldest first: the exports in WEO_VINTAGES_DIR, each read
+# through the panel cache, or otherwise just the loaded panel
+@cache_resource(hash_funcs=BY_TOKEN)
+def vintage_store(panel):
+    from vintages import VintageStore, vintage_files
+
+    store = VintageStore()
+    if not WEO_VINTAGES_DIR:
+        store.add('Current data', panel)
+        return store
+
+    from panel_cache import cached_panel
+    from weo_ingest import load_weo_panel
+
+    engine = DerivedEngine()
+    for name, path in vintage_files(WEO_VINTAGES_DIR):
+        vintage = cached_panel([path], lambda: load_weo_panel(path, subjects=SUBJECTS), SUBJECTS,
+                               name='vintage-' + re.sub(r'[^a-z0-9]+', '-', name.lower()))
+        store.add(name, engine.apply(vintage))
+    return store
+
+# A country's n largest export categories to the U.S. (HS chapters) by share
+# of its exports there in the latest trade year
+def get_export_categories(country, n=5):
+    from trade_ingest import top_categories
+
+    return top_categories(load_trade(), country, n=n)
+
+# Tariff scenario simulator over each trade partner's exports to the U.S. by
+# sector, built once per trade load
+@cache_resource(hash_funcs=BY_TOKEN)
+def tariff_simulator(trade):
+    from tariffs import TariffSimulator, sector_exports
+
+    return TariffSimulator(TRADE_PARTNERS, *sector_exports(trade, TRADE_PARTNERS))
+
+# Look up one series through the panel's prebuilt (country, indicator, units) index
+def get_indicator_data(panel, country, indicator, units=None):
+    with timed('lookup', f'{country}: {indicator}'):
+        return panel.series_frame(country, indicator, units)
+
+# Year column plus one column per country for one indicator
+def get_indicator_table(panel, indicator, units=None, countries=('Denmark', 'India')):
+    countries, years, values = panel.pivot(indicator, units, countries)
+    table = pd.DataFrame(values.T, columns=countries)
+    table.insert(0, 'Year', years)
+    return table
+
+# get_indicator_table built once per panel load and arguments, for the pages
+# that redraw from it on every rerun. Callers must not modify the frame.
+@cache_resource(hash_funcs=BY_TOKEN)
+def indicator_table(panel, indicator, units=None, countries=('Denmark', 'India')):
+    return get_indicator_table(panel, indicator, units, countries)
+
+# Wide table behind the GDP Analysis charts, built once per panel load
+@cache_resource(hash_funcs=BY_TOKEN)
+def gdp_table(panel, countries=('Denmark', 'India')):
+    countries, years, cube = panel.cube(list(GDP_TABLE_COLUMNS.values()), countries)
+    columns = {'Year': years}
+    for k, suffix in enumerate(GDP_TABLE_COLUMNS):
+        for i, country in enumerate(countries):
+            columns[f'{country}_{suffix}'] = cube[i, :, k]
+    return pd.DataFrame(columns)
+
+# Latest value, previous value and delta of every series, computed once per panel load
+@cache_resource(hash_funcs=BY_TOKEN)
+def latest_snapshot(panel):
+    return panel.latest()
+
+# Correlation matrices for every country, computed once per panel load
+@cache_resource(hash_funcs=BY_TOKEN)
+def correlation_engine(panel):
+    return CorrelationEngine(panel)
+
+# Helper function to calculate correlation between indicators
+def calculate_correlations(panel, country, method='pearson'):
+    return correlation_engine(panel).matrix(country, method)
+
+# Bootstrap intervals ('low', 'high') and permutation p-values ('p') of one
+# country's Pearson matrix, computed once per country and panel load
+def calculate_significance(panel, country):
+    with timed('significance', country):
+        return correlation_engine(panel).significance(country)
+
+# AR and exponential-smoothing forecasts shared by every session, kept by
+# series fingerprint so reloads and releases only refit changed series
+@cache_resource
+def forecaster():
+    from forecasting import Forecaster
+
+    return Forecaster()
+
+# Forecasts of one indicator for a few countries: country -> (years, mean, lower, upper)
+def get_forecasts(panel, indicator, units, countries=('Denmark', 'India'), method='ar'):
+    keys = [(country, indicator, units) for country in countries]
+    with timed('forecast', f'{indicator} ({method})'):
+        forecasts = forecaster().forecast(panel, keys, method)
+    return {key[0]: forecast for key, forecast in forecasts.items() if forecast is not None}
+
+# Serialised figures shared by every session, so identical views are built once
+@cache_resource
+def figure_cache():
+    cache = FigureCache()
+    if instrumentation.ENABLED:
+        cache.listeners.append(instrumentation.figure_listener)
+    return cache
+
+# Update a cached latest_snapshot frame in place for the series a release
+# changed, or drop it when the release added series it does not have a row for
+def _refresh_snapshot(panel, keys):
+    snapshot = latest_snapshot(panel)
+    update = panel.latest(panel.rows(keys))
+    positions = snapshot.index.get_indexer(update.index)
+    if len(update) < len(keys) or (positions < 0).any():
+        latest_snapshot.clear()
+        return
+    for j, column in enumerate(update.columns):
+        snapshot.iloc[positions, j] = update[column].array
+
+# Merge a WEO release into the loaded panel in place (see IndicatorPanel.upsert)
+# and refresh what was built from the series it changed: derived series, the
+# latest snapshot, GDP and indicator tables, correlation matrices of the
+# affected countries, the 'Current data' vintage and cached figures that read
+# a changed series. Everything else stays cached.
+# Returns the changed (Country, Subject Descriptor, Units) keys, derived ones
+# included.
+def apply_release(keys, years, values):
+    panel = load_panel()
+    with timed('release', f'{len(keys)} series'):
+        changed = panel.upsert(keys, years, values)
+        changed += derived_engine().update(panel, changed)
+        if not changed:
+            return changed
+
+        _refresh_snapshot(panel, changed)
+        if any(key[1:] in GDP_TABLE_COLUMNS.values() for key in changed):
+            gdp_table.clear()
+        indicator_table.clear()
+        if not correlation_engine(panel).update(panel, changed):
+            correlation_engine.clear()
+        if not WEO_VINTAGES_DIR:
+            # The only vintage is the panel itself, as it was before the release
+            vintage_store.clear()
+        figure_cache().invalidate(panel.token, changed)
+    return changed
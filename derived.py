@@ -0,0 +1,179 @@
+import hashlib
+
+import numpy as np
+
+
+# Year-on-year percent change along the year axis of a (countries, years) block;
+# the first year and any year after a gap are NaN
+def percent_change(values):
+    change = np.full_like(values, np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        change[:, 1:] = (values[:, 1:] / values[:, :-1] - 1) * 100
+    return change
+
+
+# A derived indicator: `func` maps one (countries, years) block per input
+# (subject, units) to the output block, for every country at once
+class Formula:
+    def __init__(self, output, inputs, func):
+        self.output = output                # (Subject Descriptor, Units, Scale)
+        self.inputs = list(inputs)          # [(Subject Descriptor, Units), ...]
+        self.func = func
+
+    @property
+    def key(self):
+        return self.output[:2]
+
+    def __repr__(self):
+        return f'<Formula {self.func.__name__}: {self.key} <- {self.inputs}>'
+
+
+# Named derived indicators and the dependency graph between them. Formulas may
+# read base panel series or the outputs of other formulas.
+class FormulaRegistry:
+    def __init__(self):
+        self.formulas = {}  # (subject, units) -> Formula
+
+    # Decorator registering a function of the input blocks as a derived indicator
+    def formula(self, output, inputs):
+        def register(func):
+            formula = Formula(output, inputs, func)
+            if formula.key in self.formulas:
+                raise ValueError(f'{formula.key} is already defined by {self.formulas[formula.key]!r}')
+            self.formulas[formula.key] = formula
+            return func
+        return register
+
+    # Formulas in dependency order; raises ValueError on a cycle
+    def order(self):
+        ordered, state = [], {}
+
+        def visit(key, path):
+            if state.get(key) == 'done':
+                return
+            if state.get(key) == 'visiting':
+                raise ValueError(f'Derived indicators depend on each other: {" -> ".join(map(str, path + [key]))}')
+            state[key] = 'visiting'
+            for dependency in self.formulas[key].inputs:
+                if dependency in self.formulas:
+                    visit(dependency, path + [key])
+            state[key] = 'done'
+            ordered.append(self.formulas[key])
+
+        for key in self.formulas:
+            visit(key, [])
+        return ordered
+
+
+FORMULAS = FormulaRegistry()
+
+PER_CAPITA_LEVEL = ('Gross domestic product per capita, constant prices', 'National currency')
+PER_CAPITA_GROWTH = ('Gross domestic product per capita, constant prices', 'Percent change', 'Units')
+US_TRADE_BALANCE = ('U.S. goods trade balance', 'U.S. dollars', 'Billions')
+
+
+@FORMULAS.formula(PER_CAPITA_GROWTH, [PER_CAPITA_LEVEL])
+def per_capita_growth(level):
+    return percent_change(level)
+
+
+# Billions of dollars over millions of people, in dollars per person
+@FORMULAS.formula(('Gross domestic product per capita, current prices', 'U.S. dollars', 'Units'),
+                  [('Gross domestic product, current prices', 'U.S. dollars'), ('Population', 'Persons')])
+def gdp_per_capita_usd(gdp, population):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return gdp / population * 1000
+
+
+@FORMULAS.formula(('Gross domestic product, deflator', 'Percent change', 'Units'),
+                  [('Gross domestic product, deflator', 'Index')])
+def deflator_inflation(deflator):
+    return percent_change(deflator)
+
+
+@FORMULAS.formula(US_TRADE_BALANCE, [('U.S. goods exports', 'U.S. dollars'), ('U.S. goods imports', 'U.S. dollars')])
+def us_trade_balance(exports, imports):
+    return exports - imports
+
+
+# Evaluates a registry against panels and keeps each formula's result with a
+# fingerprint of the input blocks it was computed from. Applying it to a panel
+# where some base series changed recomputes only the formulas whose inputs
+# differ; a dependent formula reruns only if an output it reads changed.
+# update() does the same for a panel revised in place by upsert().
+class DerivedEngine:
+    def __init__(self, registry=FORMULAS):
+        self.registry = registry
+        self._results = {}       # (subject, units) -> (fingerprint, block over all countries)
+        self.recomputed = []     # keys evaluated by the last apply()
+        self.owned = set()       # (country, subject, units) series this engine wrote
+
+    @staticmethod
+    def _fingerprint(countries, years, blocks):
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((list(countries), years.tolist())).encode())
+        for block in blocks:
+            digest.update(np.ascontiguousarray(block).tobytes())
+        return digest.digest()
+
+    # Blocks of every formula output for `panel`, shape (countries, years), in
+    # dependency order
+    def evaluate(self, panel):
+        countries = list(panel.categories['Country'])
+        outputs, self.recomputed = {}, []
+        for formula in self.registry.order():
+            base = [key for key in formula.inputs if key not in outputs]
+            _, years, cube = panel.cube(base, countries)
+            base_blocks = dict(zip(base, np.moveaxis(cube, 2, 0)))
+            blocks = [outputs[key] if key in outputs else base_blocks[key] for key in formula.inputs]
+
+            fingerprint = self._fingerprint(countries, years, blocks)
+            cached = self._results.get(formula.key)
+            if cached is None or cached[0] != fingerprint:
+                cached = (fingerprint, np.asarray(formula.func(*blocks), dtype=np.float64))
+                self._results[formula.key] = cached
+                self.recomputed.append(formula.key)
+            outputs[formula.key] = cached[1]
+        return countries, outputs
+
+    # Panel with every derived series added for each country that has any
+    # value for it. Series the panel already holds (e.g. from the WEO export)
+    # are kept rather than overwritten.
+    def apply(self, panel):
+        countries, outputs = self.evaluate(panel)
+        keys, rows = [], []
+        for formula in self.registry.order():
+            block = outputs[formula.key]
+            for i in np.flatnonzero(~np.isnan(block).all(axis=1)):
+                if panel.series(countries[i], *formula.key) is None:
+                    keys.append((countries[i],) + formula.output)
+                    rows.append(block[i])
+        self.owned.update(key[:3] for key in keys)
+        return panel.extend(keys, rows) if keys else panel
+
+    # Bring the derived series of a panel up to date after panel.upsert()
+    # changed the (country, subject, units) `keys`: only the formulas reading
+    # a changed series are evaluated, only for the countries concerned, and
+    # their outputs are upserted in turn. Returns the derived keys that changed.
+    def update(self, panel, keys):
+        changed = list(keys)
+        self.recomputed = []
+        for formula in self.registry.order():
+            countries = list(dict.fromkeys(country for country, subject, units in changed
+                                           if (subject, units) in formula.inputs))
+            if not countries:
+                continue
+            _, _, cube = panel.cube(formula.inputs, countries)
+            block = np.asarray(formula.func(*np.moveaxis(cube, 2, 0)), dtype=np.float64)
+            self.recomputed.append(formula.key)
+
+            release, rows = [], []
+            for country, values in zip(countries, block):
+                key = (country,) + formula.key
+                if key in self.owned or (panel.series(*key) is None and not np.isnan(values).all()):
+                    self.owned.add(key)
+                    release.append((country,) + formula.output)
+                    rows.append(values)
+            if release:
+                changed += panel.upsert(release, panel.years, rows)
+        return changed[len(keys):]
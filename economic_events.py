@@ -0,0 +1,48 @@
+# Define key economic events for the timeline
+economic_events = {
+    2014: {
+        "Global": "Oil prices crash from over $100 to under $50 per barrel",
+        "India": "Modi government elected, 'Make in India' initiative launched",
+        "Denmark": "Economic recovery strengthens post-financial crisis"
+    },
+    2016: {
+        "Global": "Brexit referendum; Donald Trump elected US President",
+        "India": "Demonetization policy implemented",
+        "Denmark": "Negative interest rates policy continued by central bank"
+    },
+    2017: {
+        "Global": "Global synchronized growth",
+        "India": "Implementation of Goods and Services Tax (GST)",
+        "Denmark": "Strong export performance drives economic growth"
+    },
+    2019: {
+        "Global": "US-China trade tensions; Global manufacturing slowdown",
+        "India": "Corporate tax rate cuts to boost investment",
+        "Denmark": "Danish economy showing signs of slowing"
+    },
+    2020: {
+        "Global": "COVID-19 pandemic and global lockdowns",
+        "India": "Strict national lockdown; Major economic contraction",
+        "Denmark": "Implementation of major fiscal support packages"
+    },
+    2021: {
+        "Global": "Global recovery begins; Supply chain disruptions",
+        "India": "Second COVID wave; Vaccination drive begins",
+        "Denmark": "Strong economic rebound aided by fiscal support"
+    },
+    2022: {
+        "Global": "Russia-Ukraine conflict; Energy crisis; Global inflation surge",
+        "India": "RBI begins rate hike cycle to combat inflation",
+        "Denmark": "Energy price shock impacts Danish economy"
+    },
+    2023: {
+        "Global": "Persistent inflation; Central banks tighten monetary policy",
+        "India": "Resilient growth despite global headwinds",
+        "Denmark": "Inflation pressures begin to moderate"
+    },
+    2024: {
+        "Global": "Monetary policy normalization; Focus on debt sustainability",
+        "India": "Infrastructure push continues; Manufacturing focus",
+        "Denmark": "Return to more balanced economic growth"
+    }
+}
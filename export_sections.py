@@ -0,0 +1,152 @@
+# Headless export of every chart and table the dashboard sections draw.
+#
+#     python -m export_sections OUT_DIR [--format html|json] [--workers N] [--sections overview gdp ...]
+#
+# Each section's page script is rendered with Streamlit's AppTest in a worker
+# process, so the export is exactly what a reader sees with the default widget
+# values. Figures are taken from the chart specs the page sent and written as
+# standalone HTML pages that share one plotly.min.js in OUT_DIR (or as figure
+# JSON); dataframes are written as HTML tables. Sections run in parallel.
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from app_pages import SECTIONS
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TIMEOUT = 120
+
+HEADING_CLASSES = ('sub-header', 'section-header')
+
+
+# Lowercase, dash-separated file name fragment
+def slug(text, limit=60):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')[:limit].rstrip('-') or 'untitled'
+
+
+# Plain text of a markdown element if it is a heading (markdown '#' or one of
+# the dashboard's header divs), otherwise None
+def _heading(markdown):
+    text = markdown.strip()
+    if text.startswith('#'):
+        return text.lstrip('#').strip()
+    if text.startswith('<') and any(f'class="{name}"' in text for name in HEADING_CLASSES):
+        return re.sub(r'<[^>]+>', '', text).strip()
+    return None
+
+
+# Walk an AppTest element tree in display order
+def iter_elements(node):
+    for child in getattr(node, 'children', {}).values():
+        yield child
+        yield from iter_elements(child)
+
+
+# Run one page script headlessly and return the finished AppTest
+def render_section(path):
+    from streamlit import logger as streamlit_logger
+    from streamlit.testing.v1 import AppTest
+
+    streamlit_logger.set_log_level('error')
+    at = AppTest.from_file(os.path.join(ROOT, path), default_timeout=TIMEOUT)
+    at.run()
+    return at
+
+
+# Render one page script and return its charts and tables in display order as
+# (kind, name, payload): ('figure', title, figure JSON) or ('table', heading,
+# DataFrame), plus the text of any exception the page raised
+def capture_section(path):
+    at = render_section(path)
+    items, heading = [], ''
+    for element in iter_elements(at.main):
+        if element.type == 'markdown':
+            heading = _heading(element.value) or heading
+        elif element.type == 'plotly_chart':
+            spec = element.proto.spec
+            title = json.loads(spec).get('layout', {}).get('title', {})
+            title = title.get('text') if isinstance(title, dict) else title
+            items.append(('figure', title or heading, spec))
+        elif element.type in ('dataframe', 'table'):
+            items.append(('table', heading, element.value))
+    errors = [exception.value for exception in at.exception]
+    return items, errors
+
+
+def _write_figure(spec, path, fmt):
+    import plotly.io as pio
+
+    if fmt == 'json':
+        with open(path, 'w') as f:
+            f.write(spec)
+    else:
+        pio.write_html(json.loads(spec), path, include_plotlyjs='directory', full_html=True, validate=False)
+
+
+# Worker: render one section and write its items into out_dir. Returns the
+# section title, written file names, errors and seconds taken.
+def export_section(position, path, title, out_dir, fmt):
+    start = time.perf_counter()
+    items, errors = capture_section(path)
+    prefix = f'{position:02d}-{slug(title)}'
+    written = []
+    for number, (kind, name, payload) in enumerate(items, 1):
+        stem = f'{prefix}--{number:02d}-{slug(name or kind)}'
+        if kind == 'figure':
+            filename = f'{stem}.{fmt}'
+            _write_figure(payload, os.path.join(out_dir, filename), fmt)
+        else:
+            filename = f'{stem}.table.html'
+            payload.to_html(os.path.join(out_dir, filename))
+        written.append(filename)
+    return title, written, errors, time.perf_counter() - start
+
+
+# Export the selected sections (all by default) into out_dir in parallel
+def export_all(out_dir, fmt='html', workers=None, sections=None):
+    os.makedirs(out_dir, exist_ok=True)
+    if fmt == 'html':
+        from plotly.offline import get_plotlyjs
+
+        with open(os.path.join(out_dir, 'plotly.min.js'), 'w', encoding='utf-8') as f:
+            f.write(get_plotlyjs())
+
+    selected = [(position, path, title) for position, (path, title) in enumerate(SECTIONS, 1)
+                if not sections or os.path.splitext(os.path.basename(path))[0] in sections]
+    # Submitted by module name: under `python -m` this file is __main__, which
+    # AppTest replaces with each page script inside the workers
+    from export_sections import export_section as worker
+    with ProcessPoolExecutor(max_workers=workers or min(len(selected), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(worker, position, path, title, out_dir, fmt)
+                   for position, path, title in selected]
+        return [future.result() for future in futures]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export every section's charts and tables headlessly")
+    parser.add_argument('out_dir')
+    parser.add_argument('--format', choices=['html', 'json'], default='html')
+    parser.add_argument('--workers', type=int, help='worker processes (default: one per section, up to the CPU count)')
+    parser.add_argument('--sections', nargs='+', metavar='NAME',
+                        help='page script names to export, e.g. overview gdp (default: all)')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = export_all(args.out_dir, args.format, args.workers, args.sections)
+    failed = False
+    for title, written, errors, seconds in results:
+        print(f'{title:<26} {len(written):>3} files {seconds:>6.2f} s')
+        for error in errors:
+            failed = True
+            print(f'  raised: {error}')
+    print(f'{sum(len(written) for _, written, _, _ in results)} files in {args.out_dir} '
+          f'({time.perf_counter() - start:.1f} s)')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,168 @@
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from lazy import lazy_import
+from panel import track_reads
+
+go = lazy_import('plotly.graph_objects')
+pio = lazy_import('plotly.io')
+
+# Bounds of the shared figure cache: entries and total bytes of serialised JSON
+FIGURE_CACHE_ENTRIES = 256
+FIGURE_CACHE_BYTES = 64 * 1024 * 1024
+
+
+# Hashable, order-stable form of a chart argument. Objects carrying a `token`
+# (panels, correlation engines) are keyed by it rather than by their contents.
+# NaN is keyed as None: every NaN is unequal to every other, so a spec holding
+# one would never match itself.
+def _normalise(value):
+    if hasattr(value, 'token'):
+        return ('token', value.token)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _normalise(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_normalise(item) for item in value))
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(_normalise(item) for item in value)
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+
+# Cache key for one chart: its kind plus every argument, sorted by name
+def chart_spec(kind, **params):
+    return (kind,) + tuple(sorted((name, _normalise(value)) for name, value in params.items()))
+
+
+# Size-bounded LRU cache of serialised figures, keyed by chart_spec. Entries are
+# the figure's JSON, so a hit rebuilds a fresh Figure from it without running
+# the builder or Plotly's validation, and callers are free to mutate what they
+# get back. Safe to share across sessions (one lock around the bookkeeping).
+# Listeners are called as listener(kind, hit, seconds, nbytes) after each request.
+#
+# The panel series a builder reads are recorded with its entry, so when a
+# release revises some series invalidate() drops just the figures drawn from them.
+class FigureCache:
+    def __init__(self, max_entries=FIGURE_CACHE_ENTRIES, max_bytes=FIGURE_CACHE_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # spec -> figure JSON, least recently used first
+        self._reads = {}               # spec -> (token, country, subject, units) series it was built from
+        self._readers = {}             # (token, country, subject, units) -> specs built from it
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+        self.listeners = []
+
+    # Serialised figure for a spec, or None
+    def get_json(self, spec):
+        with self._lock:
+            payload = self._entries.get(spec)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(spec)
+            self.hits += 1
+            return payload
+
+    # Remove one entry; the caller holds the lock
+    def _drop(self, spec):
+        self._bytes -= len(self._entries.pop(spec))
+        for read in self._reads.pop(spec, ()):
+            readers = self._readers[read]
+            readers.discard(spec)
+            if not readers:
+                del self._readers[read]
+
+    # Store a figure under a spec, with the panel series it was built from,
+    # evicting least recently used entries until both bounds hold. Returns its JSON.
+    def put(self, spec, fig, reads=()):
+        payload = pio.to_json(fig, validate=False)
+        with self._lock:
+            if spec in self._entries:
+                self._drop(spec)
+            self._entries[spec] = payload
+            self._bytes += len(payload)
+            if reads:
+                self._reads[spec] = frozenset(reads)
+                for read in reads:
+                    self._readers.setdefault(read, set()).add(spec)
+            while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+        return payload
+
+    # Drop every figure built from one of the (country, subject, units) series
+    # of the panel with `token`. Returns how many were dropped.
+    def invalidate(self, token, keys):
+        with self._lock:
+            specs = set()
+            for key in keys:
+                specs |= self._readers.get((token,) + tuple(key), set())
+            for spec in specs:
+                self._drop(spec)
+            return len(specs)
+
+    # Figure for a spec, calling build() and caching its result on a miss
+    def figure(self, spec, build):
+        start = time.perf_counter()
+        payload = self.get_json(spec)
+        hit = payload is not None
+        if hit:
+            fig = go.Figure(json.loads(payload), _validate=False)
+        else:
+            with track_reads() as reads:
+                fig = build()
+            payload = self.put(spec, fig, reads)
+        for listener in self.listeners:
+            listener(spec[0], hit, time.perf_counter() - start, len(payload))
+        return fig
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._reads.clear()
+            self._readers.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+            }
+
+
+# Decorator for figure builders: calling the builder with cache=<FigureCache>
+# serves the figure from that cache, keyed by the builder's kind and all of its
+# arguments (defaults included). Without a cache it builds as usual.
+def cached_chart(kind):
+    def decorator(build):
+        signature = inspect.signature(build)
+
+        @functools.wraps(build)
+        def wrapper(*args, cache=None, **kwargs):
+            if cache is None:
+                return build(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            spec = chart_spec(kind, **bound.arguments)
+            return cache.figure(spec, lambda: build(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,207 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Models fitted to each series' latest run of consecutive observations
+AR_ORDER = 2
+HORIZON = 5
+BAND_Z = 1.96                 # 95% bands
+# Shorter series get no forecast from either model. AR(2) has three
+# coefficients, so it needs four regression rows (six observations) to leave
+# a residual degree of freedom for its bands.
+MIN_OBSERVATIONS = 6
+
+# Grid searched for exponential smoothing: level and trend smoothing weights
+SMOOTHING_GRID = [(alpha, beta) for alpha in np.linspace(0.1, 1.0, 10)
+                  for beta in np.linspace(0.0, 0.5, 6) if beta <= alpha]
+
+# Series per worker task, and the number of unfitted series below which a
+# batch is fitted in-process rather than over the process pool
+POOL_BATCH = 2000
+POOL_THRESHOLD = 4000
+
+# Fitted series kept per Forecaster, least recently used dropped first: two
+# methods for every series of the largest panels, with room for revisions
+MAX_RESULTS = 50_000
+
+
+# Right-align the latest run of consecutive observations of every row of a
+# (series, years) block: returns the (series, run length) block, NaN-padded on
+# the left, and the index in the original block of each row's last observation
+# (-1 for rows without any)
+def latest_runs(values):
+    observed = ~np.isnan(values)
+    n_years = values.shape[1]
+    last = np.where(observed.any(axis=1), n_years - 1 - observed[:, ::-1].argmax(axis=1), -1)
+    columns = np.arange(n_years)
+    # First year of the run: one after the last gap before `last`
+    gap = ~observed & (columns <= last[:, None])
+    first = np.where(gap.any(axis=1), n_years - gap[:, ::-1].argmax(axis=1), 0)
+    length = np.where(last >= 0, last - first + 1, 0)
+
+    width = max(int(length.max(initial=0)), 1)
+    offsets = np.arange(width) - width + 1           # -width+1 .. 0
+    take = last[:, None] + offsets
+    runs = np.take_along_axis(values, np.clip(take, 0, n_years - 1), axis=1)
+    runs[(offsets < -length[:, None] + 1) | (last[:, None] < 0)] = np.nan
+    return runs, last
+
+
+# AR(order) with intercept, fitted to every row of a right-aligned run block at
+# once by least squares on its own observations. Returns (series, horizon)
+# mean forecasts and standard errors.
+def fit_ar(runs, order=AR_ORDER, horizon=HORIZON):
+    n, width = runs.shape
+    if width <= order:
+        return np.full((n, horizon), np.nan), np.full((n, horizon), np.nan)
+    # Row t of the design is [1, y_{t-1}, ..., y_{t-order}] for target y_t
+    targets = runs[:, order:]
+    lags = np.stack([runs[:, order - k:width - k] for k in range(1, order + 1)], axis=-1)
+    design = np.concatenate([np.ones(lags.shape[:2] + (1,)), lags], axis=-1)
+    valid = ~np.isnan(targets) & ~np.isnan(lags).any(axis=-1)
+    design = np.where(valid[..., None], design, 0.0)
+    targets = np.where(valid, targets, 0.0)
+
+    n_obs = valid.sum(axis=1)
+    gram = np.einsum('ntk,ntl->nkl', design, design) + 1e-9 * np.eye(order + 1)
+    coefficients = np.linalg.solve(gram, np.einsum('ntk,nt->nk', design, targets)[..., None])[..., 0]
+    residuals = np.where(valid, targets - np.einsum('ntk,nk->nt', design, coefficients), 0.0)
+    sigma2 = (residuals ** 2).sum(axis=1) / np.maximum(n_obs - order - 1, 1)
+
+    # Recursive forecasts, and psi weights for their error variance
+    history = list(runs[:, -order:].T[::-1])            # y_T, y_{T-1}, ...
+    psi = [np.ones(n)]
+    mean = np.empty((n, horizon))
+    for h in range(horizon):
+        mean[:, h] = coefficients[:, 0] + sum(coefficients[:, k + 1] * history[k] for k in range(order))
+        history = [mean[:, h]] + history[:-1]
+        psi.append(sum(coefficients[:, k + 1] * psi[-1 - k] for k in range(min(len(psi), order))))
+    stderr = np.sqrt(sigma2[:, None] * np.cumsum(np.stack(psi[:horizon], axis=1) ** 2, axis=1))
+
+    unfit = (~np.isnan(runs)).sum(axis=1) < MIN_OBSERVATIONS
+    mean[unfit] = stderr[unfit] = np.nan
+    return mean, stderr
+
+
+# Additive-trend exponential smoothing (Holt's method in error-correction form)
+# for every row of a right-aligned run block and every (alpha, beta) of the
+# grid at once; each row keeps the pair with the smallest squared one-step
+# errors. Returns (series, horizon) mean forecasts and standard errors.
+def fit_smoothing(runs, horizon=HORIZON, grid=SMOOTHING_GRID):
+    n, width = runs.shape
+    alpha, beta = (np.array(weights)[None, :] for weights in zip(*grid))   # (1, grid)
+    start = np.where(np.isnan(runs).all(axis=1), width, np.isnan(runs).argmin(axis=1))[:, None]
+
+    level = np.zeros((n, len(grid)))
+    trend = np.zeros((n, len(grid)))
+    sse = np.zeros((n, len(grid)))
+    for t in range(width):
+        y = runs[:, t:t + 1]
+        error = y - (level + trend)
+        active = t >= start + 2
+        level_next = np.where(active, level + trend + alpha * error, level)
+        trend = np.where(active, trend + beta * error, trend)
+        level = level_next
+        sse += np.where(active, error ** 2, 0.0)
+        # The first two observations set the initial level and trend
+        trend = np.where(t == start + 1, y - level, trend)
+        level = np.where((t == start) | (t == start + 1), y, level)
+
+    best = sse.argmin(axis=1)
+    pick = lambda array: np.take_along_axis(array, best[:, None], axis=1)[:, 0]
+    level, trend, alpha, beta = pick(level), pick(trend), alpha[0, best], beta[0, best]
+    n_obs = width - start[:, 0]
+    sigma2 = pick(sse) / np.maximum(n_obs - 2, 1)
+
+    steps = np.arange(1, horizon + 1)
+    mean = level[:, None] + steps * trend[:, None]
+    # Variance of the h-step error: sigma^2 * (1 + sum_{j<h} (alpha + beta j)^2)
+    weights = (alpha[:, None] + beta[:, None] * np.arange(1, horizon)) ** 2
+    stderr = np.sqrt(sigma2[:, None] * (1 + np.concatenate([np.zeros((n, 1)), np.cumsum(weights, axis=1)], axis=1)))
+
+    unfit = n_obs < MIN_OBSERVATIONS
+    mean[unfit] = stderr[unfit] = np.nan
+    return mean, stderr
+
+
+METHODS = {'ar': fit_ar, 'smoothing': fit_smoothing}
+
+
+# Worker: mean forecasts and standard errors for a block of right-aligned runs
+def fit_batch(method, runs, horizon):
+    return METHODS[method](runs, horizon=horizon)
+
+
+# Forecasts for panel series, fitted in batches and kept by a fingerprint of
+# each series' observations, so an unchanged series is never refitted, even
+# across panel reloads or releases. Large batches are split over a process pool.
+# A forecast is (years, mean, lower, upper) over the `horizon` years after the
+# series' last observation, with BAND_Z standard-error bands.
+class Forecaster:
+    def __init__(self, horizon=HORIZON, workers=None, max_results=MAX_RESULTS):
+        self.horizon = horizon
+        self.workers = workers
+        self.max_results = max_results
+        self._results = OrderedDict()   # fingerprint -> (last year, mean, stderr), least recently used first
+        self._lock = threading.Lock()
+        self.fitted = 0             # series fitted by the last call
+
+    # Fingerprint of a series' run of observations and the year it ends in.
+    # The run is taken without the NaN padding latest_runs adds, which depends
+    # on the longest run of the batch rather than on the series.
+    @staticmethod
+    def _fingerprint(method, last_year, run):
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(method.encode())
+        digest.update(int(last_year).to_bytes(4, 'little', signed=True))
+        digest.update(run[~np.isnan(run)].tobytes())
+        return digest.digest()
+
+    def _fit(self, method, runs):
+        if len(runs) < POOL_THRESHOLD or self.workers == 1:
+            return fit_batch(method, runs, self.horizon)
+        batches = [runs[start:start + POOL_BATCH] for start in range(0, len(runs), POOL_BATCH)]
+        with ProcessPoolExecutor(max_workers=self.workers or min(len(batches), os.cpu_count() or 1)) as pool:
+            results = list(pool.map(fit_batch, [method] * len(batches), batches, [self.horizon] * len(batches)))
+        return np.concatenate([mean for mean, _ in results]), np.concatenate([stderr for _, stderr in results])
+
+    # Forecasts of the given (country, subject, units) keys (all series by
+    # default), fitting only those not seen before. Returns key -> forecast,
+    # or None for series too short to fit.
+    def forecast(self, panel, keys=None, method='ar'):
+        if keys is None:
+            keys = list(zip(panel.labels('Country').tolist(), panel.labels('Subject Descriptor').tolist(),
+                            panel.labels('Units').tolist()))
+        keys = [key for key in keys if panel.series(*key) is not None]
+        runs, last = latest_runs(panel.values[panel.rows(keys)])
+        last_years = np.where(last >= 0, panel.years[np.maximum(last, 0)], 0)
+        fingerprints = [self._fingerprint(method, last_years[i], runs[i]) for i in range(len(keys))]
+
+        with self._lock:
+            results = {fingerprint: self._results[fingerprint] for fingerprint in fingerprints
+                       if fingerprint in self._results}
+            for fingerprint in results:
+                self._results.move_to_end(fingerprint)
+        missing = [i for i, fingerprint in enumerate(fingerprints) if fingerprint not in results]
+        if missing:
+            mean, stderr = self._fit(method, runs[missing])
+            for i, row_mean, row_stderr in zip(missing, mean, stderr):
+                results[fingerprints[i]] = (int(last_years[i]), row_mean, row_stderr)
+            with self._lock:
+                for i in missing:
+                    self._results[fingerprints[i]] = results[fingerprints[i]]
+                while len(self._results) > self.max_results:
+                    self._results.popitem(last=False)
+        self.fitted = len(missing)
+
+        forecasts = {}
+        steps = np.arange(1, self.horizon + 1)
+        for key, fingerprint in zip(keys, fingerprints):
+            last_year, mean, stderr = results[fingerprint]
+            forecasts[key] = None if np.isnan(mean).all() else (
+                last_year + steps, mean, mean - BAND_Z * stderr, mean + BAND_Z * stderr)
+        return forecasts
@@ -0,0 +1,153 @@
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from lazy import lazy_import
+
+pio = lazy_import('plotly.io')
+
+# Opt in with DASHBOARD_METRICS=1. Setting DASHBOARD_METRICS_LOG to a file path
+# also turns it on and appends every event to that file as a JSON line.
+METRICS_LOG = os.environ.get('DASHBOARD_METRICS_LOG')
+ENABLED = bool(os.environ.get('DASHBOARD_METRICS') or METRICS_LOG)
+
+_lock = threading.Lock()
+_runs = {}        # session id -> events recorded since its last full rerun
+_local = threading.local()
+_log_file = None
+
+
+def _session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
+
+
+def _write(event):
+    global _log_file
+    if _log_file is None:
+        _log_file = open(METRICS_LOG, 'a', buffering=1)
+    _log_file.write(json.dumps(event) + '\n')
+
+
+# Start a new run for the current session; the sidebar shows events since then
+def start_run():
+    if ENABLED:
+        with _lock:
+            _runs[_session_id()] = []
+
+
+# Record one event: its kind (section, lookup, figure, cache, chart), a name,
+# optionally how long it took and any extra fields
+def record(kind, name, seconds=None, **fields):
+    if not ENABLED:
+        return
+    session = _session_id()
+    event = {'ts': round(time.time(), 3), 'session': session, 'kind': kind, 'name': name,
+             'ms': None if seconds is None else round(seconds * 1e3, 3), **fields}
+    with _lock:
+        _runs.setdefault(session, []).append(event)
+        if METRICS_LOG:
+            _write(event)
+
+
+@contextlib.contextmanager
+def _timed(kind, name, fields):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(kind, name, time.perf_counter() - start, **fields)
+
+
+# Context manager timing its body as one event; a no-op unless enabled
+def timed(kind, name, **fields):
+    return _timed(kind, name, fields) if ENABLED else contextlib.nullcontext()
+
+
+# st.cache_resource that records whether each call was a hit or a miss. Use
+# as @cache_resource, or @cache_resource(hash_funcs=...) to key arguments
+# by something cheaper than their contents.
+def cache_resource(func=None, *, hash_funcs=None):
+    if func is None:
+        return functools.partial(cache_resource, hash_funcs=hash_funcs)
+    if not ENABLED:
+        return st.cache_resource(func, hash_funcs=hash_funcs)
+
+    @functools.wraps(func)
+    def build(*args, **kwargs):
+        _local.missed = True  # Only runs when the cache has no entry
+        return func(*args, **kwargs)
+
+    cached = st.cache_resource(build, hash_funcs=hash_funcs)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        outer, _local.missed = getattr(_local, 'missed', False), False
+        start = time.perf_counter()
+        try:
+            return cached(*args, **kwargs)
+        finally:
+            record('cache', func.__name__, time.perf_counter() - start, hit=not _local.missed)
+            _local.missed = outer
+
+    wrapper.clear = cached.clear
+    return wrapper
+
+
+# FigureCache listener: one event per cached chart request
+def figure_listener(kind, hit, seconds, nbytes):
+    record('figure', kind, seconds, hit=hit, bytes=nbytes)
+
+
+# Time every st.plotly_chart call and record the size of the figure JSON it
+# sends. Measuring the size serialises the figure a second time, which is only
+# paid while instrumentation is on. Only the public st.plotly_chart is wrapped:
+# the pages call it inside `with column:` blocks rather than on containers.
+def install():
+    if not ENABLED or getattr(st.plotly_chart, '_instrumented', False):
+        return
+    plotly_chart = st.plotly_chart
+
+    @functools.wraps(plotly_chart)
+    def instrumented_plotly_chart(figure_or_data, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return plotly_chart(figure_or_data, *args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            title = getattr(getattr(getattr(figure_or_data, 'layout', None), 'title', None), 'text', None)
+            record('chart', title or type(figure_or_data).__name__, seconds,
+                   bytes=len(pio.to_json(figure_or_data, validate=False)))
+
+    instrumented_plotly_chart._instrumented = True
+    st.plotly_chart = instrumented_plotly_chart
+
+
+# Sidebar expander summarising this session's latest run
+def render_sidebar(figure_stats=None):
+    if not ENABLED:
+        return
+    with _lock:
+        events = pd.DataFrame(_runs.get(_session_id(), []))
+    with st.sidebar.expander('Debug: render metrics'):
+        if events.empty:
+            st.caption('No events recorded yet.')
+            return
+        for kind, group in events.groupby('kind', sort=False):
+            line = f'**{kind}**: {len(group)} events, {group["ms"].sum():.1f} ms'
+            if 'hit' in group and group['hit'].notna().any():
+                line += f', {int(group["hit"].sum())} hits / {int((group["hit"] == False).sum())} misses'
+            if 'bytes' in group and group['bytes'].notna().any():
+                line += f', {group["bytes"].sum() / 1024:.1f} KiB'
+            st.markdown(line)
+        if figure_stats is not None:
+            st.caption('Figure cache: {hits} hits, {misses} misses, {entries} entries, {bytes} bytes'.format(**figure_stats))
+        columns = [column for column in ['kind', 'name', 'ms', 'hit', 'bytes'] if column in events]
+        st.dataframe(events[columns].sort_values('ms', ascending=False), hide_index=True)
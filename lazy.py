@@ -0,0 +1,30 @@
+import importlib
+import threading
+import types
+
+# Serialises first accesses, so only one thread runs a module's import
+_lock = threading.Lock()
+
+
+# Stand-in for a module that is imported on its first attribute access. The
+# import goes through the regular import system, whose module locks make
+# concurrent first accesses from session threads wait for a fully initialised
+# module instead of seeing a partial one.
+class _LazyModule(types.ModuleType):
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__['_module'] = None
+
+    def __getattr__(self, attr):
+        module = self.__dict__['_module']
+        if module is None:
+            with _lock:
+                module = self.__dict__['_module'] or importlib.import_module(self.__name__)
+                self.__dict__['_module'] = module
+        return getattr(module, attr)
+
+
+# Module object whose import runs on first attribute access, so heavy plotting
+# libraries are only paid for by the sections that actually draw with them
+def lazy_import(name):
+    return _LazyModule(name)
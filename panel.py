@@ -0,0 +1,377 @@
+import contextlib
+import itertools
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Long-format columns the dashboard helpers work with
+DIMENSIONS = ['Country', 'Subject Descriptor', 'Units', 'Scale']
+COLUMNS = DIMENSIONS + ['Year', 'Value']
+
+
+# Source of IndicatorPanel.token values
+_tokens = itertools.count()
+
+# Spare capacity reserved when a panel first grows in place, as a fraction of
+# its current rows and years, so later releases usually fit without a copy
+SPARE_CAPACITY = 0.25
+
+_reads = threading.local()
+
+
+# Collect the (token, country, subject, units) series read from any panel by
+# this thread inside the block, e.g. while building a cached figure, so caches
+# can later drop only the entries that read a revised series
+@contextlib.contextmanager
+def track_reads():
+    reads = set()
+    stack = _reads.__dict__.setdefault('stack', [])
+    stack.append(reads)
+    try:
+        yield reads
+    finally:
+        stack.pop()
+
+
+# Note reads of (country, subject, units) keys of the panel with `token` for
+# every enclosing track_reads() block; a no-op outside of one
+def record_reads(token, keys):
+    stack = getattr(_reads, 'stack', None)
+    if stack:
+        keys = [(token,) + tuple(key) for key in keys]
+        for reads in stack:
+            reads.update(keys)
+
+
+# Smallest signed integer type that can hold codes for n categories
+def _code_dtype(n):
+    return np.int16 if n < np.iinfo(np.int16).max else np.int32
+
+
+# Array-backed store for indicator series.
+# A series is one (Country, Subject Descriptor, Units) combination. Its dimension
+# labels are stored once as categories and referenced by small integer codes, and
+# its observations are one row of a dense float64 block (NaN where missing) laid
+# out against a shared int16 year axis.
+#
+# upsert() merges a new release into the panel in place. The arrays above are
+# then views into larger buffers with spare rows and years, so a release that
+# revises some series and adds a year costs time in proportion to its size.
+# Each series carries the panel revision that last changed it.
+class IndicatorPanel:
+    def __init__(self, categories, codes, years, values):
+        self.categories = categories  # dimension -> pd.Index of labels
+        self.codes = codes            # dimension -> integer code per series
+        self.years = years            # int16, ascending
+        self.values = values          # float64, shape (n_series, n_years)
+        self.token = next(_tokens)    # unique per panel, keys caches derived from it
+        self.revision = 0             # number of upserts applied
+        self.versions = np.zeros(len(values), dtype=np.int64)  # revision that last changed each series
+        self._buffers = None          # spare-capacity buffers behind the arrays, once grown in place
+        self._build_index()
+
+    # Column span between a row's first and last observation, (0, 0) if empty
+    def _spans(self, rows):
+        observed = ~np.isnan(self.values[rows])
+        has_data = observed.any(axis=1)
+        start = np.where(has_data, observed.argmax(axis=1), 0).tolist()
+        stop = np.where(has_data, self.n_years - observed[:, ::-1].argmax(axis=1), 0).tolist()
+        return start, stop
+
+    # Map every (Country, Subject Descriptor, Units) key to its row and to the
+    # span of columns between its first and last observation, so a lookup is a
+    # dictionary hit plus two array slices
+    def _build_index(self):
+        start, stop = self._spans(slice(None))
+        keys = zip(self.labels('Country'), self.labels('Subject Descriptor'), self.labels('Units'))
+        self._index = {key: (row, start[row], stop[row]) for row, key in enumerate(keys)}
+        self._units_index = {}
+        for country, subject, units in self._index:
+            self._units_index.setdefault((country, subject), []).append(units)
+
+    # Build from one key tuple (Country, Subject Descriptor, Units, Scale) per
+    # row of a (n_series, n_years) value block
+    @classmethod
+    def from_block(cls, keys, years, values):
+        columns = list(zip(*keys)) if len(keys) else [()] * len(DIMENSIONS)
+        categories, codes = {}, {}
+        for dim, labels in zip(DIMENSIONS, columns):
+            dim_codes, dim_categories = pd.factorize(np.asarray(labels, dtype=object))
+            categories[dim] = pd.Index(dim_categories, name=dim)
+            codes[dim] = dim_codes.astype(_code_dtype(len(dim_categories)))
+
+        years = np.asarray(years, dtype=np.int16)
+        values = np.asarray(values, dtype=np.float64).reshape(len(keys), len(years))
+        order = np.argsort(years, kind='stable')
+        return cls(categories, codes, years[order], np.ascontiguousarray(values[:, order]))
+
+    # Build from long-format arrays (one element per observation)
+    @classmethod
+    def from_arrays(cls, country, subject, units, scale, year, value):
+        country_codes, countries = pd.factorize(np.asarray(country, dtype=object))
+        subject_codes, subjects = pd.factorize(np.asarray(subject, dtype=object))
+        units_codes, units_labels = pd.factorize(np.asarray(units, dtype=object))
+        scale_codes, scales = pd.factorize(np.asarray(scale, dtype=object))
+
+        # One integer key per series, numbered in order of first appearance
+        series_key = (country_codes.astype(np.int64) * len(subjects) + subject_codes) * len(units_labels) + units_codes
+        row, series_keys = pd.factorize(series_key)
+        years, column = np.unique(np.asarray(year, dtype=np.int16), return_inverse=True)
+
+        values = np.full((len(series_keys), len(years)), np.nan)
+        values[row, column] = np.asarray(value, dtype=np.float64)
+
+        # Scale is an attribute of the series, so any of its rows will do
+        first_row = np.empty(len(series_keys), dtype=np.intp)
+        first_row[row[::-1]] = np.arange(len(row))[::-1]
+
+        categories = {
+            'Country': pd.Index(countries, name='Country'),
+            'Subject Descriptor': pd.Index(subjects, name='Subject Descriptor'),
+            'Units': pd.Index(units_labels, name='Units'),
+            'Scale': pd.Index(scales, name='Scale'),
+        }
+        codes = {
+            dim: dim_codes[first_row].astype(_code_dtype(len(categories[dim])))
+            for dim, dim_codes in zip(DIMENSIONS, (country_codes, subject_codes, units_codes, scale_codes))
+        }
+        return cls(categories, codes, years, values)
+
+    @classmethod
+    def from_frame(cls, df):
+        return cls.from_arrays(*(df[column].to_numpy() for column in COLUMNS))
+
+    # New panel with extra series on the same year axis, one key tuple
+    # (Country, Subject Descriptor, Units, Scale) per row of `values`
+    def extend(self, keys, values):
+        existing = list(zip(*(self.labels(dim) for dim in DIMENSIONS)))
+        values = np.asarray(values, dtype=np.float64).reshape(len(keys), self.n_years)
+        return IndicatorPanel.from_block(existing + list(keys), self.years, np.vstack([self.values, values]))
+
+    # Point the panel arrays at `n_rows` series and the year axis extended by
+    # `new_years`. Appended years and series use the spare capacity of the
+    # buffers; otherwise everything is copied into new buffers with room to
+    # spare. The first call always copies, which is also what makes a panel read
+    # from the memory-mapped cache writable. Returns True if existing years
+    # moved to other columns.
+    def _grow(self, n_rows, new_years):
+        n_years = self.n_years + len(new_years)
+        appended = not len(new_years) or not self.n_years or new_years[0] > self.years[-1]
+        buffers = self._buffers
+        if (buffers is None or not appended or n_rows > len(buffers['versions'])
+                or n_years > len(buffers['years'])):
+            years = np.union1d(self.years, new_years).astype(np.int16)
+            row_capacity = n_rows + int(n_rows * SPARE_CAPACITY) + 1
+            year_capacity = n_years + int(n_years * SPARE_CAPACITY) + 1
+            values = np.full((row_capacity, year_capacity), np.nan)
+            values[:self.n_series, np.searchsorted(years, self.years)] = self.values
+            buffers = {'values': values, 'years': np.zeros(year_capacity, dtype=np.int16),
+                       'versions': np.zeros(row_capacity, dtype=np.int64)}
+            buffers['years'][:n_years] = years
+            buffers['versions'][:self.n_series] = self.versions
+            for dim in DIMENSIONS:
+                buffers[dim] = np.zeros(row_capacity, dtype=self.codes[dim].dtype)
+                buffers[dim][:self.n_series] = self.codes[dim]
+            self._buffers = buffers
+        else:
+            buffers['years'][self.n_years:n_years] = new_years
+
+        self.values = buffers['values'][:n_rows, :n_years]
+        self.years = buffers['years'][:n_years]
+        self.versions = buffers['versions'][:n_rows]
+        self.codes = {dim: buffers[dim][:n_rows] for dim in DIMENSIONS}
+        return not appended
+
+    # Codes of `labels` in one dimension, adding any new labels as categories
+    def _encode(self, dim, labels):
+        categories = self.categories[dim]
+        missing = pd.Index(list(dict.fromkeys(labels)), dtype=object).difference(categories, sort=False)
+        if len(missing):
+            categories = self.categories[dim] = categories.append(missing).rename(dim)
+            if len(categories) >= np.iinfo(self._buffers[dim].dtype).max:
+                self._buffers[dim] = self._buffers[dim].astype(_code_dtype(len(categories)))
+                self.codes[dim] = self._buffers[dim][:self.n_series]
+        return categories.get_indexer(labels)
+
+    # Merge a release into the panel in place: one key tuple (Country, Subject
+    # Descriptor, Units, Scale) per row of a (len(keys), len(years)) block.
+    # Observations replace the panel's values for those years, NaN leaves them
+    # as they were, and unknown series and years are added. Returns the
+    # (Country, Subject Descriptor, Units) keys whose values changed, which get
+    # the new revision as their version; caches built from other series stay
+    # valid. Work is proportional to the release unless the panel's buffers
+    # have to grow.
+    def upsert(self, keys, years, values):
+        keys = [tuple(key) for key in keys]
+        if len({key[:3] for key in keys}) < len(keys):
+            raise ValueError('A release may only contain each series once')
+        years = np.asarray(years, dtype=np.int16)
+        values = np.asarray(values, dtype=np.float64).reshape(len(keys), len(years))
+
+        rows = np.array([self._index.get(key[:3], (-1,))[0] for key in keys], dtype=np.intp)
+        new = np.flatnonzero(rows < 0)
+        n_existing = self.n_series
+        moved = self._grow(n_existing + len(new), np.setdiff1d(years, self.years).astype(np.int16))
+        if len(new):
+            rows[new] = n_existing + np.arange(len(new))
+            for position, dim in enumerate(DIMENSIONS):
+                self.codes[dim][rows[new]] = self._encode(dim, [keys[i][position] for i in new])
+
+        columns = np.searchsorted(self.years, years)
+        block = self.values[np.ix_(rows, columns)]
+        merged = np.where(np.isnan(values), block, values)
+        changed = ((merged != block) & ~(np.isnan(merged) & np.isnan(block))).any(axis=1)
+        changed[new] = True
+        self.values[np.ix_(rows[changed], columns)] = merged[changed]
+
+        self.revision += 1
+        self.versions[rows[changed]] = self.revision
+        changed_keys = [keys[i][:3] for i in np.flatnonzero(changed)]
+        if moved:
+            self._build_index()
+        else:
+            start, stop = self._spans(rows[changed])
+            for key, row, first, last in zip(changed_keys, rows[changed].tolist(), start, stop):
+                self._index[key] = (row, first, last)
+            for i in new:
+                self._units_index.setdefault(keys[i][:2], []).append(keys[i][2])
+        return changed_keys
+
+    # Rows of (Country, Subject Descriptor, Units) keys in the value block
+    def rows(self, keys):
+        return np.array([self._index[tuple(key)][0] for key in keys], dtype=np.intp)
+
+    # Panel revision that last changed a series (0 if it has not changed since
+    # the panel was built), or None if it is absent
+    def version(self, country, subject, units):
+        entry = self._index.get((country, subject, units))
+        return None if entry is None else int(self.versions[entry[0]])
+
+    @property
+    def n_series(self):
+        return self.values.shape[0]
+
+    @property
+    def n_years(self):
+        return self.values.shape[1]
+
+    # Labels of one dimension for every series
+    def labels(self, dim):
+        return self.categories[dim].take(self.codes[dim])
+
+    # Year-sorted (years, values) views of one series, or None if it is absent
+    def series(self, country, subject, units):
+        entry = self._index.get((country, subject, units))
+        if entry is None:
+            return None
+        record_reads(self.token, [(country, subject, units)])
+        row, start, stop = entry
+        return self.years[start:stop], self.values[row, start:stop]
+
+    # Year-sorted Year/Value frame for one series, wrapping the panel arrays
+    # without copying. With units=None every series of the subject is included.
+    def series_frame(self, country, subject, units=None):
+        if units is None:
+            frames = [self.series_frame(country, subject, units)
+                      for units in self._units_index.get((country, subject), [])]
+            if len(frames) == 1:
+                return frames[0]
+            if frames:
+                return pd.concat(frames, ignore_index=True).sort_values(by='Year', kind='stable')
+            years, values = self.years[:0], self.values[0:0, 0]
+        else:
+            years, values = self.series(country, subject, units) or (self.years[:0], self.values[0:0, 0])
+        return pd.DataFrame({'Year': years, 'Value': values}, copy=False)
+
+    # Countries-by-years block of one indicator, gathered in a single take.
+    # Returns the countries found, the year axis trimmed to observed years and
+    # the (n_countries, n_years) values. With units=None each country's first
+    # series of the subject is used.
+    def pivot(self, subject, units, countries):
+        found, rows, keys = [], [], []
+        for country in countries:
+            series_units = units
+            if series_units is None:
+                series_units = next(iter(self._units_index.get((country, subject), [])), None)
+            entry = self._index.get((country, subject, series_units))
+            if entry is not None:
+                found.append(country)
+                rows.append(entry[0])
+                keys.append((country, subject, series_units))
+        record_reads(self.token, keys)
+
+        values = self.values[rows]
+        observed = np.flatnonzero(~np.isnan(values).all(axis=0))
+        if len(observed) == 0:
+            return found, self.years[:0], values[:, :0]
+        span = slice(observed[0], observed[-1] + 1)
+        return found, self.years[span], values[:, span]
+
+    # (country, year, indicator) block for a list of (subject, units) pairs,
+    # NaN where a country lacks a series. Defaults to every country.
+    def cube(self, indicators, countries=None):
+        countries = list(self.categories['Country'] if countries is None else countries)
+        rows = np.array([[self._index.get((country, subject, units), (-1,))[0]
+                          for subject, units in indicators] for country in countries], dtype=np.intp)
+        rows = rows.reshape(len(countries), len(indicators))
+        block = self.values[np.maximum(rows, 0)]
+        block[rows < 0] = np.nan
+        record_reads(self.token, [(country, subject, units) for country in countries for subject, units in indicators])
+        return countries, self.years, block.transpose(0, 2, 1)
+
+    # Latest observation of every series with the one before it: a frame indexed
+    # by (Country, Subject Descriptor, Units) with Year, Value, Previous Year,
+    # Previous Value and Delta (NaN when a series has fewer than two observations).
+    # Series without any observations are left out. `rows` limits it to some
+    # series, e.g. the ones a release changed.
+    def latest(self, rows=None):
+        rows = np.arange(self.n_series) if rows is None else np.asarray(rows, dtype=np.intp)
+        observed = ~np.isnan(self.values[rows])
+        keep = observed.any(axis=1)
+        rows, observed = rows[keep], observed[keep]
+        columns = np.arange(self.n_years)
+
+        last = self.n_years - 1 - observed[:, ::-1].argmax(axis=1)
+        earlier = observed & (columns < last[:, None])
+        has_previous = earlier.any(axis=1)
+        previous = np.where(has_previous, self.n_years - 1 - earlier[:, ::-1].argmax(axis=1), 0)
+
+        value = self.values[rows, last]
+        previous_value = np.where(has_previous, self.values[rows, previous], np.nan)
+        index = pd.MultiIndex.from_arrays([self.categories[dim].take(self.codes[dim][rows]) for dim in DIMENSIONS[:3]])
+        return pd.DataFrame({
+            'Year': self.years[last],
+            'Value': value,
+            'Previous Year': pd.arrays.IntegerArray(self.years[previous], ~has_previous),
+            'Previous Value': previous_value,
+            'Delta': value - previous_value,
+        }, index=index)
+
+    # Bytes held by each component of the panel
+    def memory_usage(self):
+        usage = {'values': self.values.nbytes, 'years': self.years.nbytes}
+        for dim in DIMENSIONS:
+            usage[f'{dim} codes'] = self.codes[dim].nbytes
+            usage[f'{dim} categories'] = self.categories[dim].memory_usage(deep=True)
+        return pd.Series(usage, name='bytes')
+
+    @property
+    def nbytes(self):
+        return int(self.memory_usage().sum())
+
+    # Long-format DataFrame with one row per non-missing observation.
+    # Dimension columns are categoricals that share the panel's codes.
+    def to_frame(self):
+        series, column = np.nonzero(~np.isnan(self.values))
+        data = {
+            dim: pd.Categorical.from_codes(self.codes[dim][series], categories=self.categories[dim])
+            for dim in DIMENSIONS
+        }
+        data['Year'] = self.years[column]
+        data['Value'] = self.values[series, column]
+        return pd.DataFrame(data)
+
+    def __repr__(self):
+        return (f'<IndicatorPanel: {self.n_series} series x {self.n_years} years, '
+                f'{len(self.categories["Country"])} countries, {self.nbytes / 1e6:.2f} MB>')
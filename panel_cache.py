@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from panel import DIMENSIONS, IndicatorPanel
+
+# Bump whenever the loaders produce different panels from the same source files
+LOADER_VERSION = 1
+
+CACHE_DIR = os.environ.get('PANEL_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.panel_cache'))
+
+
+# Fingerprint of the loader version, any loader arguments and the contents of
+# the source files. Content rather than mtime, so replicas built from the same
+# image agree on it.
+def fingerprint(paths, *loader_args, version=LOADER_VERSION):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'loader {version} {loader_args!r}'.encode())
+    for path in paths:
+        digest.update(os.path.basename(path).encode())
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+# Write a panel as an Arrow IPC file: one record per series, dimensions as
+# dictionary columns over the panel's codes and the observations as a
+# fixed-size list column, so the value block is stored exactly as laid out in
+# memory. Written to a temporary file first so readers never see a partial file.
+def write_panel(panel, path):
+    columns = {
+        dim: pa.DictionaryArray.from_arrays(panel.codes[dim], pa.array(panel.categories[dim].astype(str)))
+        for dim in DIMENSIONS
+    }
+    flat_values = pa.array(panel.values.ravel(), type=pa.float64())
+    columns['values'] = pa.FixedSizeListArray.from_arrays(flat_values, panel.n_years)
+    metadata = {'years': json.dumps(panel.years.tolist())}
+    table = pa.table(columns, metadata=metadata)
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with pa.OSFile(tmp_path, 'wb') as sink, ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+# write_panel stores a single record batch, so columns come back as one chunk
+def _array(column):
+    return column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+
+
+# Open a panel written by write_panel. The file is memory-mapped and the codes
+# and value block are read-only views into the mapping, not copies.
+def read_panel(path):
+    table = ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    years = np.array(json.loads(table.schema.metadata[b'years']), dtype=np.int16)
+
+    categories, codes = {}, {}
+    for dim in DIMENSIONS:
+        column = _array(table.column(dim))
+        categories[dim] = pd.Index(column.dictionary.to_pylist(), dtype=object, name=dim)
+        codes[dim] = column.indices.to_numpy(zero_copy_only=True)
+
+    flat_values = _array(table.column('values')).flatten().to_numpy(zero_copy_only=True)
+    return IndicatorPanel(categories, codes, years, flat_values.reshape(table.num_rows, len(years)))
+
+
+# Write a DataFrame as an Arrow IPC file, atomically as in write_panel.
+# Categorical columns are stored as dictionary columns.
+def write_frame(frame, path):
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with pa.OSFile(tmp_path, 'wb') as sink, ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+# Open a DataFrame written by write_frame from a memory mapping
+def read_frame(path):
+    return ipc.open_file(pa.memory_map(path, 'r')).read_all().to_pandas()
+
+
+# Return build() for `paths` from the cache file `name-<fingerprint>.arrow`
+# when it exists and `read` accepts it, otherwise by calling build() and
+# writing the result. Finished cache files of the same name for other
+# fingerprints are removed once the new one is written; other processes'
+# in-flight .tmp files are left for them to rename.
+def _cached(paths, build, read, write, loader_args, cache_dir, name):
+    key = fingerprint(paths, *loader_args)
+    path = os.path.join(cache_dir, f'{name}-{key}.arrow')
+    if os.path.exists(path):
+        try:
+            return read(path)
+        except (OSError, pa.ArrowInvalid, KeyError, ValueError):
+            pass  # Unreadable or partial cache file: rebuild it below
+
+    result = build()
+    try:
+        write(result, path)
+        for filename in os.listdir(cache_dir):
+            if (filename.endswith('.arrow') and filename.rsplit('-', 1)[0] == name
+                    and filename != os.path.basename(path)):
+                os.remove(os.path.join(cache_dir, filename))
+    except OSError:
+        pass  # A read-only cache directory only costs the next start a rebuild
+    return result
+
+
+# Return the panel for `paths`, from the on-disk cache when its fingerprint
+# matches and otherwise by calling build() and caching the result. `name` lets
+# several sources (e.g. WEO vintages) be cached side by side.
+def cached_panel(paths, build, *loader_args, cache_dir=CACHE_DIR, name='panel'):
+    return _cached(paths, build, read_panel, write_panel, loader_args, cache_dir, name)
+
+
+# The same for a DataFrame built from `paths`, such as an aggregate of source
+# files too large to re-read at every start
+def cached_frame(paths, build, *loader_args, cache_dir=CACHE_DIR, name='frame'):
+    return _cached(paths, build, read_frame, write_frame, loader_args, cache_dir, name)
@@ -0,0 +1,234 @@
+# Single-file HTML report of every dashboard section.
+#
+#     python -m report OUT.html [--workers N] [--sections overview gdp ...]
+#
+# Sections are rendered headlessly with AppTest in a process pool, as in
+# export_sections, and laid out in display order: headings, insight boxes,
+# metric cards, tables, the economic events timeline and every chart. plotly.js
+# is inlined once in the document head; each figure's JSON sits in an inert
+# <script type="application/json"> block and is only parsed and drawn when its
+# placeholder scrolls near the viewport, so the report opens quickly offline.
+import argparse
+import html
+import os
+import re
+import sys
+import textwrap
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from app_pages import SECTIONS
+from export_sections import render_section, slug
+from ui import APP_CSS, APP_INTRO, APP_TITLE_HTML
+
+DEFAULT_CHART_HEIGHT = 450
+
+REPORT_CSS = """
+<style>
+    body { font-family: "Source Sans Pro", Arial, sans-serif; max-width: 1200px; margin: 0 auto; padding: 1rem 2rem; color: #262730; }
+    nav ol { columns: 2; }
+    section.report-section { border-top: 1px solid #E5E7EB; padding-top: 1rem; margin-top: 2rem; }
+    .columns { display: flex; gap: 1.5rem; }
+    .column { flex: 1; min-width: 0; }
+    .tab-label { color: #2563EB; border-bottom: 2px solid #BFDBFE; padding-bottom: 0.3rem; }
+    .metric { margin-bottom: 0.8rem; }
+    .metric-label { font-size: 0.9rem; color: #4B5563; }
+    .metric-value { font-size: 1.8rem; }
+    .metric-delta { font-size: 0.9rem; color: #10B981; }
+    .widget { color: #6B7280; font-size: 0.85rem; }
+    .chart { width: 100%; }
+    details { margin-bottom: 0.8rem; }
+    table.dataframe { border-collapse: collapse; font-size: 0.85rem; margin-bottom: 1rem; }
+    table.dataframe td, table.dataframe th { border: 1px solid #E5E7EB; padding: 0.25rem 0.5rem; text-align: right; }
+</style>
+"""
+
+# Draws each chart the first time its placeholder comes within 300px of the viewport
+LAZY_PLOT_JS = """
+<script>
+const observer = new IntersectionObserver((entries) => {
+    for (const entry of entries) {
+        if (!entry.isIntersecting) continue;
+        const el = entry.target;
+        observer.unobserve(el);
+        const figure = JSON.parse(document.getElementById('figure-' + el.dataset.figure).textContent);
+        Plotly.newPlot(el, figure.data, figure.layout, {responsive: true}).then(() => {
+            if (figure.frames) Plotly.addFrames(el, figure.frames);
+        });
+    }
+}, {rootMargin: '300px'});
+document.querySelectorAll('.chart').forEach((el) => observer.observe(el));
+</script>
+"""
+
+INLINE_MARKDOWN = [
+    (re.compile(r'\*\*(.+?)\*\*'), r'<strong>\1</strong>'),
+    (re.compile(r'(?<![\*\w])\*(?!\s)(.+?)(?<!\s)\*'), r'<em>\1</em>'),
+    (re.compile(r'`([^`]+)`'), r'<code>\1</code>'),
+    (re.compile(r'\[([^\]]+)\]\(([^)\s]+)\)'), r'<a href="\2">\1</a>'),
+]
+HEADING = re.compile(r'^(#{1,6})\s+(.*)$')
+LIST_ITEM = re.compile(r'^\s*(?:[-*]|(\d+)\.)\s+(.*)$')
+
+
+def _inline(text):
+    for pattern, replacement in INLINE_MARKDOWN:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+# HTML for the markdown the pages write: raw HTML blocks are passed through,
+# otherwise headings, bullet and numbered lists, paragraphs and inline
+# bold/italic/code/links are converted
+def markdown_html(text):
+    text = textwrap.dedent(text).strip('\n')
+    if text.lstrip().startswith('<'):
+        return text
+
+    blocks, paragraph, items, ordered = [], [], [], False
+
+    def flush():
+        if paragraph:
+            blocks.append(f'<p>{_inline(" ".join(paragraph))}</p>')
+            paragraph.clear()
+        if items:
+            tag = 'ol' if ordered else 'ul'
+            blocks.append(f'<{tag}>' + ''.join(f'<li>{_inline(item)}</li>' for item in items) + f'</{tag}>')
+            items.clear()
+
+    for line in text.split('\n'):
+        heading, item = HEADING.match(line.strip()), LIST_ITEM.match(line)
+        if heading:
+            flush()
+            level = len(heading.group(1))
+            blocks.append(f'<h{level}>{_inline(heading.group(2))}</h{level}>')
+        elif item:
+            if paragraph:
+                flush()
+            ordered = item.group(1) is not None
+            items.append(item.group(2))
+        elif not line.strip():
+            flush()
+        else:
+            paragraph.append(line.strip())
+    flush()
+    return '\n'.join(blocks)
+
+
+def _children_html(node, figures, prefix):
+    return ''.join(_element_html(child, figures, prefix) for child in getattr(node, 'children', {}).values())
+
+
+# HTML for one AppTest element and its children. Chart specs are appended to
+# `figures` and replaced by placeholders whose ids start with `prefix`.
+def _element_html(node, figures, prefix):
+    kind = node.type
+    if kind == 'markdown':
+        return markdown_html(node.value)
+    if kind == 'plotly_chart':
+        figures.append(node.proto.spec)
+        height = re.search(r'"height":\s*(\d+)', node.proto.spec)
+        height = height.group(1) if height else DEFAULT_CHART_HEIGHT
+        return f'<div class="chart" data-figure="{prefix}-{len(figures)}" style="height:{height}px"></div>'
+    if kind in ('dataframe', 'table'):
+        return node.value.to_html(float_format=lambda value: f'{value:.3f}', na_rep='')
+    if kind == 'metric':
+        delta = f'<div class="metric-delta">{html.escape(node.delta)}</div>' if node.delta else ''
+        return (f'<div class="metric"><div class="metric-label">{html.escape(node.label)}</div>'
+                f'<div class="metric-value">{html.escape(node.value)}</div>{delta}</div>')
+    if kind == 'expander':
+        return f'<details open><summary>{_inline(node.label)}</summary>{_children_html(node, figures, prefix)}</details>'
+    if kind == 'tab':
+        return f'<h4 class="tab-label">{_inline(node.label)}</h4>{_children_html(node, figures, prefix)}'
+    if kind == 'column':
+        return f'<div class="column">{_children_html(node, figures, prefix)}</div>'
+    if kind == 'exception':
+        return f'<div class="warning-box">This section failed to render: {html.escape(node.value)}</div>'
+    if hasattr(node, 'label') and hasattr(node, 'value'):
+        # Widgets are shown with the value the section was rendered at
+        return f'<p class="widget">{html.escape(str(node.label))}: {html.escape(str(node.value))}</p>'
+    children = _children_html(node, figures, prefix)
+    if any(child.type == 'column' for child in getattr(node, 'children', {}).values()):
+        return f'<div class="columns">{children}</div>'
+    return children
+
+
+# Worker: render one section and return its title, body HTML, figure specs,
+# errors and seconds taken
+def section_report(position, path, title):
+    start = time.perf_counter()
+    at = render_section(path)
+    figures = []
+    body = _element_html(at.main, figures, position)
+    return title, body, figures, [exception.value for exception in at.exception], time.perf_counter() - start
+
+
+# The whole report as one HTML string
+def build_report(workers=None, sections=None):
+    from plotly.offline import get_plotlyjs
+
+    selected = [(position, path, title) for position, (path, title) in enumerate(SECTIONS, 1)
+                if not sections or os.path.splitext(os.path.basename(path))[0] in sections]
+    # Submitted by module name for the same reason as in export_sections
+    from report import section_report as worker
+    with ProcessPoolExecutor(max_workers=workers or min(len(selected), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(worker, position, path, title) for position, path, title in selected]
+        results = [(position, future.result()) for (position, _, _), future in zip(selected, futures)]
+
+    toc = ''.join(f'<li><a href="#{slug(title)}">{html.escape(title)}</a></li>' for _, (title, *_) in results)
+    sections_html, data_blocks, errors = [], [], []
+    for position, (title, body, figures, section_errors, _) in results:
+        sections_html.append(f'<section class="report-section" id="{slug(title)}">{body}</section>')
+        for number, spec in enumerate(figures, 1):
+            # '</' would end the script element early
+            payload = spec.replace('</', '<\\/')
+            data_blocks.append(f'<script type="application/json" id="figure-{position}-{number}">{payload}</script>')
+        errors.extend(f'{title}: {error}' for error in section_errors)
+
+    document = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Denmark-India Macroeconomic Dashboard report</title>
+{APP_CSS}
+{REPORT_CSS}
+<script>{get_plotlyjs()}</script>
+</head>
+<body>
+{APP_TITLE_HTML}
+{markdown_html(APP_INTRO)}
+<p class="guide-text">Static report generated {date.today().isoformat()}. Interactive controls are shown at their default values.</p>
+<nav><ol>{toc}</ol></nav>
+{''.join(sections_html)}
+{''.join(data_blocks)}
+{LAZY_PLOT_JS}
+</body>
+</html>
+"""
+    return document, results, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build a single-file HTML report of every dashboard section')
+    parser.add_argument('out')
+    parser.add_argument('--workers', type=int, help='worker processes (default: one per section, up to the CPU count)')
+    parser.add_argument('--sections', nargs='+', metavar='NAME',
+                        help='page script names to include, e.g. overview gdp (default: all)')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    document, results, errors = build_report(args.workers, args.sections)
+    with open(args.out, 'w', encoding='utf-8') as f:
+        f.write(document)
+
+    for _, (title, _, figures, _, seconds) in results:
+        print(f'{title:<26} {len(figures):>3} charts {seconds:>6.2f} s')
+    for error in errors:
+        print(f'raised: {error}')
+    print(f'wrote {args.out}: {len(document.encode()) / 1e6:.1f} MB in {time.perf_counter() - start:.1f} s')
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
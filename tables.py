@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Impact score buckets: scores up to 3 are low, up to 6 medium and above that high
+IMPACT_EDGES = [3, 6]
+IMPACT_STYLES = ['background-color: #c8e6c9; color: #1b5e20',   # Green
+                 'background-color: #fff9c4; color: #f57f17',   # Yellow
+                 'background-color: #ffcdd2; color: #b71c1c']   # Red
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+# CSS for every cell of a block of scores, assigned by bucket in one pass:
+# bucket i holds edges[i-1] < score <= edges[i]. Missing scores are unstyled.
+def bucket_styles(values, edges=IMPACT_EDGES, styles=IMPACT_STYLES):
+    values = np.asarray(values, dtype=np.float64)
+    lookup = np.array(list(styles) + [''], dtype=object)
+    buckets = np.digitize(values, edges, right=True)
+    buckets[np.isnan(values)] = len(lookup) - 1
+    return lookup[buckets]
+
+
+# Styler colouring the `columns` of a frame by bucket, computed for the whole
+# block at once rather than by a callback per cell
+def style_buckets(frame, columns, edges=IMPACT_EDGES, styles=IMPACT_STYLES):
+    def block_styles(block):
+        return pd.DataFrame(bucket_styles(block.to_numpy(dtype=np.float64, na_value=np.nan), edges, styles),
+                            index=block.index, columns=block.columns)
+    return frame.style.apply(block_styles, axis=None, subset=list(columns))
+
+
+# Filter, sort and slice a table: rows whose `search_column` contains `search`
+# (case-insensitive) and whose largest score across `value_columns` is at least
+# `minimum`, ordered by `sort_by`. Returns the rows of page `page` (from 1) and
+# the number of matching rows.
+def query_table(frame, search='', search_column=None, value_columns=(), minimum=None,
+                sort_by=None, ascending=True, page=1, page_size=PAGE_SIZES[1]):
+    mask = np.ones(len(frame), dtype=bool)
+    if search and search_column is not None:
+        mask &= frame[search_column].astype(str).str.contains(search, case=False, regex=False).to_numpy()
+    if minimum is not None and value_columns:
+        scores = frame[list(value_columns)].to_numpy(dtype=np.float64, na_value=np.nan)
+        mask &= np.fmax.reduce(scores, axis=1, initial=-np.inf) >= minimum
+    matching = frame.iloc[np.flatnonzero(mask)] if not mask.all() else frame
+
+    if sort_by is not None:
+        matching = matching.sort_values(sort_by, ascending=ascending, kind='stable', na_position='last')
+
+    start = (page - 1) * page_size
+    return matching.iloc[start:start + page_size], len(matching)
+
+
+# Interactive table for up to thousands of rows: search, minimum-score filter,
+# sort and page controls, with only the visible page styled and sent to the
+# browser. Runs as a fragment, so using the controls reruns just the table.
+@st.fragment
+def paged_table(frame, key, label_column, value_columns, score_range=(0, 10)):
+    columns = st.columns([3, 2, 2, 1])
+    search = columns[0].text_input(f"Search {label_column.lower()}", key=f'{key}_search')
+    minimum = columns[1].slider("Minimum score", *score_range, value=score_range[0], key=f'{key}_minimum')
+    sort_by = columns[2].selectbox("Sort by", list(frame.columns), key=f'{key}_sort')
+    descending = columns[3].toggle("Descending", key=f'{key}_descending')
+
+    # A new search, filter or order starts again from the first page
+    query = (search, minimum, sort_by, descending)
+    if st.session_state.get(f'{key}_query') != query:
+        st.session_state[f'{key}_query'] = query
+        st.session_state[f'{key}_page'] = 1
+    page_size = st.session_state.get(f'{key}_page_size', PAGE_SIZES[1])
+    page = st.session_state.get(f'{key}_page', 1)
+    rows, matching = query_table(frame, search, label_column, value_columns, minimum,
+                                 sort_by, not descending, page, page_size)
+    pages = max(1, -(-matching // page_size))
+    if page > pages:
+        # Fewer pages at a larger page size
+        page = st.session_state[f'{key}_page'] = pages
+        rows, _ = query_table(frame, search, label_column, value_columns, minimum,
+                              sort_by, not descending, page, page_size)
+
+    st.dataframe(style_buckets(rows, value_columns), use_container_width=True, hide_index=True)
+    if matching > PAGE_SIZES[0]:
+        first = (page - 1) * page_size + 1
+        columns = st.columns([1, 1, 4])
+        columns[0].number_input("Page", min_value=1, max_value=pages, key=f'{key}_page')
+        columns[1].selectbox("Rows per page", PAGE_SIZES, index=1, key=f'{key}_page_size')
+        columns[2].caption(f"Rows {first:,}-{first + len(rows) - 1:,} of {matching:,}")
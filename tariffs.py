@@ -0,0 +1,76 @@
+import numpy as np
+
+# Sectors of the Trump Effect tariff views and the HS chapters each covers
+SECTOR_CHAPTERS = {
+    'Pharmaceuticals': [30],
+    'Machinery & Equipment': [84],
+    'Textiles': list(range(50, 64)),
+    'Automotive Components': [87],
+    'Renewable Energy': [85],      # generators, inverters and solar cells are in chapter 85
+}
+SECTORS = list(SECTOR_CHAPTERS)
+
+# Applied U.S. tariff (%) on each sector before any change, and the price
+# elasticity of U.S. import demand for it: the percent fall in imports per
+# percent rise in the tariff-inclusive price
+BASELINE_TARIFFS = np.array([0.0, 1.5, 10.0, 2.5, 2.0])
+ELASTICITIES = np.array([1.0, 2.5, 4.0, 3.0, 2.0])
+
+
+# (countries, sectors) block of each country's exports to the U.S. by sector
+# in US$ billions, and each country's total over all products, from a
+# trade_ingest aggregate (U.S. imports from the partner) in one year, the
+# latest by default
+def sector_exports(aggregate, countries, sectors=SECTOR_CHAPTERS, year=None):
+    imports = aggregate[aggregate['Flow'] == 'Import']
+    year = imports['Year'].max() if year is None else year
+    imports = imports[imports['Year'] == year]
+
+    # Sector of every HS chapter, -1 for chapters outside the sectors
+    chapter_sector = np.full(100, -1)
+    for position, chapters in enumerate(sectors.values()):
+        chapter_sector[chapters] = position
+    sector = chapter_sector[imports['Product'].to_numpy() // 10_000]
+    country = imports['Partner'].astype(object).map({name: i for i, name in enumerate(countries)})
+    country = country.fillna(-1).to_numpy(dtype=np.intp)
+
+    values = imports['Value'].to_numpy() / 1e9
+    inside = (sector >= 0) & (country >= 0)
+    block = np.zeros((len(countries), len(sectors)))
+    np.add.at(block, (country[inside], sector[inside]), values[inside])
+    totals = np.bincount(country[country >= 0], values[country >= 0], minlength=len(countries))
+    return block, totals
+
+
+# What-if tariffs on U.S. imports by sector. Exports respond to the change in
+# the tariff-inclusive price with constant elasticity,
+#     X' = X * ((1 + t) / (1 + t0)) ** -elasticity,
+# evaluated for every country and sector in one array expression. Everything
+# that does not depend on the tariffs is computed once here.
+class TariffSimulator:
+    def __init__(self, countries, exports, total_exports=None, baseline=BASELINE_TARIFFS, elasticities=ELASTICITIES,
+                 sectors=SECTORS):
+        self.countries = list(countries)
+        self.sectors = list(sectors)
+        self.exports = np.asarray(exports, dtype=np.float64)             # (countries, sectors), US$ bn
+        self.baseline = np.asarray(baseline, dtype=np.float64)            # (sectors,), percent
+        # Elasticities per sector, or per country and sector
+        self._exponent = -np.broadcast_to(np.asarray(elasticities, dtype=np.float64), self.exports.shape)
+        self._log_baseline = np.log1p(self.baseline / 100)
+        # All exports to the U.S., for percent changes; the sectors' sum by default
+        self.total_exports = self.exports.sum(axis=1) if total_exports is None else np.asarray(total_exports)
+
+    # (countries, sectors) change in exports to the U.S., US$ billions, with
+    # the sector tariffs set to `rates` (percent)
+    def simulate(self, rates):
+        log_change = np.log1p(np.asarray(rates, dtype=np.float64) / 100) - self._log_baseline
+        return self.exports * np.expm1(self._exponent * log_change)
+
+    # Per country: change in exports to the U.S. (US$ bn and percent) and in the
+    # U.S. goods trade balance with it (US$ bn), which moves by the opposite amount
+    def summary(self, change):
+        exports = change.sum(axis=1) + 0.0     # no '-0.00' at the baseline
+        with np.errstate(invalid='ignore', divide='ignore'):
+            percent = exports / self.total_exports * 100
+        return {country: {'exports': exports[i], 'percent': percent[i], 'us_balance': 0.0 - exports[i]}
+                for i, country in enumerate(self.countries)}
@@ -0,0 +1,34 @@
+import numpy as np
+
+from charts import WEBGL_TRACE_THRESHOLD, create_comparative_line_chart
+from panel import IndicatorPanel
+
+GDP = 'Gross domestic product, constant prices'
+
+
+def growth_panel(n_countries, years=np.arange(2015, 2025)):
+    keys = [(f'Country {i}', GDP, 'Percent change', 'Units') for i in range(n_countries)]
+    values = np.random.default_rng(0).normal(2.0, 1.0, size=(n_countries, len(years)))
+    return IndicatorPanel.from_block(keys, years, values)
+
+
+def forecasts_for(countries):
+    future = np.arange(2025, 2030)
+    return {country: (future, np.full(5, 2.0), np.full(5, 1.0), np.full(5, 3.0)) for country in countries}
+
+
+def test_crowded_forecasts_stay_on_webgl():
+    countries = [f'Country {i}' for i in range(WEBGL_TRACE_THRESHOLD + 5)]
+    fig = create_comparative_line_chart(growth_panel(len(countries)), GDP, 'Percent change',
+                                        countries=countries, forecasts=forecasts_for(countries))
+    assert {trace.type for trace in fig.data} == {'scattergl'}
+    assert not any(trace.fill == 'toself' for trace in fig.data)
+    assert len(fig.data) == 2 * len(countries)
+
+
+def test_few_countries_keep_their_bands():
+    countries = ['Country 0', 'Country 1']
+    fig = create_comparative_line_chart(growth_panel(2), GDP, 'Percent change',
+                                        countries=countries, forecasts=forecasts_for(countries))
+    assert {trace.type for trace in fig.data} == {'scatter'}
+    assert sum(trace.fill == 'toself' for trace in fig.data) == 2
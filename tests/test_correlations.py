@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import synthetic_panel
+from correlations import CORRELATION_INDICATORS, CorrelationEngine, pearson, rolling_pearson
+
+
+def test_rolling_matches_pandas():
+    rng = np.random.default_rng(3)
+    cube = rng.normal(size=(1, 50, 3)).cumsum(axis=1)
+    window = 6
+    expected = pd.DataFrame(cube[0]).rolling(window).corr().to_numpy().reshape(50, 3, 3)[window - 1:]
+    np.testing.assert_allclose(rolling_pearson(cube, window)[:, 0], expected, atol=1e-9, equal_nan=True)
+
+
+def test_full_sample_matches_pandas():
+    cube = np.random.default_rng(4).normal(size=(1, 30, 4))
+    np.testing.assert_allclose(pearson(cube)[0], pd.DataFrame(cube[0]).corr().to_numpy(), atol=1e-12)
+
+
+# A series held constant for a stretch, after large values have been slid out
+# of the running sums, must give NaN for every window inside the stretch
+# rather than a correlation of rounding noise
+@pytest.mark.parametrize('seed', range(20))
+def test_constant_windows_have_no_correlation(seed):
+    rng = np.random.default_rng(seed)
+    a = rng.normal(size=40) * rng.uniform(1, 1e4) + rng.uniform(-1e5, 1e5)
+    start = rng.integers(5, 30)
+    a[start:start + 8] = rng.uniform(-1e3, 1e3)
+    b = rng.normal(size=40)
+    window = 5
+    r = rolling_pearson(np.stack([a, b], axis=-1)[None], window)[:, 0, 0, 1]
+    constant = pd.Series(a).rolling(window).std().to_numpy()[window - 1:] == 0
+    assert constant.any()
+    assert np.isnan(r[constant]).all()
+    assert np.isfinite(r[~constant]).all()
+
+
+def assert_engines_equal(engine, fresh, windows):
+    np.testing.assert_array_equal(engine.years, fresh.years)
+    for method in ('pearson', 'spearman'):
+        np.testing.assert_allclose(engine.matrices(method), fresh.matrices(method), atol=1e-9, equal_nan=True)
+    for window in windows:
+        np.testing.assert_array_equal(engine.rolling(window)[0], fresh.rolling(window)[0])
+        np.testing.assert_allclose(engine.rolling(window)[1], fresh.rolling(window)[1], atol=1e-9, equal_nan=True)
+
+
+# Releases that revise or append years are merged into the engine's matrices
+# and running sums, and give what an engine built from scratch gives
+def test_engine_update_matches_a_rebuild():
+    panel = synthetic_panel(10, 20, 20)
+    engine = CorrelationEngine(panel)
+    windows = (5, 25)
+    for method in ('pearson', 'spearman'):
+        engine.matrices(method)
+    for window in windows:
+        engine.rolling(window)
+    rng = np.random.default_rng(1)
+    keys = [(country, subject, units, 'Units') for country in ['Denmark', 'Country 001']
+            for _, subject, units in CORRELATION_INDICATORS]
+
+    for release_years in ([2024, 2025], [2026], [2020]):
+        changed = panel.upsert(keys, release_years, rng.normal(size=(len(keys), len(release_years))))
+        assert engine.update(panel, changed)
+        assert_engines_equal(engine, CorrelationEngine(panel), windows)
+
+
+def test_engine_update_refuses_inserted_years():
+    panel = synthetic_panel(4, 20, 10)
+    engine = CorrelationEngine(panel)
+    _, subject, units = CORRELATION_INDICATORS[0]
+    changed = panel.upsert([('Denmark', subject, units, 'Units')], [int(panel.years[0]) - 1], [[1.0]])
+    assert not engine.update(panel, changed)
@@ -0,0 +1,26 @@
+import data
+from benchmarks.synthetic import synthetic_panel
+
+# Resources cached with hash_funcs=BY_TOKEN
+PER_PANEL = [data.correlation_engine, data.latest_snapshot, data.gdp_table, data.vintage_store]
+
+
+# Two panels get two resources and the same panel the same one
+def test_resources_are_cached_per_panel():
+    first, second = synthetic_panel(4, 20, 10, seed=0), synthetic_panel(4, 20, 10, seed=1)
+    for func in PER_PANEL:
+        assert func(first) is func(first)
+        assert func(first) is not func(second)
+        func.clear()
+
+
+def test_tariff_simulators_are_cached_per_trade_load():
+    data.load_trade.clear()
+    trade = data.load_trade()
+    data.load_trade.clear()
+    reloaded = data.load_trade()
+    assert trade.attrs['token'] != reloaded.attrs['token']
+    assert data.tariff_simulator(trade) is data.tariff_simulator(trade)
+    assert data.tariff_simulator(trade) is not data.tariff_simulator(reloaded)
+    data.tariff_simulator.clear()
+    data.load_trade.clear()
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from derived import DerivedEngine, FormulaRegistry
+from panel import IndicatorPanel
+
+YEARS = np.arange(2020, 2024)
+LEVEL = ('Level', 'Units')
+DOUBLE = ('Double', 'Units', 'Units')
+TRIPLE = ('Triple', 'Units', 'Units')
+OTHER = ('Other', 'Units')
+OTHER_PLUS = ('Other plus one', 'Units', 'Units')
+
+
+# Two chains: Level -> Double -> Triple (reading Double), and Other -> Other plus one
+def chained_registry():
+    registry = FormulaRegistry()
+    registry.formula(TRIPLE, [DOUBLE[:2], LEVEL])(lambda double, level: double + level)
+    registry.formula(DOUBLE, [LEVEL])(lambda level: level * 2)
+    registry.formula(OTHER_PLUS, [OTHER])(lambda other: other + 1)
+    return registry
+
+
+def base_panel():
+    keys = [(country,) + indicator + ('Units',) for country in ('Denmark', 'India') for indicator in (LEVEL, OTHER)]
+    values = np.arange(len(keys) * len(YEARS), dtype=np.float64).reshape(len(keys), len(YEARS))
+    return IndicatorPanel.from_block(keys, YEARS, values)
+
+
+def values(panel, country, indicator):
+    return panel.series(country, *indicator[:2])[1]
+
+
+def test_apply_adds_every_derived_series():
+    panel = DerivedEngine(chained_registry()).apply(base_panel())
+    level = values(panel, 'India', LEVEL)
+    np.testing.assert_array_equal(values(panel, 'India', DOUBLE), level * 2)
+    np.testing.assert_array_equal(values(panel, 'India', TRIPLE), level * 3)
+
+
+def test_apply_only_recomputes_formulas_whose_inputs_changed():
+    engine = DerivedEngine(chained_registry())
+    engine.apply(base_panel())
+    panel = base_panel()
+    panel.upsert([('India', *OTHER, 'Units')], [2023], [[100.0]])
+    engine.apply(panel)
+    assert engine.recomputed == [OTHER_PLUS[:2]]
+
+
+# A revised base series reaches formulas reading it through another formula,
+# and only the countries and formulas it feeds are evaluated
+def test_update_propagates_through_dependent_formulas():
+    engine = DerivedEngine(chained_registry())
+    panel = engine.apply(base_panel())
+    changed = panel.upsert([('India', *LEVEL, 'Units')], [2022, 2024], [[50.0, 60.0]])
+    derived = engine.update(panel, changed)
+    assert set(derived) == {('India',) + DOUBLE[:2], ('India',) + TRIPLE[:2]}
+    assert OTHER_PLUS[:2] not in engine.recomputed
+    level = values(panel, 'India', LEVEL)
+    np.testing.assert_array_equal(values(panel, 'India', TRIPLE), level * 3)
+    assert values(panel, 'India', TRIPLE)[-1] == 180.0
+    np.testing.assert_array_equal(values(panel, 'Denmark', TRIPLE), values(panel, 'Denmark', LEVEL) * 3)
+
+
+def test_update_leaves_series_from_the_source_alone():
+    panel = base_panel()
+    panel.upsert([('India', *DOUBLE)], YEARS, [np.full(len(YEARS), -1.0)])
+    engine = DerivedEngine(chained_registry())
+    panel = engine.apply(panel)
+    changed = panel.upsert([('India', *LEVEL, 'Units')], [2023], [[99.0]])
+    engine.update(panel, changed)
+    np.testing.assert_array_equal(values(panel, 'India', DOUBLE), -1.0)
+
+
+def test_cycles_are_rejected():
+    registry = FormulaRegistry()
+    registry.formula(('A', 'Units', 'Units'), [('B', 'Units')])(lambda b: b)
+    registry.formula(('B', 'Units', 'Units'), [('A', 'Units')])(lambda a: a)
+    with pytest.raises(ValueError):
+        registry.order()
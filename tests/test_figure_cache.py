@@ -0,0 +1,47 @@
+import numpy as np
+import plotly.graph_objects as go
+
+from figure_cache import FigureCache, cached_chart, chart_spec
+
+
+@cached_chart('test_line')
+def line_chart(x, y, title='Line'):
+    return go.Figure(go.Scatter(x=x, y=y), layout={'title': title})
+
+
+def test_spec_with_nan_matches_itself():
+    values = np.array([1.0, np.nan, 3.0])
+    assert chart_spec('line', y=values) == chart_spec('line', y=values.copy())
+    assert chart_spec('line', y=[float('nan')]) == chart_spec('line', y=[float('nan')])
+    assert chart_spec('line', y=np.float64('nan')) == chart_spec('line', y=float('nan'))
+
+
+def test_chart_with_gaps_hits_the_cache():
+    cache = FigureCache()
+    years = np.arange(2019, 2025)
+    balances = np.array([-20.0, np.nan, -25.0, -30.0, np.nan, -45.7])
+    for _ in range(3):
+        fig = line_chart(years, balances.copy(), cache=cache)
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['hits'] == 2
+    assert cache.stats()['entries'] == 1
+    assert fig.layout.title.text == 'Line'
+
+
+def test_different_arguments_are_different_entries():
+    cache = FigureCache()
+    line_chart([1, 2], [1.0, 2.0], cache=cache)
+    line_chart([1, 2], [1.0, 2.0], title='Other', cache=cache)
+    line_chart([1, 2], [1.0, np.nan], cache=cache)
+    assert cache.stats()['entries'] == 3
+
+
+def test_evicts_least_recently_used():
+    cache = FigureCache(max_entries=2)
+    line_chart([1], [1.0], cache=cache)
+    line_chart([2], [2.0], cache=cache)
+    line_chart([1], [1.0], cache=cache)
+    line_chart([3], [3.0], cache=cache)
+    assert cache.get_json(chart_spec('test_line', x=[1], y=[1.0], title='Line')) is not None
+    assert cache.get_json(chart_spec('test_line', x=[2], y=[2.0], title='Line')) is None
+    assert cache.stats()['evictions'] == 1
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+import forecasting
+from forecasting import MIN_OBSERVATIONS, Forecaster, fit_ar, fit_smoothing, latest_runs
+from panel import IndicatorPanel
+
+
+def trending(n_series, n_years, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.cumsum(rng.normal(1.0, 0.5, size=(n_series, n_years)), axis=1)
+
+
+@pytest.mark.parametrize('fit', [fit_ar, fit_smoothing])
+def test_both_methods_share_the_minimum_length(fit):
+    values = trending(2, MIN_OBSERVATIONS)
+    values[0, 0] = np.nan                      # one observation short
+    runs, _ = latest_runs(values)
+    mean, stderr = fit(runs)
+    assert np.isnan(mean[0]).all() and np.isnan(stderr[0]).all()
+    assert np.isfinite(mean[1]).all() and (stderr[1] > 0).all()
+
+
+def test_pool_matches_in_process_fit(monkeypatch):
+    runs, _ = latest_runs(trending(40, 20))
+    expected = Forecaster(workers=1)._fit('ar', runs)
+    monkeypatch.setattr(forecasting, 'POOL_THRESHOLD', 0)
+    monkeypatch.setattr(forecasting, 'POOL_BATCH', 16)
+    pooled = Forecaster(workers=2)._fit('ar', runs)
+    np.testing.assert_allclose(pooled[0], expected[0])
+    np.testing.assert_allclose(pooled[1], expected[1])
+
+
+def growth_panel(values, years):
+    keys = [(f'Country {i}', 'GDP', 'Percent change', 'Units') for i in range(len(values))]
+    return [key[:3] for key in keys], IndicatorPanel.from_block(keys, years, np.asarray(values, dtype=np.float64))
+
+
+# A series' fingerprint must not depend on how much NaN padding its batch
+# gave it, or asking for it next to a longer series would refit it
+def test_series_are_not_refitted_in_a_different_batch():
+    short, long = trending(2, 12)
+    short[:4] = np.nan
+    keys, panel = growth_panel([short, long], np.arange(2010, 2022))
+    forecaster = Forecaster()
+    alone = forecaster.forecast(panel, keys[:1])
+    together = forecaster.forecast(panel, keys)
+    assert forecaster.fitted == 1
+    np.testing.assert_array_equal(alone[keys[0]][1], together[keys[0]][1])
+
+
+def test_results_are_bounded():
+    keys, panel = growth_panel(trending(10, 12), np.arange(2010, 2022))
+    forecaster = Forecaster(max_results=4)
+    forecaster.forecast(panel, keys)
+    assert len(forecaster._results) == 4
+    forecaster.forecast(panel, keys[-4:])
+    assert forecaster.fitted == 0
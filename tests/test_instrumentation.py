@@ -0,0 +1,29 @@
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+import instrumentation
+
+PAGE = '../app_pages/trade_investment.py'
+
+
+# Pages rendered with instrumentation installed record one 'chart' event per
+# st.plotly_chart call, so the wrapper is what the pages actually reach
+def test_install_times_the_pages_chart_calls(monkeypatch):
+    monkeypatch.setattr(instrumentation, 'ENABLED', True)
+    monkeypatch.setattr(st, 'plotly_chart', st.plotly_chart)   # restored afterwards
+    monkeypatch.setattr(instrumentation, '_runs', {})
+    instrumentation.install()
+    assert st.plotly_chart._instrumented
+
+    at = AppTest.from_file(PAGE, default_timeout=60).run()
+    assert not at.exception
+    charts = [event for events in instrumentation._runs.values() for event in events if event['kind'] == 'chart']
+    assert len(charts) == len(at.get('plotly_chart')) > 0
+    assert all(event['bytes'] > 0 for event in charts)
+
+
+def test_install_is_a_no_op_when_disabled(monkeypatch):
+    monkeypatch.setattr(instrumentation, 'ENABLED', False)
+    original = st.plotly_chart
+    instrumentation.install()
+    assert st.plotly_chart is original
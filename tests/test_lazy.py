@@ -0,0 +1,36 @@
+import sys
+import threading
+
+from lazy import lazy_import
+
+
+# Threads touching a lazy module for the first time together all see the
+# fully imported module
+def test_first_access_from_many_threads(monkeypatch):
+    monkeypatch.delitem(sys.modules, 'plotly.colors', raising=False)
+    colors = lazy_import('plotly.colors')
+    barrier = threading.Barrier(8)
+    seen, errors = [], []
+
+    def touch():
+        barrier.wait()
+        try:
+            seen.append(colors.hex_to_rgb('#ff0000'))
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=touch) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert seen == [(255, 0, 0)] * 8
+
+
+def test_nothing_is_imported_before_first_access(monkeypatch):
+    monkeypatch.delitem(sys.modules, 'plotly.subplots', raising=False)
+    subplots = lazy_import('plotly.subplots')
+    assert 'plotly.subplots' not in sys.modules
+    assert callable(subplots.make_subplots)
+    assert 'plotly.subplots' in sys.modules
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from panel import IndicatorPanel
+
+GDP = ('Denmark', 'GDP', 'Percent change', 'Units')
+CPI = ('Denmark', 'CPI', 'Percent change', 'Units')
+YEARS = np.arange(2020, 2024)
+
+
+def small_panel():
+    return IndicatorPanel.from_block([GDP, CPI], YEARS, np.array([[1.0, 2.0, np.nan, 4.0],
+                                                                  [5.0, 6.0, 7.0, 8.0]]))
+
+
+def test_upsert_revises_in_place():
+    panel = small_panel()
+    token, revision = panel.token, panel.revision
+    changed = panel.upsert([GDP, CPI], [2022, 2023], [[3.0, np.nan], [7.0, 8.0]])
+    assert changed == [GDP[:3]]
+    assert panel.token == token and panel.revision == revision + 1
+    np.testing.assert_array_equal(panel.series(*GDP[:3])[1], [1.0, 2.0, 3.0, 4.0])
+    assert panel.version(*GDP[:3]) == panel.revision
+    assert panel.version(*CPI[:3]) < panel.revision
+
+
+def test_upsert_appends_years_and_series():
+    panel = small_panel()
+    jobs = ('India', 'Unemployment', 'Percent', 'Units')
+    changed = panel.upsert([GDP, jobs], [2024, 2025], [[5.0, 6.0], [7.0, np.nan]])
+    assert set(changed) == {GDP[:3], jobs[:3]}
+    np.testing.assert_array_equal(panel.years, np.arange(2020, 2026))
+    years, values = panel.series(*GDP[:3])
+    np.testing.assert_array_equal(values[-3:], [4.0, 5.0, 6.0])
+    years, values = panel.series(*jobs[:3])
+    assert years.tolist() == [2024] and values.tolist() == [7.0]
+    # Series the release did not touch still end in their last observed year
+    assert panel.series(*CPI[:3])[0].tolist() == [2020, 2021, 2022, 2023]
+
+
+def test_upsert_matches_a_fresh_build():
+    panel = small_panel()
+    panel.upsert([CPI], [2019, 2024], [[4.0, 9.0]])
+    fresh = IndicatorPanel.from_block([GDP, CPI], np.arange(2019, 2025),
+                                      np.array([[np.nan, 1.0, 2.0, np.nan, 4.0, np.nan],
+                                                [4.0, 5.0, 6.0, 7.0, 8.0, 9.0]]))
+    for key in (GDP[:3], CPI[:3]):
+        for ours, theirs in zip(panel.series(*key), fresh.series(*key)):
+            np.testing.assert_array_equal(ours, theirs)
+    assert panel.latest().equals(fresh.latest())
+
+
+def test_upsert_rejects_duplicate_series():
+    with pytest.raises(ValueError):
+        small_panel().upsert([GDP, GDP], [2023], [[1.0], [2.0]])
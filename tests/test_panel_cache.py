@@ -0,0 +1,36 @@
+import pandas as pd
+
+from panel_cache import cached_frame
+
+
+def test_cleanup_keeps_in_flight_and_other_caches(tmp_path):
+    source = tmp_path / 'trade.csv'
+    source.write_text('Year,Value\n2024,1.0\n')
+    cache_dir = tmp_path / 'cache'
+    cache_dir.mkdir()
+    for filename in ['trade-stale.arrow', 'trade-other.arrow.4242.tmp', 'panel-stale.arrow']:
+        (cache_dir / filename).write_bytes(b'')
+
+    frame = pd.DataFrame({'Year': [2024], 'Value': [1.0]})
+    cached_frame([str(source)], lambda: frame, cache_dir=str(cache_dir), name='trade')
+
+    left = sorted(path.name for path in cache_dir.iterdir())
+    assert 'trade-stale.arrow' not in left
+    assert 'trade-other.arrow.4242.tmp' in left
+    assert 'panel-stale.arrow' in left
+    assert len([name for name in left if name.startswith('trade-') and name.endswith('.arrow')]) == 1
+
+
+def test_second_load_is_served_from_disk(tmp_path):
+    source = tmp_path / 'trade.csv'
+    source.write_text('Year,Value\n2024,1.0\n')
+    builds = []
+
+    def build():
+        builds.append(1)
+        return pd.DataFrame({'Year': [2024], 'Value': [1.0]})
+
+    first = cached_frame([str(source)], build, cache_dir=str(tmp_path), name='trade')
+    second = cached_frame([str(source)], build, cache_dir=str(tmp_path), name='trade')
+    assert len(builds) == 1
+    pd.testing.assert_frame_equal(first, second)
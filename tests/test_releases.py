@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+import data
+from charts import create_comparative_line_chart
+
+GROWTH = ('India', 'Gross domestic product, constant prices', 'Percent change')
+CACHED = [data.load_panel, data.derived_engine, data.latest_snapshot, data.gdp_table, data.indicator_table,
+          data.correlation_engine, data.vintage_store, data.figure_cache]
+
+
+# apply_release revises the process-wide panel, so every test starts and ends
+# with nothing cached
+@pytest.fixture(autouse=True)
+def fresh_data():
+    for func in CACHED:
+        func.clear()
+    yield
+    for func in CACHED:
+        func.clear()
+
+
+def revise(key, change):
+    years, values = data.load_panel().series(*key)
+    return data.apply_release([key], years, [values + change])
+
+
+def test_release_updates_the_current_vintage():
+    panel = data.load_panel()
+    before = data.vintage_store(panel).history(*GROWTH).iloc[-1]
+    revise(GROWTH, 1.0)
+    after = data.vintage_store(panel).history(*GROWTH).iloc[-1]
+    np.testing.assert_allclose((after - before).dropna(), 1.0)
+
+
+def test_release_updates_indicator_tables():
+    panel = data.load_panel()
+    before = data.indicator_table(panel, GROWTH[1], GROWTH[2])['India'].to_numpy()
+    revise(GROWTH, 1.0)
+    after = data.indicator_table(panel, GROWTH[1], GROWTH[2])['India'].to_numpy()
+    np.testing.assert_allclose(after - before, 1.0)
+
+
+# Figures drawn from a revised series are rebuilt; the rest stay cached
+def test_release_invalidates_only_figures_of_changed_series():
+    panel = data.load_panel()
+    cache = data.figure_cache()
+    inflation = ('Inflation, average consumer prices', 'Percent change')
+    draw = lambda indicator, units: create_comparative_line_chart(panel, indicator, units, cache=cache)
+    draw(*GROWTH[1:])
+    draw(*inflation)
+    revise(GROWTH, 1.0)
+
+    hits = cache.hits
+    growth = draw(*GROWTH[1:])
+    draw(*inflation)
+    assert cache.hits == hits + 1
+    india = next(trace for trace in growth.data if trace.name == 'India')
+    np.testing.assert_allclose(np.array(india.y, dtype=np.float64), panel.series(*GROWTH)[1])
+
+
+def test_release_keeps_the_latest_snapshot_in_step():
+    panel = data.load_panel()
+    data.latest_snapshot(panel)
+    revise(GROWTH, 1.0)
+    np.testing.assert_array_equal(data.latest_snapshot(panel).to_numpy(), panel.latest().to_numpy())
@@ -0,0 +1,35 @@
+import numpy as np
+
+from tariffs import BASELINE_TARIFFS, ELASTICITIES, SECTORS, TariffSimulator, sector_exports
+from weo_sample import build_sample_trade
+
+COUNTRIES = ['India', 'Denmark']
+
+
+def simulator():
+    return TariffSimulator(COUNTRIES, *sector_exports(build_sample_trade(), COUNTRIES))
+
+
+def test_baseline_rates_change_nothing():
+    sim = simulator()
+    change = sim.simulate(BASELINE_TARIFFS)
+    assert not change.any()
+    summary = sim.summary(change)
+    assert not any(np.signbit(result['exports']) for result in summary.values())   # no '-0.00'
+
+
+def test_constant_elasticity_response():
+    sim = simulator()
+    rates = BASELINE_TARIFFS + 10
+    expected = sim.exports * (((1 + rates / 100) / (1 + BASELINE_TARIFFS / 100)) ** -ELASTICITIES - 1)
+    np.testing.assert_allclose(sim.simulate(rates), expected)
+    summary = sim.summary(sim.simulate(rates))
+    for result in summary.values():
+        assert result['exports'] < 0 and result['us_balance'] == -result['exports']
+
+
+def test_sector_exports_split_each_partners_total():
+    block, totals = sector_exports(build_sample_trade(), COUNTRIES)
+    assert block.shape == (len(COUNTRIES), len(SECTORS))
+    assert (block >= 0).all() and (block.sum(axis=1) <= totals).all()
+    assert (totals > 0).all()
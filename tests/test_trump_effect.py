@@ -0,0 +1,73 @@
+import functools
+import json
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import data
+import panel_cache
+
+PAGE = '../app_pages/trump_effect.py'
+
+
+# Trade CSV in the UN Comtrade layout: U.S. trade with Denmark and India in `years`
+def write_trade(path, years):
+    lines = ['refYear,reporterDesc,partnerDesc,flowDesc,cmdCode,primaryValue']
+    for i, year in enumerate(years):
+        for partner, exports, imports in [('India', 40e9, 85e9), ('Denmark', 5e9, 10e9)]:
+            lines.append(f'{year},USA,{partner},Export,300490,{exports + i * 1e9}')
+            lines.append(f'{year},USA,{partner},Import,300490,{imports}')
+    path.write_text('\n'.join(lines) + '\n')
+
+
+# The page drawn from trade files covering `years`, with nothing cached before or after
+@pytest.fixture
+def page_with_trade(tmp_path, monkeypatch):
+    def run(years):
+        write_trade(tmp_path / 'trade.csv', years)
+        monkeypatch.setattr(data, 'TRADE_DATA_PATH', str(tmp_path / 'trade.csv'))
+        monkeypatch.setattr(panel_cache, 'cached_frame',
+                            functools.partial(panel_cache.cached_frame, cache_dir=str(tmp_path / 'cache')))
+        clear()
+        return AppTest.from_file(PAGE, default_timeout=60).run()
+
+    def clear():
+        for func in (data.load_trade, data.load_panel, data.tariff_simulator, data.figure_cache):
+            func.clear()
+
+    yield run
+    clear()
+
+
+def test_trade_balance_follows_the_trade_years(page_with_trade):
+    at = page_with_trade([2020, 2021, 2022])
+    assert not at.exception
+    fig = json.loads(at.get('plotly_chart')[0].proto.spec)
+    assert fig['layout']['title']['text'].endswith('(2020-2022)')
+    assert (fig['layout']['shapes'][0]['x0'], fig['layout']['shapes'][0]['x1']) == (2020, 2022)
+    india = at.metric[0]
+    assert india.label == "India's Trade Balance (2022)"
+    assert india.value == '$-43.0B'
+    assert india.delta == '1.0B'
+
+
+def test_single_trade_year_has_no_delta(page_with_trade):
+    at = page_with_trade([2023])
+    assert not at.exception
+    assert at.metric[0].label == "India's Trade Balance (2023)"
+    assert not at.metric[0].delta
+
+
+# Scenario figures depend on free-form slider values, so they stay out of the
+# shared figure cache while the metrics follow the sliders
+def test_tariff_scenarios_are_not_cached():
+    data.figure_cache.clear()
+    at = AppTest.from_file(PAGE, default_timeout=60).run()
+    entries = data.figure_cache().stats()['entries']
+    exports = at.metric[2].value
+    for rate in (20.0, 35.5, 60.0):
+        at.slider(key='tariff_rate_0').set_value(rate).run()
+        assert not at.exception
+    assert data.figure_cache().stats()['entries'] == entries
+    assert at.metric[2].value != exports
+    data.figure_cache.clear()
@@ -0,0 +1,63 @@
+import numpy as np
+
+from panel import IndicatorPanel
+from vintages import VintageStore, vintage_files
+
+GDP = ('Denmark', 'GDP', 'Percent change', 'Units')
+CPI = ('Denmark', 'CPI', 'Percent change', 'Units')
+JOBS = ('India', 'Unemployment', 'Percent', 'Units')
+
+
+# Three releases: the second revises one GDP estimate and adds a year, the
+# third adds a series and drops a CPI estimate
+def releases():
+    return [
+        ('Apr 2023', IndicatorPanel.from_block([GDP, CPI], np.arange(2020, 2023),
+                                               np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]))),
+        ('Oct 2023', IndicatorPanel.from_block([GDP, CPI], np.arange(2020, 2024),
+                                               np.array([[1.0, 2.5, 3.0, 3.5], [4.0, 5.0, 6.0, 6.5]]))),
+        ('Apr 2024', IndicatorPanel.from_block([GDP, CPI, JOBS], np.arange(2020, 2024),
+                                               np.array([[1.0, 2.5, 3.0, 3.2], [4.0, 5.0, 6.0, np.nan],
+                                                         [7.0, 7.5, 8.0, 8.5]]))),
+    ]
+
+
+def filled_store():
+    store = VintageStore()
+    for name, panel in releases():
+        store.add(name, panel)
+    return store
+
+
+def test_every_vintage_is_rebuilt_exactly():
+    store = filled_store()
+    for name, panel in releases():
+        rebuilt = store.panel(name)
+        for key in (GDP, CPI, JOBS):
+            # A series a vintage did not publish has no observations in it
+            expected_years, expected_values = panel.series(*key[:3]) or ([], [])
+            years, values = rebuilt.series(*key[:3])
+            np.testing.assert_array_equal(years, expected_years)
+            np.testing.assert_array_equal(values, expected_values)
+
+
+def test_only_revised_cells_are_stored_twice():
+    store = filled_store()
+    # Apr 2023 behind Oct 2023: GDP 2021 and both series' 2023. Oct 2023
+    # behind Apr 2024: GDP 2023, CPI 2023 and the four years of JOBS.
+    assert [len(rows) for rows, _, _ in store._deltas] == [3, 6]
+
+
+def test_history_matches_each_vintage():
+    store = filled_store()
+    history = store.history(*GDP[:3])
+    assert history.index.tolist() == ['Apr 2023', 'Oct 2023', 'Apr 2024']
+    assert history[2021].tolist() == [2.0, 2.5, 2.5]
+    assert np.isnan(history.loc['Apr 2023', 2023])
+    assert store.revisions(*CPI[:3], 2023).iloc[1:].isna().tolist() == [False, True]
+
+
+def test_vintage_files_are_ordered_by_release(tmp_path):
+    for filename in ['WEOOct2023all.xls', 'WEOApr2024all.xls', 'WEOApr2023all.xls', 'custom.xls', '.hidden']:
+        (tmp_path / filename).write_text('')
+    assert [name for name, _ in vintage_files(str(tmp_path))] == ['Apr 2023', 'Oct 2023', 'Apr 2024', 'custom']
@@ -0,0 +1,187 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# Canonical column -> header names it goes by in UN Comtrade downloads and U.S.
+# Census Bureau (USA Trade Online / international trade API) files
+COLUMN_ALIASES = {
+    'Year': ['refYear', 'Year', 'YEAR', 'time', 'period', 'Period'],
+    'Reporter': ['reporterDesc', 'Reporter'],
+    'Partner': ['partnerDesc', 'CTY_NAME', 'Partner', 'Country'],
+    'Flow': ['flowDesc', 'flowCode', 'Flow', 'Trade Flow'],
+    'Product': ['cmdCode', 'E_COMMODITY', 'I_COMMODITY', 'COMMODITY', 'Commodity', 'HS6', 'Product'],
+    'Value': ['primaryValue', 'ALL_VAL_MO', 'GEN_VAL_MO', 'ALL_VAL_YR', 'GEN_VAL_YR', 'TradeValue', 'Value'],
+}
+
+# Census files hold one direction each, named by their commodity and value columns
+IMPLIED_FLOWS = {
+    'E_COMMODITY': 'Export', 'ALL_VAL_MO': 'Export', 'ALL_VAL_YR': 'Export',
+    'I_COMMODITY': 'Import', 'GEN_VAL_MO': 'Import', 'GEN_VAL_YR': 'Import',
+}
+FLOW_NAMES = {'export': 'Export', 'exports': 'Export', 'x': 'Export',
+              'import': 'Import', 'imports': 'Import', 'm': 'Import'}
+FLOWS = ['Export', 'Import']
+
+# Names the United States reports under; other reporters' rows are skipped
+US_REPORTERS = {'usa', 'us', 'united states', 'united states of america'}
+
+AGGREGATE_COLUMNS = ['Year', 'Partner', 'Flow', 'Product', 'Value']
+
+# Short names of the HS chapters (the first two digits of an HS-6 code)
+HS_CHAPTERS = {
+    1: 'Live animals', 2: 'Meat', 3: 'Fish & seafood', 4: 'Dairy, eggs & honey', 5: 'Other animal products',
+    6: 'Live plants & flowers', 7: 'Vegetables', 8: 'Fruit & nuts', 9: 'Coffee, tea & spices', 10: 'Cereals',
+    11: 'Milling products', 12: 'Oil seeds', 13: 'Gums & resins', 14: 'Vegetable plaiting materials',
+    15: 'Fats & oils', 16: 'Meat & fish preparations', 17: 'Sugar & confectionery', 18: 'Cocoa',
+    19: 'Cereal & bakery preparations', 20: 'Vegetable & fruit preparations', 21: 'Food preparations',
+    22: 'Beverages & spirits', 23: 'Food industry residues', 24: 'Tobacco', 25: 'Salt, stone & cement',
+    26: 'Ores', 27: 'Mineral fuels & oils', 28: 'Inorganic chemicals', 29: 'Organic chemicals',
+    30: 'Pharmaceutical products', 31: 'Fertilisers', 32: 'Dyes, paints & inks', 33: 'Essential oils & cosmetics',
+    34: 'Soaps & waxes', 35: 'Albumins & glues', 36: 'Explosives', 37: 'Photographic goods',
+    38: 'Miscellaneous chemicals', 39: 'Plastics', 40: 'Rubber', 41: 'Raw hides & leather',
+    42: 'Leather articles', 43: 'Furskins', 44: 'Wood', 45: 'Cork', 46: 'Basketwork', 47: 'Wood pulp',
+    48: 'Paper & paperboard', 49: 'Printed matter', 50: 'Silk', 51: 'Wool', 52: 'Cotton',
+    53: 'Other vegetable fibres', 54: 'Man-made filaments', 55: 'Man-made staple fibres', 56: 'Wadding & cordage',
+    57: 'Carpets', 58: 'Special woven fabrics', 59: 'Coated textiles', 60: 'Knitted fabrics',
+    61: 'Apparel, knitted', 62: 'Apparel, not knitted', 63: 'Other textile articles', 64: 'Footwear',
+    65: 'Headgear', 66: 'Umbrellas', 67: 'Feathers & artificial flowers', 68: 'Stone & cement articles',
+    69: 'Ceramics', 70: 'Glass', 71: 'Gems & jewellery', 72: 'Iron & steel', 73: 'Iron & steel articles',
+    74: 'Copper', 75: 'Nickel', 76: 'Aluminium', 78: 'Lead', 79: 'Zinc', 80: 'Tin', 81: 'Other base metals',
+    82: 'Tools & cutlery', 83: 'Miscellaneous metal articles', 84: 'Machinery & mechanical appliances',
+    85: 'Electrical machinery', 86: 'Railway equipment', 87: 'Vehicles & parts', 88: 'Aircraft', 89: 'Ships',
+    90: 'Optical & medical instruments', 91: 'Clocks & watches', 92: 'Musical instruments', 93: 'Arms',
+    94: 'Furniture & lighting', 95: 'Toys & sports goods', 96: 'Miscellaneous manufactures', 97: 'Works of art',
+    98: 'Special classifications', 99: 'Special classifications',
+}
+
+
+# Every CSV file at `path`: the file itself, or a folder's .csv files by name
+def trade_files(path):
+    if os.path.isdir(path):
+        return [os.path.join(path, filename) for filename in sorted(os.listdir(path))
+                if filename.lower().endswith('.csv') and not filename.startswith('.')]
+    return [path]
+
+
+# Header name of every canonical column the file has, and the flow implied by
+# its column names when it has no flow column
+def _resolve_columns(header):
+    columns = {}
+    for name, aliases in COLUMN_ALIASES.items():
+        found = [alias for alias in aliases if alias in header]
+        if found:
+            columns[name] = found[0]
+    missing = {'Year', 'Partner', 'Product', 'Value'} - set(columns)
+    if missing:
+        raise ValueError(f'Trade file has no {", ".join(sorted(missing))} column (header: {list(header)})')
+    implied = {IMPLIED_FLOWS[columns[name]] for name in ('Product', 'Value') if columns[name] in IMPLIED_FLOWS}
+    if 'Flow' not in columns and len(implied) != 1:
+        raise ValueError('Trade file has no flow column and its column names do not imply one')
+    return columns, implied.pop() if implied else None
+
+
+# Per-row values of a categorical column mapped through `func`, which is
+# applied once to the categories rather than to every row. Missing rows get `missing`.
+def _recode(column, func, missing):
+    mapped = np.append(np.asarray(func(pd.Index(column.cat.categories.astype(str)))), missing)
+    return mapped[column.cat.codes.to_numpy()]
+
+
+# HS-6 code of each product label: the first six digits of codes of six or
+# more digits (HTS-10 included); coarser or non-numeric codes (chapter
+# subtotals, 'TOTAL') are -1 so they are not counted twice
+def _hs6(labels):
+    labels = labels.str.strip()
+    valid = labels.str.fullmatch(r'\d{6,}')
+    return np.where(valid, pd.to_numeric(labels.str.slice(0, 6).where(valid, '-1')), -1).astype(np.int32)
+
+
+# Stream a bilateral trade CSV in chunks of `chunksize` rows and yield each
+# chunk summed by (Year, Partner, Flow, Product) for the United States'
+# trade with `partners` (all partners by default). Partner, flow, product and
+# year are read as categoricals and decoded once per distinct label, so only
+# one chunk of raw rows is ever held. Values are in U.S. dollars.
+def iter_trade_file(path, partners=None, chunksize=500_000):
+    header = pd.read_csv(path, nrows=0).columns
+    columns, implied_flow = _resolve_columns(header)
+    categorical = [columns[name] for name in ('Year', 'Reporter', 'Partner', 'Flow', 'Product') if name in columns]
+    reader = pd.read_csv(path, usecols=list(columns.values()), chunksize=chunksize,
+                         dtype={**{column: 'category' for column in categorical}, columns['Value']: np.float64})
+    wanted = None if partners is None else {partner.lower() for partner in partners}
+
+    for chunk in reader:
+        keep = np.ones(len(chunk), dtype=bool)
+        if 'Reporter' in columns:
+            keep &= _recode(chunk[columns['Reporter']], lambda labels: labels.str.lower().isin(US_REPORTERS), False)
+        # Census spells partners in capitals; Comtrade in title case
+        partner = _recode(chunk[columns['Partner']], lambda labels: labels.str.strip().str.title(), None)
+        if wanted is not None:
+            keep &= _recode(chunk[columns['Partner']], lambda labels: labels.str.strip().str.lower().isin(wanted), False)
+        if 'Flow' in columns:
+            flow = _recode(chunk[columns['Flow']], lambda labels: labels.str.strip().str.lower().map(FLOW_NAMES), None)
+            keep &= pd.notna(flow)
+        else:
+            flow = np.full(len(chunk), implied_flow, dtype=object)
+        # Census 'time' values are '2024-01'; monthly rows sum to the year below
+        year = _recode(chunk[columns['Year']], lambda labels: pd.to_numeric(labels.str.slice(0, 4), errors='coerce')
+                       .fillna(-1).astype(np.int16), -1)
+        product = _recode(chunk[columns['Product']], _hs6, -1)
+        value = chunk[columns['Value']].to_numpy()
+        keep &= (year >= 0) & (product >= 0) & ~np.isnan(value)
+        if not keep.any():
+            continue
+
+        frame = pd.DataFrame({'Year': year[keep], 'Partner': partner[keep], 'Flow': flow[keep],
+                              'Product': product[keep], 'Value': value[keep]})
+        yield frame.groupby(AGGREGATE_COLUMNS[:4], sort=False, as_index=False)['Value'].sum()
+
+
+# U.S. trade by year, partner, flow and HS-6 product summed over every file,
+# one chunk at a time: memory is bounded by the chunk size and the number of
+# distinct (year, partner, flow, product) cells, not by the size of the files
+def load_trade_aggregate(paths, partners=None, chunksize=500_000):
+    totals = None
+    for path in paths:
+        for partial in iter_trade_file(path, partners, chunksize):
+            totals = partial if totals is None else pd.concat([totals, partial], ignore_index=True)
+            totals = totals.groupby(AGGREGATE_COLUMNS[:4], sort=False, as_index=False)['Value'].sum()
+    if totals is None:
+        totals = pd.DataFrame({'Year': [], 'Partner': [], 'Flow': [], 'Product': [], 'Value': []})
+    return pd.DataFrame({
+        'Year': totals['Year'].to_numpy(np.int16),
+        'Partner': pd.Categorical(totals['Partner'].astype(str)),
+        'Flow': pd.Categorical(totals['Flow'].astype(str), categories=FLOWS),
+        'Product': totals['Product'].to_numpy(np.int32),
+        'Value': totals['Value'].to_numpy(np.float64),
+    }).sort_values(AGGREGATE_COLUMNS[:4], ignore_index=True)
+
+
+# Yearly U.S. goods exports to and imports from each partner in US$ billions,
+# in the (Country, Subject Descriptor, Units, Scale, values) layout of
+# weo_sample.US_TRADE_SERIES. Returns (years, series).
+def us_trade_series(aggregate, partners=None):
+    totals = aggregate.groupby(['Partner', 'Flow', 'Year'], observed=True)['Value'].sum().unstack('Year')
+    years = totals.columns.to_numpy()
+    series = []
+    for (partner, flow), values in totals.iterrows():
+        if partners is None or partner in partners:
+            subject = 'U.S. goods exports' if flow == 'Export' else 'U.S. goods imports'
+            series.append((partner, subject, 'U.S. dollars', 'Billions', (values.to_numpy() / 1e9).tolist()))
+    return years, series
+
+
+# A partner's n largest HS chapters by share (%) of one flow in one year (the
+# latest by default). U.S. imports from a partner are its exports to the U.S.
+def top_categories(aggregate, partner, flow='Import', year=None, n=5):
+    rows = aggregate[(aggregate['Partner'] == partner) & (aggregate['Flow'] == flow)]
+    if rows.empty:
+        return pd.DataFrame({'Category': pd.Series(dtype=object), 'Percentage': pd.Series(dtype=np.float64)})
+    year = rows['Year'].max() if year is None else year
+    rows = rows[rows['Year'] == year]
+    by_chapter = rows.groupby(rows['Product'].to_numpy() // 10_000)['Value'].sum()
+    top = by_chapter.nlargest(n)
+    return pd.DataFrame({
+        'Category': [HS_CHAPTERS.get(chapter, f'HS {chapter:02d}') for chapter in top.index],
+        'Percentage': (top / by_chapter.sum() * 100).round(1).to_numpy(),
+    })
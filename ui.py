@@ -0,0 +1,73 @@
+import streamlit as st
+
+# Styles shared by the dashboard and the static report
+APP_CSS = """
+<style>
+    .main-header {
+        font-size: 2.5rem;
+        font-weight: 700;
+        color: #1E3A8A;
+        text-align: center;
+        margin-bottom: 1.5rem;
+    }
+    .sub-header {
+        font-size: 1.8rem;
+        font-weight: 600;
+        color: #1E3A8A;
+        margin-top: 1rem;
+        margin-bottom: 1rem;
+    }
+    .section-header {
+        font-size: 1.5rem;
+        font-weight: 500;
+        color: #2563EB;
+        margin-top: 0.8rem;
+        margin-bottom: 0.8rem;
+    }
+    .insight-box {
+        background-color: #EFF6FF;
+        border-left: 5px solid #3B82F6;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin-bottom: 1rem;
+    }
+    .event-box {
+        background-color: #ECFDF5;
+        border-left: 5px solid #10B981;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin-bottom: 1rem;
+    }
+    .warning-box {
+        background-color: #FEF2F2;
+        border-left: 5px solid #EF4444;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin-bottom: 1rem;
+    }
+    .guide-text {
+        color: #4B5563;
+        font-style: italic;
+        font-size: 0.9rem;
+    }
+</style>
+"""
+
+APP_TITLE_HTML = '<div class="main-header">Denmark-India Macroeconomic Dashboard (2014-2024)</div>'
+
+APP_INTRO = """
+This dashboard provides a comprehensive analysis of macroeconomic indicators for Denmark and India from 2014 to 2024.
+It allows for comparative analysis of economic growth, inflation, unemployment, government finances, and trade patterns.
+"""
+
+# Helper function to render a titled list of insights
+def create_insight_box(title, insights):
+    with st.container():
+        st.markdown(f"""
+        <div style="background-color:#f8f9fa; padding:15px; border-radius:5px; border-left:5px solid #3B82F6;">
+            <h4 style="color:#1e3a8a;">{title}</h4>
+            <ul style="margin-bottom:0;">
+                {"".join([f"<li>{insight}</li>" for insight in insights])}
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,132 @@
+import itertools
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from panel import DIMENSIONS, IndicatorPanel, record_reads
+
+# Source of VintageStore tokens
+_tokens = itertools.count()
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+VINTAGE_FILE = re.compile(r'WEO(' + '|'.join(MONTHS) + r')(\d{4})', re.IGNORECASE)
+
+
+# (vintage name, path) of every WEO export in a directory, oldest release first.
+# Files named like the IMF's downloads (WEOApr2024all.xls) are called
+# 'Apr 2024' and ordered by release date; any others follow by file name.
+def vintage_files(directory):
+    found = []
+    for filename in sorted(os.listdir(directory)):
+        path = os.path.join(directory, filename)
+        if filename.startswith('.') or not os.path.isfile(path):
+            continue
+        match = VINTAGE_FILE.search(filename)
+        if match:
+            month = MONTHS.index(match.group(1).capitalize())
+            found.append(((int(match.group(2)), month, ''), f'{MONTHS[month]} {match.group(2)}', path))
+        else:
+            found.append(((np.iinfo(np.int32).max, 0, filename), os.path.splitext(filename)[0], path))
+    return [(name, path) for _, name, path in sorted(found)]
+
+
+# Successive WEO releases (vintages) of the indicator panel. The newest vintage
+# is held as one dense (series, years) block; every older one only as the cells
+# that differ from the vintage after it (reverse delta encoding), so values a
+# release did not revise are stored once however many vintages repeat them.
+# Reading the newest vintage is free and older ones are rebuilt by applying
+# the deltas backwards. Series and years are the union over all vintages; a
+# cell a vintage did not publish is NaN.
+class VintageStore:
+    def __init__(self):
+        self.names = []
+        self.keys = []             # (Country, Subject Descriptor, Units, Scale) per row
+        self._rows = {}            # (Country, Subject Descriptor, Units) -> row
+        self.years = np.empty(0, dtype=np.int16)
+        self.latest = np.empty((0, 0))
+        self._deltas = []          # per older vintage: (rows, years, values) sorted by row, then year
+        self.token = (next(_tokens), 0)  # changes with every added vintage, keys figures drawn from it
+
+    # Re-lay the newest block on `years` with room for `n_rows` series
+    def _expand(self, n_rows, years):
+        if n_rows == self.latest.shape[0] and len(years) == len(self.years):
+            return
+        block = np.full((n_rows, len(years)), np.nan)
+        block[:self.latest.shape[0], np.searchsorted(years, self.years)] = self.latest
+        self.latest, self.years = block, years
+
+    # Add a release newer than every vintage already held
+    def add(self, name, panel):
+        if name in self.names:
+            raise ValueError(f'Vintage {name!r} is already stored')
+        keys = list(zip(*(panel.labels(dim).tolist() for dim in DIMENSIONS)))
+        for key in keys:
+            if key[:3] not in self._rows:
+                self._rows[key[:3]] = len(self.keys)
+                self.keys.append(key)
+        self._expand(len(self.keys), np.union1d(self.years, panel.years).astype(np.int16))
+
+        new = np.full_like(self.latest, np.nan)
+        rows = np.array([self._rows[key[:3]] for key in keys], dtype=np.intp)
+        new[np.ix_(rows, np.searchsorted(self.years, panel.years))] = panel.values
+
+        if self.names:
+            # What the previous vintage held where the new one differs
+            differs = (new != self.latest) & ~(np.isnan(new) & np.isnan(self.latest))
+            delta_rows, columns = np.nonzero(differs)
+            self._deltas.append((delta_rows.astype(np.int32), self.years[columns], self.latest[delta_rows, columns]))
+        self.latest = new
+        self.names.append(name)
+        self.token = (self.token[0], len(self.names))
+
+    # Dense (series, years) block of one vintage
+    def values(self, name):
+        position = self.names.index(name)
+        block = self.latest.copy()
+        for rows, years, values in reversed(self._deltas[position:]):
+            block[rows, np.searchsorted(self.years, years)] = values
+        return block
+
+    # One vintage as an IndicatorPanel
+    def panel(self, name):
+        return IndicatorPanel.from_block(self.keys, self.years, self.values(name))
+
+    # Every vintage of one series: a frame indexed by vintage name with one
+    # column per year, NaN where a vintage did not publish that year. Only the
+    # delta entries of that series are touched.
+    def history(self, country, subject, units):
+        row = self._rows.get((country, subject, units))
+        if row is None:
+            return pd.DataFrame(index=pd.Index(self.names, name='Vintage'), columns=self.years, dtype=np.float64)
+        record_reads(self.token, [(country, subject, units)])
+        values = np.empty((len(self.names), len(self.years)))
+        current = self.latest[row].copy()
+        values[-1] = current
+        for position in range(len(self._deltas) - 1, -1, -1):
+            rows, years, deltas = self._deltas[position]
+            span = slice(*np.searchsorted(rows, [row, row + 1]))
+            current[np.searchsorted(self.years, years[span])] = deltas[span]
+            values[position] = current
+        return pd.DataFrame(values, index=pd.Index(self.names, name='Vintage'), columns=self.years)
+
+    # Estimate of one year of a series in every vintage
+    def revisions(self, country, subject, units, year):
+        history = self.history(country, subject, units)
+        return history[year] if year in history.columns else pd.Series(np.nan, index=history.index)
+
+    # (Subject Descriptor, Units) pairs held for a country, in storage order
+    def indicators(self, country):
+        return [key[1:3] for key in self.keys if key[0] == country]
+
+    # Bytes held: the newest block plus every delta
+    @property
+    def nbytes(self):
+        return self.latest.nbytes + self.years.nbytes + sum(
+            rows.nbytes + years.nbytes + values.nbytes for rows, years, values in self._deltas)
+
+    def __repr__(self):
+        changed = sum(len(rows) for rows, _, _ in self._deltas)
+        return (f'<VintageStore: {len(self.names)} vintages, {len(self.keys)} series x {len(self.years)} years, '
+                f'{changed} revised cells, {self.nbytes / 1e6:.2f} MB>')
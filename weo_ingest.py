@@ -0,0 +1,91 @@
+import codecs
+
+import numpy as np
+import pandas as pd
+
+from panel import COLUMNS, DIMENSIONS, IndicatorPanel
+
+# Placeholders the WEO export uses for missing observations
+MISSING_VALUES = ['--', 'n/a', 'NA', '']
+ESTIMATES_COLUMN = 'Estimates Start After'
+
+
+# WEO exports are tab-delimited text despite the .xls name. Recent releases are
+# UTF-16 with a byte-order mark, older ones are Latin-1.
+def _sniff_encoding(path):
+    with open(path, 'rb') as f:
+        head = f.read(4)
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    return 'latin-1'
+
+
+# Turn a 2-D block of WEO value strings ("1,234.567", NaN) into float64
+def _to_float(block):
+    flat = pd.Series(block.ravel(), dtype=object).str.replace(',', '', regex=False)
+    return pd.to_numeric(flat, errors='coerce').to_numpy(np.float64).reshape(block.shape)
+
+
+# Row mask for the requested subjects. Each entry is either a Subject Descriptor
+# (any units) or a (Subject Descriptor, Units, ...) tuple.
+def _subject_mask(chunk, subjects):
+    names = {s for s in subjects if isinstance(s, str)}
+    pairs = {'\t'.join(s[:2]) for s in subjects if not isinstance(s, str)}
+    mask = chunk['Subject Descriptor'].isin(names)
+    if pairs:
+        mask |= (chunk['Subject Descriptor'] + '\t' + chunk['Units']).isin(pairs)
+    return mask
+
+
+# Stream a WEO export in chunks of `chunksize` rows, yielding one long-format
+# frame (COLUMNS plus 'Estimates Start After') per chunk for the requested
+# subjects and countries. Only one chunk of raw text is held at a time.
+def iter_weo_export(path, subjects=None, countries=None, chunksize=1000, encoding=None):
+    encoding = encoding or _sniff_encoding(path)
+    header = pd.read_csv(path, sep='\t', nrows=0, encoding=encoding).columns
+    header = [column.strip() for column in header]
+    year_columns = [column for column in header if column.isdigit()]
+    usecols = [column for column in header if column in DIMENSIONS or column == ESTIMATES_COLUMN] + year_columns
+    years = np.array(year_columns, dtype=np.int16)
+
+    reader = pd.read_csv(
+        path, sep='\t', header=0, names=header, usecols=usecols, dtype=str, encoding=encoding,
+        na_values=MISSING_VALUES, keep_default_na=False, chunksize=chunksize,
+    )
+    for chunk in reader:
+        # The file ends with a one-cell source note; it has no subject
+        chunk = chunk[chunk['Subject Descriptor'].notna()]
+        for dim in DIMENSIONS:
+            chunk[dim] = chunk[dim].str.strip()
+        chunk['Scale'] = chunk['Scale'].fillna('Units')
+        if subjects is not None:
+            chunk = chunk[_subject_mask(chunk, subjects)]
+        if countries is not None:
+            chunk = chunk[chunk['Country'].isin(countries)]
+        if chunk.empty:
+            continue
+
+        values = _to_float(chunk[year_columns].to_numpy())
+        row, column = np.nonzero(~np.isnan(values))
+        frame = {dim: chunk[dim].to_numpy()[row] for dim in DIMENSIONS}
+        frame['Year'] = years[column]
+        frame['Value'] = values[row, column]
+        if ESTIMATES_COLUMN in chunk:
+            estimates = pd.to_numeric(chunk[ESTIMATES_COLUMN], errors='coerce').to_numpy()
+            frame[ESTIMATES_COLUMN] = pd.array(estimates[row], dtype='Int16')
+        yield pd.DataFrame(frame)
+
+
+# Read the requested part of a WEO export into one long-format frame
+def read_weo_export(path, subjects=None, countries=None, chunksize=1000, encoding=None):
+    frames = list(iter_weo_export(path, subjects, countries, chunksize, encoding))
+    if not frames:
+        return pd.DataFrame(columns=COLUMNS + [ESTIMATES_COLUMN])
+    return pd.concat(frames, ignore_index=True)
+
+
+# Read the requested part of a WEO export straight into an IndicatorPanel
+def load_weo_panel(path, subjects=None, countries=None, chunksize=1000, encoding=None):
+    return IndicatorPanel.from_frame(read_weo_export(path, subjects, countries, chunksize, encoding))
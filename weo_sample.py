@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+
+from panel import IndicatorPanel
+
+# Hand-typed values from the IMF WEO tables for Denmark and India (2014-2024)
+YEARS = list(range(2014, 2025))
+
+# (Country, Subject Descriptor, Units, Scale, values for YEARS)
+SERIES = [
+    ('Denmark', 'Gross domestic product, constant prices', 'Percent change', 'Units',
+     [1.278, 2.101, 3.076, 3.056, 1.859, 1.713, -1.781, 7.38, 1.541, 2.495, 1.943]),
+    ('India', 'Gross domestic product, constant prices', 'Percent change', 'Units',
+     [7.41, 7.996, 8.256, 6.795, 6.454, 3.871, -5.778, 9.69, 6.987, 8.153, 7.021]),
+    # Values in billions
+    ('Denmark', 'Gross domestic product, current prices', 'National currency', 'Billions',
+     [1980.26, 2030.21, 2101.52, 2189.59, 2243.54, 2303.64, 2326.59, 2567.52, 2844.23, 2804.74, 2842.10]),
+    ('India', 'Gross domestic product, current prices', 'National currency', 'Billions',
+     [124679.60, 137718.70, 153916.70, 170900.40, 188996.70, 201035.90, 198541.00, 235974.00, 269496.50, 295356.70, 325061.42]),
+    ('Denmark', 'Gross domestic product, current prices', 'U.S. dollars', 'Billions',
+     [352.833, 301.759, 312.182, 331.611, 355.293, 345.402, 355.631, 408.378, 401.946, 407.092, 412.293]),
+    ('India', 'Gross domestic product, current prices', 'U.S. dollars', 'Billions',
+     [2039.13, 2103.59, 2294.80, 2651.47, 2702.93, 2835.61, 2674.85, 3167.27, 3353.47, 3567.55, 3889.13]),
+    ('Denmark', 'Gross domestic product per capita, constant prices', 'National currency', 'Units',
+     [374624.48, 380301.84, 388733.56, 397719.93, 402840.94, 407986.04, 399569.76, 427787.80, 431911.90, 438269.28, 445353.98]),
+    ('India', 'Gross domestic product per capita, constant prices', 'National currency', 'Units',
+     [80533.17, 85945.86, 91945.73, 97065.59, 102212.39, 105086.50, 98073.59, 106722.34, 113404.84, 121667.25, 129026.52]),
+    ('Denmark', 'Inflation, average consumer prices', 'Percent change', 'Units',
+     [0.352, 0.226, 0.017, 1.058, 0.709, 0.729, 0.333, 1.944, 8.534, 3.353, 1.8]),
+    ('India', 'Inflation, average consumer prices', 'Percent change', 'Units',
+     [5.833, 4.908, 4.525, 3.587, 3.414, 4.769, 6.165, 5.506, 6.653, 5.361, 4.374]),
+    ('Denmark', 'Gross domestic product, deflator', 'Index', 'Units',
+     [93.936, 94.323, 94.723, 95.766, 96.335, 97.249, 100, 102.771, 112.119, 107.871, 107.224]),
+    ('India', 'Gross domestic product, deflator', 'Index', 'Units',
+     [118.43, 121.13, 125.052, 130.016, 135.066, 138.315, 144.975, 157.087, 167.687, 169.924, 174.745]),
+    ('Denmark', 'Unemployment rate', 'Percent of total labor force', 'Units',
+     [4.992, 4.542, 4.125, 4.2, 3.85, 3.658, 4.65, 3.608, 2.517, 2.783, 2.9]),
+    ('India', 'Unemployment rate', 'Percent of total labor force', 'Units',
+     [5.44, 5.44, 5.42, 5.36, 5.33, 5.27, 8.00, 5.98, 7.33, 8.00, 7.80]),
+    ('Denmark', 'Volume of exports of goods and services', 'Percent change', 'Units',
+     [3.019, 3.232, 3.662, 4.806, 3.404, 4.417, -6.36, 8.815, 7.19, 10.447, 6.9]),
+    ('India', 'Volume of exports of goods and services', 'Percent change', 'Units',
+     [4.276, -5.03, 6.677, 10.168, 4.899, -2.142, -6.511, 19.732, 9.679, 0.381, 3.5]),
+    ('Denmark', 'Volume of imports of goods and services', 'Percent change', 'Units',
+     [4.068, 4.063, 4.286, 4.322, 5.705, 3.053, -3.954, 9.493, 4.395, 3.757, 3.42]),
+    ('India', 'Volume of imports of goods and services', 'Percent change', 'Units',
+     [6.111, 1.18, 4.521, 13.36, 3.933, -3.735, -13.702, 19.371, 9.944, -1.201, 4.416]),
+    ('Denmark', 'General government net lending/borrowing', 'Percent of GDP', 'Units',
+     [1.428, -0.895, 0.302, 1.689, 0.81, 4.283, 0.363, 4.098, 3.444, 3.306, 1.793]),
+    ('India', 'General government net lending/borrowing', 'Percent of GDP', 'Units',
+     [-7.071, -7.205, -7.12, -6.227, -6.376, -7.694, -12.864, -9.268, -9.195, -8.32, -7.782]),
+    ('Denmark', 'General government gross debt', 'Percent of GDP', 'Units',
+     [877.067, 809.934, 783.958, 787.127, 766.125, 778.438, 981.155, 918.686, 844.683, 831.959, 800.989]),
+    ('India', 'General government gross debt', 'Percent of GDP', 'Units',
+     [83662.56, 95092.82, 106114.93, 119065.25, 133039.21, 150858.14, 175563.07, 197006.52, 220134.08, 245206.57, 270010.00]),
+    ('Denmark', 'Total investment', 'Percent of GDP', 'Units',
+     [20.148, 20.544, 21.681, 21.957, 22.532, 21.886, 22.763, 23.602, 24.694, 22.827, 21.931]),
+    ('India', 'Total investment', 'Percent of GDP', 'Units',
+     [34.268, 32.117, 30.172, 30.982, 32.343, 30.096, 28.922, 32.116, 33.024, 33.32, 33.676]),
+    ('Denmark', 'Gross national savings', 'Percent of GDP', 'Units',
+     [28.55, 28.5, 28.768, 29.28, 28.839, 29.332, 29.989, 32.28, 36.352, 32.662, 30.976]),
+    ('India', 'Gross national savings', 'Percent of GDP', 'Units',
+     [32.954, 31.067, 29.547, 29.147, 30.228, 29.23, 29.82, 30.894, 31.026, 32.669, 32.53]),
+    ('India', 'Population', 'Persons', 'Millions',
+     [1307.25, 1322.87, 1338.64, 1354.20, 1369.00, 1383.11, 1396.39, 1407.56, 1417.17, 1428.63, 1441.72]),
+    ('Denmark', 'Population', 'Persons', 'Millions',
+     [5.627, 5.66, 5.707, 5.749, 5.781, 5.806, 5.823, 5.84, 5.873, 5.933, 5.952]),
+]
+
+# (Subject Descriptor, Units, Scale) of every series the dashboard reads, in table order
+SUBJECTS = list(dict.fromkeys(series[1:4] for series in SERIES))
+
+
+# U.S. goods trade with each country from the U.S. Census Bureau (not a WEO
+# series, so it is added to whichever panel the dashboard loads)
+US_TRADE_YEARS = list(range(2019, 2025))
+
+# (Country, Subject Descriptor, Units, Scale, values for US_TRADE_YEARS)
+US_TRADE_SERIES = [
+    ('India', 'U.S. goods exports', 'U.S. dollars', 'Billions',
+     [34.2228, 27.0817, 39.8174, 46.9482, 40.3749, 41.7527]),
+    ('India', 'U.S. goods imports', 'U.S. dollars', 'Billions',
+     [57.8790, 51.2546, 73.3082, 85.5252, 83.6861, 87.4164]),
+    ('Denmark', 'U.S. goods exports', 'U.S. dollars', 'Billions',
+     [3.1952, 2.9416, 3.5402, 4.5958, 5.2225, 5.8078]),
+    ('Denmark', 'U.S. goods imports', 'U.S. dollars', 'Billions',
+     [11.0070, 11.6261, 12.1097, 12.9662, 11.6150, 10.0404]),
+]
+
+
+# Build the sample panel in one pass from the table above
+def build_sample_panel():
+    keys = [series[:4] for series in SERIES]
+    values = np.array([series[4] for series in SERIES], dtype=np.float64)
+    return IndicatorPanel.from_block(keys, YEARS, values)
+
+
+# Make-up of U.S. goods imports from each country (its exports to the U.S.) in
+# the last year of US_TRADE_YEARS: HS chapter -> percent of the total. The
+# remainder is spread evenly over OTHER_CHAPTERS.
+US_IMPORT_SHARES = {
+    'India': {62: 11.6, 84: 10.3, 85: 5.3, 71: 4.7, 30: 3.9},
+    'Denmark': {30: 28.7, 84: 21.3, 85: 15.5, 90: 8.4, 4: 7.2},
+}
+OTHER_CHAPTERS = [3, 9, 16, 21, 22, 27, 29, 33, 39, 40, 42, 44, 48, 52, 63, 64, 73, 87, 94, 95]
+
+
+# Sample U.S. trade aggregate in the layout of trade_ingest.load_trade_aggregate
+# (values in U.S. dollars, one product per HS chapter), built from the shares above
+def build_sample_trade():
+    year = US_TRADE_YEARS[-1]
+    totals = {series[0]: series[4][-1] * 1e9 for series in US_TRADE_SERIES if series[1] == 'U.S. goods imports'}
+    rows = []
+    for partner, shares in US_IMPORT_SHARES.items():
+        other = (100 - sum(shares.values())) / len(OTHER_CHAPTERS)
+        shares = {**shares, **{chapter: other for chapter in OTHER_CHAPTERS if chapter not in shares}}
+        rows += [(year, partner, 'Import', chapter * 10_000, share / 100 * totals[partner])
+                 for chapter, share in shares.items()]
+    frame = pd.DataFrame(rows, columns=['Year', 'Partner', 'Flow', 'Product', 'Value'])
+    return frame.astype({'Year': np.int16, 'Partner': 'category', 'Flow': 'category', 'Product': np.int32})
+
+
+# Panel with the U.S. trade series it lacks added on its own year axis; years
+# outside the axis are dropped and axis years without trade data are NaN.
+# `series` and `years` default to the sample values above.
+def add_us_trade_series(panel, series=US_TRADE_SERIES, years=US_TRADE_YEARS):
+    missing = [entry for entry in series if panel.series(*entry[:3]) is None]
+    if not missing:
+        return panel
+    years = np.asarray(years)
+    columns = np.searchsorted(panel.years, years)
+    inside = (columns < panel.n_years) & (panel.years[np.minimum(columns, panel.n_years - 1)] == years)
+    values = np.full((len(missing), panel.n_years), np.nan)
+    values[:, columns[inside]] = np.array([entry[4] for entry in missing])[:, inside]
+    return panel.extend([entry[:4] for entry in missing], values)